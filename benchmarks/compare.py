@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .run import DEFAULT_OUTPUT
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def flatten(results: dict) -> dict[str, float]:
+    """Flatten nested benchmark results into a dict of metric name to value.
+
+    Parameters
+    ----------
+    results : dict
+        Nested results, from the results key of the output of benchmarks.run.
+
+    Returns
+    -------
+    dict[str, float]
+        Value of each metric, keyed by the path to the metric joined with "/", for
+        example model.6k.en.crfsuite/parse_ingredient/latency_ms/p99.
+    """
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            for subkey, subvalue in flatten(value).items():
+                flat[f"{key}/{subkey}"] = subvalue
+        else:
+            flat[key] = value
+    return flat
+
+
+def is_regression(metric: str, baseline: float, current: float, tolerance: float):
+    """Return True if a metric is worse than the baseline by more than tolerance.
+
+    Higher throughput is better. For all other metrics, lower is better.
+
+    Parameters
+    ----------
+    metric : str
+        Name of metric.
+    baseline : float
+        Baseline value.
+    current : float
+        Current value.
+    tolerance : float
+        Allowed fractional change, for example 0.1 for 10%.
+
+    Returns
+    -------
+    bool
+    """
+    if metric.endswith("throughput"):
+        return current < baseline * (1 - tolerance)
+    return current > baseline * (1 + tolerance)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare benchmark results against a baseline and report \
+                    regressions."
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Path to baseline results",
+        type=Path,
+        default=DEFAULT_BASELINE,
+    )
+    parser.add_argument(
+        "--results",
+        help="Path to results to compare",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+    )
+    parser.add_argument(
+        "--tolerance",
+        help="Allowed fractional change before a metric is a regression",
+        type=float,
+        default=0.1,
+    )
+    parser.add_argument(
+        "--import-budget",
+        help="Maximum cold start import time, in seconds, for any model",
+        type=float,
+    )
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.results, encoding="utf-8") as f:
+        results = json.load(f)
+
+    if baseline["sentences"] != results["sentences"]:
+        print(
+            "Warning: baseline and results used different numbers of sentences "
+            f"({baseline['sentences']} and {results['sentences']})"
+        )
+
+    baseline_metrics = flatten(baseline["results"])
+    current_metrics = flatten(results["results"])
+
+    regressions = 0
+    for metric, current in current_metrics.items():
+        if metric not in baseline_metrics:
+            continue
+
+        previous = baseline_metrics[metric]
+        change = (current - previous) / previous if previous else 0
+        flag = ""
+        if is_regression(metric, previous, current, args.tolerance):
+            flag = "REGRESSION"
+            regressions += 1
+        print(f"{metric:<70} {previous:>12.4f} {current:>12.4f} {change:>+8.1%} {flag}")
+
+    if args.import_budget is not None:
+        for metric, current in current_metrics.items():
+            if metric.endswith("cold_start/import") and current > args.import_budget:
+                print(
+                    f"{metric} of {current:.4f}s is over the import budget of "
+                    f"{args.import_budget:.4f}s"
+                )
+                regressions += 1
+
+    print()
+    print(f"{regressions} regressions with tolerance of {args.tolerance:.0%}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import csv
+from pathlib import Path
+
+DATA = Path(__file__).parents[1] / "train" / "data"
+
+# Corpora of ingredient sentences, from the training data
+CORPORA = {
+    "bbc": DATA / "bbc" / "bbc-ingredients-snapshot-2017.csv",
+    "cookstr": DATA / "cookstr" / "cookstr-ingredients-snapshot-2017.csv",
+}
+
+
+def load_sentences(path: Path, count: int) -> list[str]:
+    """Load ingredient sentences from the input column of a training data csv.
+
+    Parameters
+    ----------
+    path : Path
+        Path to csv file.
+    count : int
+        Maximum number of sentences to load.
+
+    Returns
+    -------
+    list[str]
+        List of sentences.
+    """
+    with open(path, encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        return [row["input"] for _, row in zip(range(count), reader)]
+
+
+def load_corpora(corpora: list[str], count: int) -> list[str]:
+    """Load ingredient sentences from each corpus.
+
+    Parameters
+    ----------
+    corpora : list[str]
+        Names of corpora, from CORPORA.
+    count : int
+        Maximum number of sentences to load from each corpus.
+
+    Returns
+    -------
+    list[str]
+        List of sentences, in the order of corpora.
+    """
+    sentences = []
+    for corpus in corpora:
+        sentences.extend(load_sentences(CORPORA[corpus], count))
+    return sentences
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .corpus import CORPORA, load_corpora
+
+# Models shipped with ingredient_parser. This is not imported from the package so
+# that importing this module does not import ingredient_parser, which would affect
+# the cold start measurements.
+SHIPPED_MODELS = (
+    "model.6k.en.crfsuite",
+    "model.15k.en.crfsuite",
+    "model.original.en.crfsuite",
+)
+FUNCTIONS = ("parse_ingredient", "inspect_parser", "parse_multiple_ingredients")
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results.json"
+
+COLD_START = """
+import json, sys, time
+start = time.perf_counter()
+import ingredient_parser
+imported = time.perf_counter()
+ingredient_parser.parse_ingredient(sys.argv[1], model=sys.argv[2])
+parsed = time.perf_counter()
+print(json.dumps({"import": imported - start, "first_parse": parsed - imported}))
+"""
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process and its children.
+
+    Returns
+    -------
+    float
+        Peak resident set size, in MB.
+    """
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / 1024**2
+    return peak / 1024
+
+
+def percentiles(latencies: list[float]) -> dict[str, float]:
+    """Return summary statistics of latencies.
+
+    Parameters
+    ----------
+    latencies : list[float]
+        Latency of each call, in seconds.
+
+    Returns
+    -------
+    dict[str, float]
+        Mean, p50, p90, p99 and max latency, in milliseconds.
+    """
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "mean": statistics.fmean(latencies) * 1000,
+        "p50": cuts[49] * 1000,
+        "p90": cuts[89] * 1000,
+        "p99": cuts[98] * 1000,
+        "max": max(latencies) * 1000,
+    }
+
+
+def cold_start(sentence: str, model: str, repeats: int) -> dict[str, float]:
+    """Measure the time to import the package and parse the first sentence.
+
+    Each measurement is made in a new interpreter and the fastest is returned.
+
+    Parameters
+    ----------
+    sentence : str
+        Sentence to parse.
+    model : str
+        Model to parse sentence with.
+    repeats : int
+        Number of measurements.
+
+    Returns
+    -------
+    dict[str, float]
+        Import and first parse times, in seconds.
+    """
+    runs = []
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-c", COLD_START, sentence, model],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(result.stdout.splitlines()[-1]))
+
+    return {
+        "import": min(run["import"] for run in runs),
+        "first_parse": min(run["first_parse"] for run in runs),
+    }
+
+
+def measure(function: str, model: str, sentences: list[str], workers: int) -> dict:
+    """Measure the latency and throughput of a function for one model.
+
+    This is run in a separate process for each function and model, so that the peak
+    resident set size only includes that function and model.
+
+    Parameters
+    ----------
+    function : str
+        Name of function to measure, from FUNCTIONS.
+    model : str
+        Model to use.
+    sentences : list[str]
+        Sentences to parse.
+    workers : int
+        Number of worker processes for parse_multiple_ingredients.
+
+    Returns
+    -------
+    dict
+        Measurements.
+    """
+    import ingredient_parser
+
+    # Load everything up front so it is not included in the measurements
+    ingredient_parser.warmup(model=model)
+
+    if function == "parse_multiple_ingredients":
+        start = time.perf_counter()
+        ingredient_parser.parse_multiple_ingredients(
+            sentences, model=model, workers=workers
+        )
+        elapsed = time.perf_counter() - start
+        return {
+            "throughput": len(sentences) / elapsed,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+    func = getattr(ingredient_parser, function)
+    latencies = []
+    for sentence in sentences:
+        start = time.perf_counter()
+        func(sentence, model=model)
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        "latency_ms": percentiles(latencies),
+        "throughput": len(latencies) / sum(latencies),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_measure(args: argparse.Namespace, function: str, model: str) -> dict:
+    """Run measure in a new process.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Command line arguments.
+    function : str
+        Name of function to measure.
+    model : str
+        Model to use.
+
+    Returns
+    -------
+    dict
+        Measurements.
+    """
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.run",
+        "--measure",
+        function,
+        "--models",
+        model,
+        "--corpora",
+        *args.corpora,
+        "--sentences",
+        str(args.sentences),
+        "--workers",
+        str(args.workers),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark ingredient_parser on the bbc and cookstr corpora."
+    )
+    parser.add_argument(
+        "--corpora",
+        help="Corpora to load sentences from",
+        choices=list(CORPORA),
+        nargs="+",
+        default=list(CORPORA),
+    )
+    parser.add_argument(
+        "--sentences",
+        help="Number of sentences to load from each corpus",
+        type=int,
+        default=1000,
+    )
+    parser.add_argument(
+        "--models",
+        help="Models to benchmark",
+        nargs="+",
+        default=list(SHIPPED_MODELS),
+    )
+    parser.add_argument(
+        "--functions",
+        help="Functions to benchmark",
+        choices=FUNCTIONS,
+        nargs="+",
+        default=list(FUNCTIONS),
+    )
+    parser.add_argument(
+        "--workers",
+        help="Number of worker processes for parse_multiple_ingredients",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--repeats",
+        help="Number of cold start measurements, the fastest of which is kept",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--output",
+        help="Path to write results to",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+    )
+    parser.add_argument("--measure", help=argparse.SUPPRESS, choices=FUNCTIONS)
+    args = parser.parse_args()
+
+    sentences = load_corpora(args.corpora, args.sentences)
+
+    if args.measure:
+        # Run by run_measure in a new process
+        result = measure(args.measure, args.models[0], sentences, args.workers)
+        print(json.dumps(result))
+        sys.exit()
+
+    from ingredient_parser import __version__
+
+    results = {}
+    for model in args.models:
+        print(f"Benchmarking {model}")
+        results[model] = {"cold_start": cold_start(sentences[0], model, args.repeats)}
+        for function in args.functions:
+            print(f"\t{function}")
+            results[model][function] = run_measure(args, function, model)
+
+    output = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpora": args.corpora,
+        "sentences": len(sentences),
+        "workers": args.workers,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2)
+
+    print(f"Results written to {args.output}")
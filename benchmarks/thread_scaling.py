@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ingredient_parser import parse_ingredient, warmup
+
+from .corpus import CORPORA, load_corpora
+
+
+def parse_chunk(sentences: list[str]) -> int:
+    """Parse each sentence in a chunk.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        Sentences to parse.
+
+    Returns
+    -------
+    int
+        Number of sentences parsed.
+    """
+    for sentence in sentences:
+        parse_ingredient(sentence)
+    return len(sentences)
+
+
+def throughput(sentences: list[str], threads: int) -> float:
+    """Parse all sentences, split evenly between threads.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        Sentences to parse.
+    threads : int
+        Number of threads.
+
+    Returns
+    -------
+    float
+        Sentences parsed per second.
+    """
+    chunks = [sentences[i::threads] for i in range(threads)]
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        parsed = sum(executor.map(parse_chunk, chunks))
+        elapsed = time.perf_counter() - start
+    return parsed / elapsed
+
+
+def gil_enabled() -> bool:
+    """Return True if the GIL is enabled in this interpreter.
+
+    Returns
+    -------
+    bool
+    """
+    if hasattr(sys, "_is_gil_enabled"):
+        return sys._is_gil_enabled()
+    return not sysconfig.get_config_var("Py_GIL_DISABLED")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure parse_ingredient throughput for increasing numbers of \
+                    threads."
+    )
+    parser.add_argument(
+        "--corpora",
+        help="Corpora to load sentences from",
+        choices=list(CORPORA),
+        nargs="+",
+        default=["bbc"],
+    )
+    parser.add_argument(
+        "--sentences",
+        help="Number of sentences to load from each corpus",
+        type=int,
+        default=2000,
+    )
+    parser.add_argument(
+        "--threads",
+        help="Thread counts to measure",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+    )
+    args = parser.parse_args()
+
+    sentences = load_corpora(args.corpora, args.sentences)
+    # Load the model, unit registry etc. so they are not included in the timings.
+    # The cache is disabled by default, so every sentence is parsed in full.
+    warmup()
+
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {gil_enabled()}")
+    print(f"{len(sentences):,} sentences from {', '.join(args.corpora)}")
+    print()
+    print(f"{'Threads':>7}  {'Sentences/s':>11}  {'Speedup':>7}")
+
+    baseline = None
+    for threads in args.threads:
+        rate = throughput(sentences, threads)
+        baseline = baseline or rate
+        print(f"{threads:>7}  {rate:>11,.0f}  {rate / baseline:>6.2f}x")
@@ -1,14 +1,61 @@
+from ._cache import (
+    PersistentCache,
+    cache_info,
+    clear_cache,
+    disable_cache,
+    enable_cache,
+)
 from ._common import SUPPORTED_LANGUAGES, download_nltk_resources, show_model_card
-from .parsers import inspect_parser, parse_ingredient, parse_multiple_ingredients
-
-download_nltk_resources()
+from ._metrics import disable_metrics, enable_metrics, render_prometheus, reset_metrics
+from ._session import IngredientParser
+from ._timing import (
+    add_timing_hook,
+    disable_slow_parse_log,
+    enable_slow_parse_log,
+    remove_timing_hook,
+)
+from ._tracing import Tracer, set_tracer
+from .en import ModelCascade
+from .parsers import (
+    configure_async_batching,
+    inspect_parser,
+    iparse_ingredients,
+    parse_ingredient,
+    parse_ingredient_async,
+    parse_many_async,
+    parse_multiple_ingredients,
+    warmup,
+)
 
 __all__ = [
+    "IngredientParser",
+    "ModelCascade",
+    "PersistentCache",
     "SUPPORTED_LANGUAGES",
+    "Tracer",
+    "add_timing_hook",
+    "cache_info",
+    "clear_cache",
+    "configure_async_batching",
+    "disable_cache",
+    "disable_metrics",
+    "disable_slow_parse_log",
+    "download_nltk_resources",
+    "enable_cache",
+    "enable_metrics",
+    "enable_slow_parse_log",
     "inspect_parser",
+    "iparse_ingredients",
     "parse_ingredient",
+    "parse_ingredient_async",
+    "parse_many_async",
     "parse_multiple_ingredients",
+    "remove_timing_hook",
+    "render_prometheus",
+    "reset_metrics",
+    "set_tracer",
     "show_model_card",
+    "warmup",
 ]
 
 __version__ = "0.1.0-beta11"
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+from weakref import WeakKeyDictionary
+
+
+class MicroBatcher:
+    """Coalesce concurrent asyncio requests into batches run in an executor.
+
+    Each call to submit adds an item to a pending batch and returns when the result
+    for that item is available. A pending batch is sent to the executor when it
+    contains max_batch_size items, or max_latency seconds after the first item was
+    added to it, whichever happens first. Items are only batched together if they
+    were submitted with the same key.
+
+    Parameters
+    ----------
+    func : Callable[[Hashable, list[Any]], list[Any]]
+        Function called in the executor with the key and list of items in a batch.
+        It must return a list with the result for each item in the same order. If
+        the result for an item is an Exception, it is raised from submit for that
+        item.
+    max_batch_size : int, optional
+        Maximum number of items in a batch.
+        Default is 64.
+    max_latency : float, optional
+        Maximum time, in seconds, to wait for a batch to fill before running it.
+        Default is 0.002.
+    executor : Executor | None, optional
+        Executor to run batches in.
+        If None, a ThreadPoolExecutor is created when first needed.
+
+    Attributes
+    ----------
+    max_batch_size : int
+        Maximum number of items in a batch.
+    max_latency : float
+        Maximum time, in seconds, to wait for a batch to fill before running it.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[Hashable, list[Any]], list[Any]],
+        max_batch_size: int = 64,
+        max_latency: float = 0.002,
+        executor: Executor | None = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be greater than or equal to 1")
+
+        if max_latency < 0:
+            raise ValueError("max_latency must be greater than or equal to 0")
+
+        self.func = func
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._closed = False
+        # Pending batches for each event loop, keyed by batch key.
+        # Each batch is a list of (item, future) tuples.
+        self._pending: WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            dict[Hashable, list[tuple[Any, asyncio.Future]]],
+        ] = WeakKeyDictionary()
+
+    @property
+    def executor(self) -> Executor:
+        """Executor that batches are run in.
+
+        Returns
+        -------
+        Executor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="ingredient_parser")
+        return self._executor
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """Add item to the pending batch for key and wait for its result.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying which items can be batched together.
+        item : Any
+            Item to process.
+
+        Returns
+        -------
+        Any
+            Result for item.
+
+        Raises
+        ------
+        RuntimeError
+            If this object has been shut down.
+        asyncio.CancelledError
+            If this object is shut down before the batch containing item is sent to
+            the executor.
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatcher has been shut down")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        pending = self._pending.setdefault(loop, {})
+        batch = pending.setdefault(key, [])
+        batch.append((item, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(loop, key)
+        elif len(batch) == 1:
+            loop.call_later(self.max_latency, self._flush_if_current, loop, key, batch)
+
+        return await future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop batching items and shut down the executor, if created by this object.
+
+        Batches already sent to the executor are completed. Batches that have not
+        been sent to the executor yet are cancelled when they are next flushed.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            If True, wait for the batches already sent to the executor to complete.
+            This must be False if called from an event loop that is waiting for any
+            of those batches.
+            Default is True.
+        """
+        self._closed = True
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _flush_if_current(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: Hashable,
+        batch: list[tuple[Any, asyncio.Future]],
+    ) -> None:
+        """Run the pending batch for key, if it is still the given batch.
+
+        The batch may have already been run because it reached max_batch_size before
+        the latency deadline.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            Event loop the batch belongs to.
+        key : Hashable
+            Batch key.
+        batch : list[tuple[Any, asyncio.Future]]
+            Batch that was pending when the deadline was scheduled.
+        """
+        if self._pending.get(loop, {}).get(key) is batch:
+            self._flush(loop, key)
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, key: Hashable) -> None:
+        """Send the pending batch for key to the executor.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            Event loop the batch belongs to.
+        key : Hashable
+            Batch key.
+        """
+        batch = self._pending[loop].pop(key)
+        if self._closed:
+            for _, future in batch:
+                future.cancel()
+            return
+
+        items = [item for item, _ in batch]
+        task = loop.run_in_executor(self.executor, self.func, key, items)
+        task.add_done_callback(lambda t: self._set_results(t, batch))
+
+    def _set_results(
+        self, task: asyncio.Future, batch: list[tuple[Any, asyncio.Future]]
+    ) -> None:
+        """Set the result of each future in batch from the completed task.
+
+        Parameters
+        ----------
+        task : asyncio.Future
+            Completed task that ran the batch.
+        batch : list[tuple[Any, asyncio.Future]]
+            Batch of items and their futures.
+        """
+        if task.cancelled():
+            for _, future in batch:
+                future.cancel()
+            return
+
+        if (exc := task.exception()) is not None:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, task.result()):
+            if future.done():
+                # The caller stopped waiting for this result
+                continue
+
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,715 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import TYPE_CHECKING, Any, Hashable, NamedTuple
+
+import pint
+
+from .dataclasses import (
+    CompositeIngredientAmount,
+    IngredientAmount,
+    IngredientText,
+    ParsedIngredient,
+)
+
+if TYPE_CHECKING:
+    # Only imported for type checking to avoid circular imports, since the parser
+    # imports this module.
+    from .en.parser import ModelCascade
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a cache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that found a cached value.
+    misses : int
+        Number of lookups that did not find a cached value.
+    evictions : int
+        Number of values removed from the cache to make space for new values.
+    maxsize : int
+        Maximum number of values in the cache. 0 means the cache is disabled.
+    currsize : int
+        Current number of values in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Thread safe, size bounded, least recently used cache.
+
+    When the cache is full, the least recently used value is evicted to make space
+    for a new value. A cache with a maxsize of 0 is disabled: nothing is stored and
+    lookups are not counted.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of values in the cache.
+        Default is 0, which disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        if maxsize < 0:
+            raise ValueError("maxsize must be greater than or equal to 0")
+
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return number of values in cache.
+
+        Returns
+        -------
+        int
+        """
+        return len(self._data)
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache is enabled.
+
+        Returns
+        -------
+        bool
+        """
+        return self.maxsize > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if not in cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key
+
+        Returns
+        -------
+        Any | None
+            Cached value, or None if not in cache.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value in the cache, evicting the least recently used if necessary.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key
+        value : Any
+            Value to store. This must not be None.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum size of the cache, evicting values if necessary.
+
+        Parameters
+        ----------
+        maxsize : int
+            New maximum number of values in the cache. 0 disables the cache.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be greater than or equal to 0")
+
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all values from the cache and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._data),
+            )
+
+    def _evict(self) -> None:
+        """Remove least recently used values until the cache is not over maxsize.
+
+        This must be called with the lock held.
+        """
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+
+def copy_parsed_ingredient(parsed: ParsedIngredient) -> ParsedIngredient:
+    """Return a copy of a ParsedIngredient that shares no mutable objects.
+
+    This is cheaper than copy.deepcopy because the immutable fields, including
+    pint.Unit objects, are not copied.
+
+    Parameters
+    ----------
+    parsed : ParsedIngredient
+        ParsedIngredient to copy
+
+    Returns
+    -------
+    ParsedIngredient
+        Copy of parsed
+    """
+    amounts = []
+    for amount in parsed.amount:
+        if isinstance(amount, CompositeIngredientAmount):
+            composite_amounts = [replace(am) for am in amount.amounts]
+            amounts.append(replace(amount, amounts=composite_amounts))
+        else:
+            amounts.append(replace(amount))
+
+    return replace(
+        parsed,
+        name=replace(parsed.name) if parsed.name else None,
+        size=replace(parsed.size) if parsed.size else None,
+        amount=amounts,
+        preparation=replace(parsed.preparation) if parsed.preparation else None,
+        comment=replace(parsed.comment) if parsed.comment else None,
+        purpose=replace(parsed.purpose) if parsed.purpose else None,
+    )
+
+
+# Cache of ParsedIngredient objects returned by parse_ingredient, keyed on the input
+# sentence and all options that affect the output.
+RESULT_CACHE = LRUCache()
+# Cache of ParsedIngredient objects keyed on the normalised sentence and its tokens
+# instead of the input sentence, so that inputs that only differ in formatting share
+# a cached result.
+NORMALISED_CACHE = LRUCache()
+# Cache of the labels and marginal probabilities assigned by the model, keyed on the
+# tokens used to calculate features (where numbers are replaced by "!num") and their
+# part of speech tags. Sentences with the same shape, such as "2 cups flour" and
+# "3 cups flour", are given the same labels, so only post-processing is repeated.
+LABEL_CACHE = LRUCache()
+
+CACHES = {
+    "result": RESULT_CACHE,
+    "normalised": NORMALISED_CACHE,
+    "labels": LABEL_CACHE,
+}
+
+
+def enable_cache(
+    maxsize: int = 4096,
+    normalised_maxsize: int | None = None,
+    labels_maxsize: int | None = None,
+) -> None:
+    """Enable caching of parsed results.
+
+    Recipe ingredient sentences are often repeated. When the cache is enabled,
+    parsing a sentence that has already been parsed with the same options and model
+    returns a copy of the cached result instead of parsing it again.
+
+    There are three levels of cache:
+
+    1. | The result cache, keyed on the input sentence.
+    2. | The normalised cache, keyed on the sentence after normalisation and
+       | tokenization. Sentences that differ only in ways removed by normalisation,
+       | for example "one cup flour" and "1 cup flour", share a cached result. A hit
+       | in this cache skips part of speech tagging, feature extraction, labelling
+       | with the model and post-processing.
+    3. | The labels cache, keyed on the tokens used to calculate features, with
+       | numbers replaced by a placeholder, and their part of speech tags. Sentences
+       | with the same shape, for example "2 cups flour" and "3 cups flour", share
+       | the labels and scores assigned by the model. A hit in this cache skips
+       | feature extraction and labelling with the model.
+
+    The caches are disabled by default.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of results in the result cache. When the cache is full, the
+        least recently used result is evicted.
+        Default is 4096.
+    normalised_maxsize : int | None, optional
+        Maximum number of results in the normalised cache.
+        If None, this is the same as maxsize. If 0, the normalised cache is disabled.
+    labels_maxsize : int | None, optional
+        Maximum number of entries in the labels cache.
+        If None, this is the same as maxsize. If 0, the labels cache is disabled.
+
+    Raises
+    ------
+    ValueError
+        If maxsize is less than 1, or normalised_maxsize or labels_maxsize is less
+        than 0. None of the caches are changed.
+    """
+    if normalised_maxsize is None:
+        normalised_maxsize = maxsize
+
+    if labels_maxsize is None:
+        labels_maxsize = maxsize
+
+    # Check every size before resizing any cache, so an invalid size leaves all of
+    # the caches unchanged
+    if maxsize < 1:
+        raise ValueError("maxsize must be greater than or equal to 1")
+
+    if normalised_maxsize < 0:
+        raise ValueError("normalised_maxsize must be greater than or equal to 0")
+
+    if labels_maxsize < 0:
+        raise ValueError("labels_maxsize must be greater than or equal to 0")
+
+    RESULT_CACHE.resize(maxsize)
+    NORMALISED_CACHE.resize(normalised_maxsize)
+    LABEL_CACHE.resize(labels_maxsize)
+
+
+def disable_cache() -> None:
+    """Disable caching of parsed results and clear the caches."""
+    for cache in CACHES.values():
+        cache.resize(0)
+        cache.clear()
+
+
+def clear_cache() -> None:
+    """Remove all cached parsed results and reset the cache statistics."""
+    for cache in CACHES.values():
+        cache.clear()
+
+
+def cache_info(name: str = "result") -> CacheInfo:
+    """Return statistics for a cache.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of cache to return statistics for.
+        Options are: result, normalised, labels.
+        Default is result.
+
+    Returns
+    -------
+    CacheInfo
+        Named tuple of hits, misses, evictions, maxsize and currsize.
+    """
+    if name not in CACHES:
+        raise ValueError(f'Unrecognised cache "{name}"')
+
+    return CACHES[name].info()
+
+
+class PersistentCache:
+    """Persistent cache of parsed ingredients, stored in an sqlite3 database.
+
+    Each result is stored with a key that is a hash of the sentence, the options
+    used to parse it, the package version and a fingerprint of the model file. This
+    means cached results are never returned if the package or model change, or if the
+    sentence was parsed with different options.
+
+    When the number of cached results exceeds max_entries, the least recently used
+    results are removed.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path to sqlite3 database file. The file is created if it doesn't exist.
+    max_entries : int, optional
+        Maximum number of results to store.
+        Default is 1,000,000.
+
+    Attributes
+    ----------
+    path : str | os.PathLike
+        Path to sqlite3 database file.
+    max_entries : int
+        Maximum number of results to store.
+
+    Examples
+    --------
+    >>> with PersistentCache("ingredients.sqlite") as cache:
+    ...     parsed = parse_multiple_ingredients(sentences, persistent_cache=cache)
+    """
+
+    def __init__(self, path: str | os.PathLike, max_entries: int = 1_000_000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than or equal to 1")
+
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS parsed (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    accessed INTEGER NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS parsed_accessed ON parsed (accessed)"
+            )
+        # Counter used to order entries by when they were last used
+        self._clock = self._conn.execute(
+            "SELECT COALESCE(MAX(accessed), 0) FROM parsed"
+        ).fetchone()[0]
+
+    def __repr__(self) -> str:
+        """__repr__ method.
+
+        Returns
+        -------
+        str
+            String representation of initialised object
+        """
+        return f'PersistentCache("{self.path}", max_entries={self.max_entries})'
+
+    def __len__(self) -> int:
+        """Return number of results in cache.
+
+        Returns
+        -------
+        int
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM parsed").fetchone()[0]
+
+    def __enter__(self) -> "PersistentCache":
+        """Enter context manager.
+
+        Returns
+        -------
+        PersistentCache
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit context manager, closing the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def get_many(
+        self,
+        sentences: list[str],
+        lang: str = "en",
+        discard_isolated_stop_words: bool = True,
+        expect_name_in_output: bool = True,
+        string_units: bool = False,
+        imperial_units: bool = False,
+        model: "str | ModelCascade | None" = None,
+    ) -> list[ParsedIngredient | None]:
+        """Return cached results for sentences parsed with the given options.
+
+        Parameters
+        ----------
+        sentences : list[str]
+            List of sentences
+        lang : str
+            Language of sentences.
+        discard_isolated_stop_words : bool, optional
+            discard_isolated_stop_words option the sentences were parsed with.
+        expect_name_in_output : bool, optional
+            expect_name_in_output option the sentences were parsed with.
+        string_units : bool
+            string_units option the sentences were parsed with.
+        imperial_units : bool
+            imperial_units option the sentences were parsed with.
+        model : str | ModelCascade | None, optional
+            Model the sentences were parsed with.
+
+        Returns
+        -------
+        list[ParsedIngredient | None]
+            Cached ParsedIngredient for each sentence, or None if not cached.
+        """
+        options = (
+            lang,
+            discard_isolated_stop_words,
+            expect_name_in_output,
+            string_units,
+            imperial_units,
+        )
+        fingerprint = _model_fingerprint(lang, model)
+        keys = [
+            _persistent_key(sentence, options, fingerprint) for sentence in sentences
+        ]
+
+        found = {}
+        with self._lock, self._conn:
+            # Query in batches to stay below sqlite's limit on number of parameters
+            for i in range(0, len(keys), 500):
+                batch = keys[i : i + 500]
+                placeholders = ",".join("?" * len(batch))
+                found.update(
+                    self._conn.execute(
+                        f"SELECT key, value FROM parsed WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                )
+
+            self._clock += 1
+            self._conn.executemany(
+                "UPDATE parsed SET accessed = ? WHERE key = ?",
+                [(self._clock, key) for key in found],
+            )
+
+        return [_deserialise(found[key]) if key in found else None for key in keys]
+
+    def put_many(
+        self,
+        sentences: list[str],
+        parsed: list[ParsedIngredient],
+        lang: str = "en",
+        discard_isolated_stop_words: bool = True,
+        expect_name_in_output: bool = True,
+        string_units: bool = False,
+        imperial_units: bool = False,
+        model: "str | ModelCascade | None" = None,
+    ) -> None:
+        """Store parsed results for sentences parsed with the given options.
+
+        Parameters
+        ----------
+        sentences : list[str]
+            List of sentences
+        parsed : list[ParsedIngredient]
+            ParsedIngredient for each sentence
+        lang : str
+            Language of sentences.
+        discard_isolated_stop_words : bool, optional
+            discard_isolated_stop_words option the sentences were parsed with.
+        expect_name_in_output : bool, optional
+            expect_name_in_output option the sentences were parsed with.
+        string_units : bool
+            string_units option the sentences were parsed with.
+        imperial_units : bool
+            imperial_units option the sentences were parsed with.
+        model : str | ModelCascade | None, optional
+            Model the sentences were parsed with.
+        """
+        options = (
+            lang,
+            discard_isolated_stop_words,
+            expect_name_in_output,
+            string_units,
+            imperial_units,
+        )
+        fingerprint = _model_fingerprint(lang, model)
+        with self._lock, self._conn:
+            self._clock += 1
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO parsed (key, value, accessed) VALUES (?, ?, ?)",
+                [
+                    (
+                        _persistent_key(sentence, options, fingerprint),
+                        _serialise(p),
+                        self._clock,
+                    )
+                    for sentence, p in zip(sentences, parsed)
+                ],
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used results until there are at most max_entries.
+
+        This must be called with the lock held.
+        """
+        count = self._conn.execute("SELECT COUNT(*) FROM parsed").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                """DELETE FROM parsed WHERE key IN (
+                    SELECT key FROM parsed ORDER BY accessed LIMIT ?
+                )""",
+                (count - self.max_entries,),
+            )
+
+
+def _model_fingerprint(lang: str, model: "str | ModelCascade | None") -> str:
+    """Return fingerprint of the model used to parse sentences in language.
+
+    Parameters
+    ----------
+    lang : str
+        Language of sentences
+    model : str | ModelCascade | None
+        Model selected by the caller, or None for the default model.
+
+    Returns
+    -------
+    str
+        Hex digest of the model file hash.
+    """
+    # Import here to avoid circular imports, since the parser imports this module.
+    from .en.parser import get_labeller
+
+    match lang:
+        case "en":
+            return get_labeller(model).fingerprint
+        case _:
+            raise ValueError(f'Unrecognised value "{lang}"')
+
+
+def _persistent_key(
+    sentence: str, options: tuple[str, bool, bool, bool, bool], fingerprint: str
+) -> str:
+    """Return the PersistentCache key for a sentence parsed with the given options.
+
+    Parameters
+    ----------
+    sentence : str
+        Ingredient sentence
+    options : tuple[str, bool, bool, bool, bool]
+        lang, discard_isolated_stop_words, expect_name_in_output, string_units and
+        imperial_units options.
+    fingerprint : str
+        Fingerprint of the model used to parse the sentence.
+
+    Returns
+    -------
+    str
+        Hex digest of hash of sentence, options, package version and model.
+    """
+    # Import here to avoid circular imports, since __version__ is set after this
+    # module is imported.
+    from . import __version__
+
+    key = json.dumps([sentence, *options, __version__, fingerprint])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _serialise(parsed: ParsedIngredient) -> str:
+    """Serialise ParsedIngredient to JSON.
+
+    pint.Unit objects are stored as their name, so they can be recreated using the
+    package unit registry.
+
+    Parameters
+    ----------
+    parsed : ParsedIngredient
+        ParsedIngredient to serialise
+
+    Returns
+    -------
+    str
+        JSON string
+    """
+
+    def amount_to_dict(amount: IngredientAmount) -> dict[str, Any]:
+        d = asdict(amount)
+        if isinstance(amount.unit, pint.Unit):
+            d["unit"] = {"pint": str(amount.unit)}
+        return d
+
+    amounts = []
+    for amount in parsed.amount:
+        if isinstance(amount, CompositeIngredientAmount):
+            amounts.append(
+                {
+                    "amounts": [amount_to_dict(am) for am in amount.amounts],
+                    "join": amount.join,
+                }
+            )
+        else:
+            amounts.append(amount_to_dict(amount))
+
+    d = asdict(replace(parsed, amount=[]))
+    d["amount"] = amounts
+    return json.dumps(d)
+
+
+def _deserialise(value: str) -> ParsedIngredient:
+    """Deserialise ParsedIngredient from JSON created by _serialise.
+
+    Parameters
+    ----------
+    value : str
+        JSON string
+
+    Returns
+    -------
+    ParsedIngredient
+    """
+
+    # Import here to avoid circular import
+    from .en._utils import UREG
+
+    def amount_from_dict(d: dict[str, Any]) -> IngredientAmount:
+        if isinstance(d["unit"], dict):
+            d["unit"] = UREG.Unit(d["unit"]["pint"])
+        return IngredientAmount(**d)
+
+    def text_from_dict(d: dict[str, Any] | None) -> IngredientText | None:
+        return IngredientText(**d) if d is not None else None
+
+    d = json.loads(value)
+    amounts = []
+    for amount in d["amount"]:
+        if "amounts" in amount:
+            amounts.append(
+                CompositeIngredientAmount(
+                    amounts=[amount_from_dict(am) for am in amount["amounts"]],
+                    join=amount["join"],
+                )
+            )
+        else:
+            amounts.append(amount_from_dict(amount))
+
+    return ParsedIngredient(
+        name=text_from_dict(d["name"]),
+        size=text_from_dict(d["size"]),
+        amount=amounts,
+        preparation=text_from_dict(d["preparation"]),
+        comment=text_from_dict(d["comment"]),
+        purpose=text_from_dict(d["purpose"]),
+        sentence=d["sentence"],
+    )
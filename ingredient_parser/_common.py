@@ -5,13 +5,12 @@ import os
 import platform
 import re
 import subprocess
+from functools import cache
 from importlib.resources import as_file, files
 from itertools import groupby, islice
 from operator import itemgetter
 from typing import Generator, Iterator
 
-from nltk import data, download
-
 SUPPORTED_LANGUAGES = ["en"]
 
 # Regex pattern for matching a numeric range e.g. 1-2, 2-3.
@@ -97,8 +96,16 @@ def show_model_card(lang: str = "en") -> None:
             subprocess.call(("xdg-open", p))
 
 
+@cache
 def download_nltk_resources() -> None:
-    """Check if required nltk resources can be found and if not, download them."""
+    """Check if required nltk resources can be found and if not, download them.
+
+    This is done the first time a sentence is tagged with part of speech tags, not
+    when ingredient_parser is imported. The check is only done once per process.
+    """
+    # Importing nltk is slow, so only do it when this is called.
+    from nltk import data, download
+
     try:
         data.find(
             "taggers/averaged_perceptron_tagger/averaged_perceptron_tagger.pickle"
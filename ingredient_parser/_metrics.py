@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+
+import itertools
+import threading
+from bisect import bisect_left
+from typing import Any, Mapping, Sequence
+from weakref import WeakValueDictionary
+
+from ._cache import CACHES, LRUCache
+from ._timing import add_timing_hook, remove_timing_hook
+
+# Upper bounds, in seconds, of the stage latency histogram buckets
+LATENCY_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+# Upper bounds of the sentence token count histogram buckets
+TOKEN_BUCKETS = (2, 4, 6, 8, 10, 12, 16, 20, 24, 32, 48, 64)
+
+
+class Histogram:
+    """Histogram of observed values, in the form used by Prometheus.
+
+    This is not thread safe. MetricsRegistry holds a lock whilst updating it.
+
+    Parameters
+    ----------
+    buckets : Sequence[float]
+        Upper bound of each bucket, in increasing order. A bucket for values larger
+        than the last bound is always added.
+
+    Attributes
+    ----------
+    buckets : tuple[float, ...]
+        Upper bound of each bucket.
+    counts : list[int]
+        Number of observed values in each bucket, with the count of values larger than
+        the last bound at the end. These are not cumulative.
+    sum : float
+        Sum of all observed values.
+    count : int
+        Number of observed values.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add a value to the histogram.
+
+        Parameters
+        ----------
+        value : float
+            Value to add.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str = "") -> list[str]:
+        """Return the histogram as lines of Prometheus text exposition format.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric.
+        labels : str, optional
+            Labels to add to every sample, for example 'stage="tag"'.
+
+        Returns
+        -------
+        list[str]
+            Lines for the buckets, sum and count.
+        """
+        prefix = f"{labels}," if labels else ""
+        suffix = f"{{{labels}}}" if labels else ""
+
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+        lines.append(f"{name}_sum{suffix} {self.sum}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """In-process collection of parser metrics.
+
+    Attributes
+    ----------
+    enabled : bool
+        True if metrics are being recorded.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all metrics to zero."""
+        with self._lock:
+            self._sentences = 0
+            self._name_guesses = 0
+            self._cascade_sentences = 0
+            self._cascade_escalations = 0
+            self._tokens = Histogram(TOKEN_BUCKETS)
+            self._stages: dict[str, Histogram] = {}
+
+    def observe_sentence(self, token_count: int, guessed_name: bool) -> None:
+        """Record a parsed sentence.
+
+        Parameters
+        ----------
+        token_count : int
+            Number of tokens in the sentence.
+        guessed_name : bool
+            True if guess_ingredient_name was used because no tokens were labelled
+            NAME.
+        """
+        with self._lock:
+            self._sentences += 1
+            self._name_guesses += guessed_name
+            self._tokens.observe(token_count)
+
+    def observe_timings(self, sentence: str, timings: dict[str, float]) -> None:
+        """Record the time taken by each stage of parsing a sentence.
+
+        This is added as a timing hook when metrics are enabled.
+
+        Parameters
+        ----------
+        sentence : str
+            Input ingredient sentence.
+        timings : dict[str, float]
+            Time, in seconds, taken by each stage.
+        """
+        with self._lock:
+            for stage, seconds in timings.items():
+                if (histogram := self._stages.get(stage)) is None:
+                    histogram = self._stages[stage] = Histogram(LATENCY_BUCKETS)
+                histogram.observe(seconds)
+
+    def observe_cascade(self, escalated: bool) -> None:
+        """Record a sentence labelled by a ModelCascade.
+
+        Parameters
+        ----------
+        escalated : bool
+            True if the sentence was labelled by more than the first model.
+        """
+        with self._lock:
+            self._cascade_sentences += 1
+            self._cascade_escalations += escalated
+
+    def render_prometheus(self) -> str:
+        """Return all metrics in Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            Metrics, one sample per line.
+        """
+        lines = []
+
+        def header(name: str, type_: str, help_: str) -> None:
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} {type_}")
+
+        with self._lock:
+            header(
+                "ingredient_parser_sentences_total",
+                "counter",
+                "Number of sentences parsed, excluding result cache hits.",
+            )
+            lines.append(f"ingredient_parser_sentences_total {self._sentences}")
+
+            header(
+                "ingredient_parser_name_guesses_total",
+                "counter",
+                "Number of sentences where no tokens were labelled NAME, so the name "
+                "was guessed.",
+            )
+            lines.append(f"ingredient_parser_name_guesses_total {self._name_guesses}")
+
+            header(
+                "ingredient_parser_sentence_tokens",
+                "histogram",
+                "Number of tokens in each parsed sentence.",
+            )
+            lines.extend(self._tokens.render("ingredient_parser_sentence_tokens"))
+
+            header(
+                "ingredient_parser_stage_seconds",
+                "histogram",
+                "Time taken by each stage of parsing a sentence.",
+            )
+            for stage, histogram in self._stages.items():
+                lines.extend(
+                    histogram.render(
+                        "ingredient_parser_stage_seconds", f'stage="{stage}"'
+                    )
+                )
+
+            header(
+                "ingredient_parser_cascade_sentences_total",
+                "counter",
+                "Number of sentences labelled by a ModelCascade.",
+            )
+            lines.append(
+                f"ingredient_parser_cascade_sentences_total {self._cascade_sentences}"
+            )
+
+            header(
+                "ingredient_parser_cascade_escalations_total",
+                "counter",
+                "Number of sentences a ModelCascade labelled with more than the first "
+                "model.",
+            )
+            lines.append(
+                "ingredient_parser_cascade_escalations_total "
+                f"{self._cascade_escalations}"
+            )
+
+        # Cache statistics are read from the caches, so are included even when
+        # metrics are not enabled.
+        infos = {
+            f'parser="{parser}",cache="{name}"': cache.info()
+            for parser, caches in parser_caches().items()
+            for name, cache in caches.items()
+        }
+        header(
+            "ingredient_parser_cache_hits_total",
+            "counter",
+            "Number of cache lookups that found a cached value.",
+        )
+        for labels, info in infos.items():
+            lines.append(f"ingredient_parser_cache_hits_total{{{labels}}} {info.hits}")
+
+        header(
+            "ingredient_parser_cache_misses_total",
+            "counter",
+            "Number of cache lookups that did not find a cached value.",
+        )
+        for labels, info in infos.items():
+            lines.append(
+                f"ingredient_parser_cache_misses_total{{{labels}}} {info.misses}"
+            )
+
+        header(
+            "ingredient_parser_cache_hit_ratio",
+            "gauge",
+            "Fraction of cache lookups that found a cached value.",
+        )
+        for labels, info in infos.items():
+            lookups = info.hits + info.misses
+            ratio = info.hits / lookups if lookups else 0.0
+            lines.append(f"ingredient_parser_cache_hit_ratio{{{labels}}} {ratio}")
+
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+# Open IngredientParser objects that own their caches, keyed by parser name. The
+# parsers are only weakly referenced, so a parser that is not closed is removed
+# when it is garbage collected.
+_PARSERS: WeakValueDictionary[str, Any] = WeakValueDictionary()
+_PARSERS_LOCK = threading.Lock()
+_PARSER_NUMBERS = itertools.count(1)
+
+
+def register_parser(parser: Any, name: str | None = None) -> str:
+    """Include the caches owned by an IngredientParser in render_prometheus.
+
+    Parameters
+    ----------
+    parser : IngredientParser
+        Parser to include the caches of.
+    name : str | None, optional
+        Value of the parser label of the parser's cache statistics.
+        If None, the next unused number is used.
+
+    Returns
+    -------
+    str
+        Name of the parser.
+
+    Raises
+    ------
+    ValueError
+        If the name is already used by another open parser, or is "default".
+    """
+    with _PARSERS_LOCK:
+        if name is None:
+            while (name := str(next(_PARSER_NUMBERS))) in _PARSERS:
+                pass
+        elif name == "default" or name in _PARSERS:
+            raise ValueError(f'Parser name "{name}" is already used')
+
+        _PARSERS[name] = parser
+    return name
+
+
+def unregister_parser(name: str) -> None:
+    """Stop including the caches of a parser in render_prometheus.
+
+    Parameters
+    ----------
+    name : str
+        Name returned by register_parser.
+    """
+    with _PARSERS_LOCK:
+        _PARSERS.pop(name, None)
+
+
+def parser_caches() -> dict[str, Mapping[str, LRUCache]]:
+    """Return the caches included in render_prometheus, keyed by parser name.
+
+    The caches used by the module level parsing functions have the name default.
+
+    Returns
+    -------
+    dict[str, Mapping[str, LRUCache]]
+        Result, normalised and labels caches of each parser.
+    """
+    with _PARSERS_LOCK:
+        parsers = list(_PARSERS.items())
+    return {"default": CACHES} | {name: parser.caches for name, parser in parsers}
+
+
+def enable_metrics() -> None:
+    """Start recording parser metrics.
+
+    The metrics are the number of sentences parsed, the number of tokens in each
+    sentence, the time taken by each stage of parsing, the number of sentences where
+    the name was guessed and the number of sentences escalated by a ModelCascade.
+    Enabling metrics also enables stage timing, which adds the cost of timing each
+    stage to every parse. Normalisation is timed as a single stage, so the stage
+    histograms don't include each normalisation step.
+
+    Only sentences parsed in this process are recorded, so sentences parsed in worker
+    processes by parse_multiple_ingredients are not included.
+    """
+    with METRICS._lock:
+        if METRICS.enabled:
+            return
+        METRICS.enabled = True
+    add_timing_hook(METRICS.observe_timings)
+
+
+def disable_metrics() -> None:
+    """Stop recording parser metrics. Metrics already recorded are kept."""
+    with METRICS._lock:
+        if not METRICS.enabled:
+            return
+        METRICS.enabled = False
+    remove_timing_hook(METRICS.observe_timings)
+
+
+def reset_metrics() -> None:
+    """Reset all recorded parser metrics to zero."""
+    METRICS.reset()
+
+
+def render_prometheus() -> str:
+    """Return the parser metrics in Prometheus text exposition format.
+
+    The statistics for the caches used by the module level parsing functions, and
+    for the caches owned by each open IngredientParser, are always included. Each
+    cache is labelled with the name of the parser that owns it, which is default for
+    the module level parsing functions. The other metrics are only recorded after
+    enable_metrics is called.
+
+    Returns
+    -------
+    str
+        Metrics, one sample per line.
+
+    Examples
+    --------
+    >>> enable_metrics()
+    >>> parse_ingredient("2 cups flour")
+    >>> print(render_prometheus())
+    # HELP ingredient_parser_sentences_total Number of sentences parsed, ...
+    # TYPE ingredient_parser_sentences_total counter
+    ingredient_parser_sentences_total 1
+    ...
+    """
+    return METRICS.render_prometheus()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+
+from typing import Mapping
+
+import pint
+
+from ._cache import CacheInfo, LRUCache, copy_parsed_ingredient
+from ._common import SUPPORTED_LANGUAGES
+from ._metrics import register_parser, unregister_parser
+from .dataclasses import ParsedIngredient, ParserDebugInfo
+from .en import inspect_parser_en, parse_ingredient_en
+from .en._utils import clear_pint_unit_cache
+from .en.parser import ModelCascade, TaggerPool, get_labeller, get_tagger_pool
+
+
+class IngredientParser:
+    """Ingredient sentence parser that owns its model, caches and configuration.
+
+    The module level functions (parse_ingredient, inspect_parser etc.) share a
+    default parser for each language, configured with enable_cache. Creating an
+    IngredientParser instead allows different parts of an application to use
+    different models, cache sizes and unit registries without affecting each other,
+    and allows the memory used by each to be controlled and released with close().
+
+    The part of speech tagger and the stemmer are shared by all parsers because they
+    don't hold any state between sentences.
+
+    Parameters
+    ----------
+    lang : str, optional
+        Language of sentences to parse.
+        Currently supported options are: en
+        Default is en.
+    model : str | ModelCascade | None, optional
+        Model to label sentences with. This is either the file name of a model
+        shipped with this package, the path to a model file or a ModelCascade.
+        If None, the default model is used.
+    cache_size : int, optional
+        Maximum number of results in the result cache.
+        Default is 0, which disables the cache.
+    normalised_cache_size : int | None, optional
+        Maximum number of results in the normalised cache.
+        If None, this is the same as cache_size.
+    labels_cache_size : int | None, optional
+        Maximum number of entries in the labels cache.
+        If None, this is the same as cache_size.
+    unit_registry : pint.UnitRegistry | None, optional
+        Unit registry to create pint.Unit objects from.
+        If None, the package unit registry is used.
+    pool_size : int | None, optional
+        If given, the parser creates its own pool of up to this many taggers for the
+        model, which are released by close(). If None, the pool of taggers for the
+        model is shared with other parsers.
+        This cannot be used with a ModelCascade.
+    caches : Mapping[str, LRUCache] | None, optional
+        Caches to use, keyed by result, normalised and labels, instead of creating
+        new ones. This allows caches to be shared between parsers, in which case the
+        cache sizes given above are ignored and close() does not clear the caches.
+    name : str | None, optional
+        Name of the parser in the cache statistics returned by render_prometheus.
+        This is only used if the parser owns its caches.
+        If None, a number is used.
+
+    Attributes
+    ----------
+    lang : str
+        Language of sentences to parse.
+    model : str | ModelCascade | None
+        Model to label sentences with.
+    unit_registry : pint.UnitRegistry | None
+        Unit registry to create pint.Unit objects from.
+    caches : dict[str, LRUCache]
+        Result, normalised and labels caches.
+    closed : bool
+        True if close() has been called.
+    name : str | None
+        Name of the parser in the cache statistics returned by render_prometheus, or
+        None if the parser doesn't own its caches.
+
+    Examples
+    --------
+    >>> with IngredientParser(model="model.15k.en.crfsuite", cache_size=1000) as p:
+    ...     parsed = p.parse("2 cups flour")
+    """
+
+    def __init__(
+        self,
+        lang: str = "en",
+        model: str | ModelCascade | None = None,
+        cache_size: int = 0,
+        normalised_cache_size: int | None = None,
+        labels_cache_size: int | None = None,
+        unit_registry: pint.UnitRegistry | None = None,
+        pool_size: int | None = None,
+        caches: Mapping[str, LRUCache] | None = None,
+        name: str | None = None,
+    ):
+        if lang not in SUPPORTED_LANGUAGES:
+            raise ValueError(f'Unsupported language "{lang}"')
+
+        self.lang = lang
+        self.model = model
+        self.unit_registry = unit_registry
+        self.closed = False
+
+        self._owns_caches = caches is None
+        if caches is None:
+            if normalised_cache_size is None:
+                normalised_cache_size = cache_size
+            if labels_cache_size is None:
+                labels_cache_size = cache_size
+            caches = {
+                "result": LRUCache(cache_size),
+                "normalised": LRUCache(normalised_cache_size),
+                "labels": LRUCache(labels_cache_size),
+            }
+        self.caches = dict(caches)
+
+        self._owns_pool = pool_size is not None
+        if pool_size is None:
+            self._labeller = get_labeller(model)
+        elif isinstance(model, ModelCascade):
+            raise ValueError("pool_size cannot be used with a ModelCascade")
+        else:
+            self._labeller = TaggerPool(get_tagger_pool(model).model, size=pool_size)
+
+        # Caches that are not owned by this parser are reported by their owner
+        self.name = register_parser(self, name) if self._owns_caches else None
+
+    def __repr__(self) -> str:
+        """__repr__ method.
+
+        Returns
+        -------
+        str
+            String representation of initialised object
+        """
+        return f'IngredientParser("{self.lang}", model={self._labeller.model!r})'
+
+    def __enter__(self) -> "IngredientParser":
+        """Enter context manager.
+
+        Returns
+        -------
+        IngredientParser
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit context manager, closing the parser."""
+        self.close()
+
+    def close(self) -> None:
+        """Release the taggers, cached results and cached units owned by this parser.
+
+        Any further calls to parse, parse_many or inspect raise a RuntimeError.
+        """
+        if self._owns_pool and isinstance(self._labeller, TaggerPool):
+            self._labeller.close()
+
+        if self._owns_caches:
+            for cache in self.caches.values():
+                cache.clear()
+            if self.name is not None:
+                unregister_parser(self.name)
+
+        if self.unit_registry is not None:
+            clear_pint_unit_cache(self.unit_registry)
+
+        self.closed = True
+
+    def cache_info(self, name: str = "result") -> CacheInfo:
+        """Return statistics for one of this parser's caches.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of cache to return statistics for.
+            Options are: result, normalised, labels.
+            Default is result.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple of hits, misses, evictions, maxsize and currsize.
+        """
+        if name not in self.caches:
+            raise ValueError(f'Unrecognised cache "{name}"')
+
+        return self.caches[name].info()
+
+    def clear_cache(self) -> None:
+        """Remove all cached results and reset the cache statistics."""
+        for cache in self.caches.values():
+            cache.clear()
+
+    def parse(
+        self,
+        sentence: str,
+        discard_isolated_stop_words: bool = True,
+        expect_name_in_output: bool = True,
+        string_units: bool = False,
+        imperial_units: bool = False,
+        model: str | ModelCascade | None = None,
+    ) -> ParsedIngredient:
+        """Parse an ingredient sentence to return structured data.
+
+        Parameters
+        ----------
+        sentence : str
+            Ingredient sentence to parse
+        discard_isolated_stop_words : bool, optional
+            If True, any isolated stop words in the name, preparation, or comment
+            fields are discarded.
+            Default is True.
+        expect_name_in_output : bool, optional
+            If True, if the model doesn't label any words in the sentence as the
+            name, fallback to selecting the most likely name from all tokens even
+            though the model gives it a different label. Note that this does
+            guarantee the output contains a name.
+            Default is True.
+        string_units : bool, optional
+            If True, return all IngredientAmount units as strings.
+            If False, convert IngredientAmount units to pint.Unit objects where
+            possible.
+            Default is False.
+        imperial_units : bool, optional
+            If True, use imperial units instead of US customary units for pint.Unit
+            objects for the the following units: fluid ounce, cup, pint, quart,
+            gallon.
+            Default is False, which results in US customary units being used.
+            This has no effect if string_units=True.
+        model : str | ModelCascade | None, optional
+            Model to use for this sentence instead of the parser's model.
+            If None, the parser's model is used.
+
+        Returns
+        -------
+        ParsedIngredient
+            ParsedIngredient object of structured data parsed from input string
+        """
+        self._check_open()
+        labeller = self._labeller if model is None else get_labeller(model)
+
+        result_cache = self.caches["result"]
+        cache_key = None
+        if result_cache.enabled:
+            cache_key = (
+                sentence,
+                self.lang,
+                discard_isolated_stop_words,
+                expect_name_in_output,
+                string_units,
+                imperial_units,
+                labeller.model,
+                self.unit_registry,
+            )
+            if (cached := result_cache.get(cache_key)) is not None:
+                # Return a copy so the caller cannot modify the cached object
+                return copy_parsed_ingredient(cached)
+
+        match self.lang:
+            case "en":
+                parsed = parse_ingredient_en(
+                    sentence,
+                    discard_isolated_stop_words=discard_isolated_stop_words,
+                    expect_name_in_output=expect_name_in_output,
+                    string_units=string_units,
+                    imperial_units=imperial_units,
+                    model=labeller,
+                    unit_registry=self.unit_registry,
+                    normalised_cache=self.caches["normalised"],
+                    label_cache=self.caches["labels"],
+                )
+            case _:
+                raise ValueError(f'Unrecognised value "{self.lang}"')
+
+        if cache_key is not None:
+            result_cache.put(cache_key, copy_parsed_ingredient(parsed))
+
+        return parsed
+
+    def parse_many(
+        self,
+        sentences: list[str],
+        discard_isolated_stop_words: bool = True,
+        expect_name_in_output: bool = True,
+        string_units: bool = False,
+        imperial_units: bool = False,
+        model: str | ModelCascade | None = None,
+        share_duplicates: bool = False,
+    ) -> list[ParsedIngredient]:
+        """Parse multiple ingredient sentences.
+
+        Each distinct sentence is only parsed once. Use parse_multiple_ingredients to
+        parse sentences in worker processes.
+
+        Parameters
+        ----------
+        sentences : list[str]
+            List of sentences to parse
+        discard_isolated_stop_words : bool, optional
+            If True, any isolated stop words in the name, preparation, or comment
+            fields are discarded.
+            Default is True.
+        expect_name_in_output : bool, optional
+            If True, if the model doesn't label any words in the sentence as the
+            name, fallback to selecting the most likely name from all tokens even
+            though the model gives it a different label.
+            Default is True.
+        string_units : bool, optional
+            If True, return all IngredientAmount units as strings.
+            Default is False.
+        imperial_units : bool, optional
+            If True, use imperial units instead of US customary units for pint.Unit
+            objects.
+            Default is False.
+        model : str | ModelCascade | None, optional
+            Model to use for these sentences instead of the parser's model.
+            If None, the parser's model is used.
+        share_duplicates : bool, optional
+            If True, every occurrence of a duplicated sentence is given the same
+            ParsedIngredient object. If False, each occurrence after the first is
+            given a copy.
+            Default is False.
+
+        Returns
+        -------
+        list[ParsedIngredient]
+            List of ParsedIngredient objects, in the same order as the input
+        """
+        results = {}
+        output = []
+        for sentence in sentences:
+            if sentence not in results:
+                results[sentence] = self.parse(
+                    sentence,
+                    discard_isolated_stop_words=discard_isolated_stop_words,
+                    expect_name_in_output=expect_name_in_output,
+                    string_units=string_units,
+                    imperial_units=imperial_units,
+                    model=model,
+                )
+                output.append(results[sentence])
+            elif share_duplicates:
+                output.append(results[sentence])
+            else:
+                output.append(copy_parsed_ingredient(results[sentence]))
+
+        return output
+
+    def inspect(
+        self,
+        sentence: str,
+        discard_isolated_stop_words: bool = True,
+        expect_name_in_output: bool = True,
+        string_units: bool = False,
+        imperial_units: bool = False,
+        model: str | ModelCascade | None = None,
+    ) -> ParserDebugInfo:
+        """Return intermediate objects generated whilst parsing a sentence.
+
+        The caches are not used.
+
+        Parameters
+        ----------
+        sentence : str
+            Ingredient sentence to parse
+        discard_isolated_stop_words : bool, optional
+            If True, any isolated stop words in the name, preparation, or comment
+            fields are discarded.
+            Default is True.
+        expect_name_in_output : bool, optional
+            If True, if the model doesn't label any words in the sentence as the
+            name, fallback to selecting the most likely name from all tokens even
+            though the model gives it a different label.
+            Default is True.
+        string_units : bool, optional
+            If True, return all IngredientAmount units as strings.
+            Default is False.
+        imperial_units : bool, optional
+            If True, use imperial units instead of US customary units for pint.Unit
+            objects.
+            Default is False.
+        model : str | ModelCascade | None, optional
+            Model to use for this sentence instead of the parser's model.
+            If None, the parser's model is used.
+
+        Returns
+        -------
+        ParserDebugInfo
+            ParserDebugInfo object containing the PreProcessor object, PostProcessor
+            object and Tagger.
+        """
+        self._check_open()
+        labeller = self._labeller if model is None else get_labeller(model)
+
+        match self.lang:
+            case "en":
+                return inspect_parser_en(
+                    sentence,
+                    discard_isolated_stop_words=discard_isolated_stop_words,
+                    expect_name_in_output=expect_name_in_output,
+                    string_units=string_units,
+                    imperial_units=imperial_units,
+                    model=labeller,
+                    unit_registry=self.unit_registry,
+                )
+            case _:
+                raise ValueError(f'Unrecognised value "{self.lang}"')
+
+    def _check_open(self) -> None:
+        """Raise RuntimeError if the parser has been closed."""
+        if self.closed:
+            raise RuntimeError("IngredientParser is closed")
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, ContextManager, Iterator
+
+# Type of functions that can be added with add_timing_hook
+TimingHook = Callable[[str, dict[str, float]], None]
+
+
+class StageTimer:
+    """Record the time spent in each stage of parsing a sentence.
+
+    Stages are named using dots to separate a stage from its parts, for example
+    normalise.replace_string_numbers is part of the normalise stage. The time for
+    a stage that is entered more than once is the total of all the times.
+
+    Parameters
+    ----------
+    per_step : bool, optional
+        If True, each normalisation step is applied and timed in turn. This is much
+        slower than normalising the sentence in a single pass.
+        Default is False, which times normalisation as the single normalise stage.
+
+    Attributes
+    ----------
+    enabled : bool
+        Always True, to distinguish from NullTimer.
+    per_step : bool
+        If True, each normalisation step is applied and timed in turn.
+    started : float
+        Value of time.perf_counter() when the timer was created.
+    timings : dict[str, float]
+        Time, in seconds, spent in each stage, in the order the stages started.
+    """
+
+    enabled = True
+
+    def __init__(self, per_step: bool = False):
+        self.per_step = per_step
+        self.started = time.perf_counter()
+        self.timings: dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        """__repr__ method.
+
+        Returns
+        -------
+        str
+            String representation of initialised object
+        """
+        return f"StageTimer({self.timings})"
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the code run inside this context manager.
+
+        Parameters
+        ----------
+        name : str
+            Name of stage.
+
+        Yields
+        ------
+        None
+        """
+        # Add the stage now so timings are ordered by when each stage started
+        self.timings.setdefault(name, 0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+
+    def elapsed(self) -> float:
+        """Return the time since the timer was created.
+
+        Returns
+        -------
+        float
+            Elapsed time, in seconds.
+        """
+        return time.perf_counter() - self.started
+
+
+class NullTimer:
+    """Timer that does not record anything.
+
+    This is used when timing is not enabled, so that stages can always be wrapped in
+    a timer's stage context manager at negligible cost.
+
+    Attributes
+    ----------
+    enabled : bool
+        Always False, to distinguish from StageTimer.
+    per_step : bool
+        Always False, because nothing is timed.
+    """
+
+    enabled = False
+    per_step = False
+    _context = nullcontext()
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Return an empty dict, because no timings are recorded.
+
+        Returns
+        -------
+        dict[str, float]
+        """
+        return {}
+
+    def stage(self, name: str) -> ContextManager[None]:
+        """Return a context manager that does nothing.
+
+        Parameters
+        ----------
+        name : str
+            Name of stage.
+
+        Returns
+        -------
+        ContextManager[None]
+        """
+        return self._context
+
+
+NULL_TIMER = NullTimer()
+
+_TIMING_HOOKS: tuple[TimingHook, ...] = ()
+# Hooks added with per_step=True
+_PER_STEP_HOOKS: tuple[TimingHook, ...] = ()
+_TIMING_HOOKS_LOCK = threading.Lock()
+
+# Threshold, in seconds, and logger for the slow parse log, or None if disabled
+_SLOW_PARSE_LOG: tuple[float, logging.Logger] | None = None
+
+
+def add_timing_hook(hook: TimingHook, per_step: bool = False) -> None:
+    """Call a function with the stage timings of every sentence that is parsed.
+
+    Timing is only enabled whilst at least one hook is added. The hook is called with
+    the input sentence and a dict of the time, in seconds, spent in each stage. Stages
+    that were skipped because of a cached result are not included, and nothing is
+    reported for sentences returned from the result cache or parsed in worker
+    processes.
+
+    Hooks are called in the thread that parsed the sentence, so they must be fast and
+    thread safe. Exceptions raised by a hook are not caught.
+
+    Parameters
+    ----------
+    hook : Callable[[str, dict[str, float]], None]
+        Function to call for each sentence.
+    per_step : bool, optional
+        If True, the time taken by each normalisation step is also reported, for
+        example normalise.replace_string_numbers. This makes normalisation several
+        times slower for every sentence whilst the hook is added, because the steps
+        have to be applied in turn instead of in a single pass.
+        Default is False.
+
+    Examples
+    --------
+    >>> from collections import Counter
+    >>> totals = Counter()
+    >>> add_timing_hook(lambda sentence, timings: totals.update(timings))
+    """
+    global _TIMING_HOOKS, _PER_STEP_HOOKS
+    with _TIMING_HOOKS_LOCK:
+        _TIMING_HOOKS = (*_TIMING_HOOKS, hook)
+        if per_step:
+            _PER_STEP_HOOKS = (*_PER_STEP_HOOKS, hook)
+
+
+def remove_timing_hook(hook: TimingHook) -> None:
+    """Stop calling a function added with add_timing_hook.
+
+    Parameters
+    ----------
+    hook : Callable[[str, dict[str, float]], None]
+        Function to stop calling.
+
+    Raises
+    ------
+    ValueError
+        If the hook has not been added.
+    """
+    global _TIMING_HOOKS, _PER_STEP_HOOKS
+    with _TIMING_HOOKS_LOCK:
+        if hook not in _TIMING_HOOKS:
+            raise ValueError("Timing hook has not been added")
+
+        hooks = list(_TIMING_HOOKS)
+        hooks.remove(hook)
+        _TIMING_HOOKS = tuple(hooks)
+
+        if hook in _PER_STEP_HOOKS:
+            hooks = list(_PER_STEP_HOOKS)
+            hooks.remove(hook)
+            _PER_STEP_HOOKS = tuple(hooks)
+
+
+def enable_slow_parse_log(
+    threshold: float = 0.01, logger: logging.Logger | None = None
+) -> None:
+    """Log every sentence that takes longer than threshold to parse.
+
+    Each slow sentence is logged as a warning. The log record has a slow_parse
+    attribute containing a dict with the following keys:
+
+    * sentence: the input sentence
+    * seconds: the time taken to parse the sentence
+    * token_count: the number of tokens in the sentence
+    * timings: the time taken by each stage, as returned by inspect_parser
+    * normalisation: a list of (step, sentence) tuples, for each normalisation step
+      that changed the sentence and the sentence output by that step
+
+    Enabling the slow parse log also enables stage timing, which adds the cost of
+    timing each stage to every parse. Sentences are still normalised in a single pass.
+    The normalisation steps are only applied one at a time to record their output
+    for sentences that are logged, which adds to the time taken to return those
+    sentences but not to the time that is logged. Sentences returned from the result
+    cache or parsed in worker processes are not logged.
+
+    Parameters
+    ----------
+    threshold : float, optional
+        Time, in seconds, above which a parse is logged.
+        Default is 0.01.
+    logger : logging.Logger | None, optional
+        Logger to log slow sentences to.
+        If None, the ingredient_parser.slow_parse logger is used.
+
+    Examples
+    --------
+    >>> import logging
+    >>> logging.basicConfig()
+    >>> enable_slow_parse_log(0.005)
+    >>> parse_ingredient("2 cups flour")
+    WARNING:ingredient_parser.slow_parse:Slow parse (6.2 ms, 3 tokens): '2 cups flour'
+    """
+    global _SLOW_PARSE_LOG
+    _SLOW_PARSE_LOG = (
+        threshold,
+        logger or logging.getLogger("ingredient_parser.slow_parse"),
+    )
+
+
+def disable_slow_parse_log() -> None:
+    """Stop logging slow sentences."""
+    global _SLOW_PARSE_LOG
+    _SLOW_PARSE_LOG = None
+
+
+def new_timer() -> StageTimer | NullTimer:
+    """Return a timer for parsing a sentence.
+
+    Returns
+    -------
+    StageTimer | NullTimer
+        StageTimer if any timing hooks have been added or the slow parse log is
+        enabled, otherwise NULL_TIMER. The StageTimer times each normalisation step
+        if any hooks were added with per_step=True.
+    """
+    if _TIMING_HOOKS or _SLOW_PARSE_LOG is not None:
+        return StageTimer(per_step=bool(_PER_STEP_HOOKS))
+    return NULL_TIMER
+
+
+def report_timings(
+    sentence: str,
+    timer: StageTimer | NullTimer,
+    token_count: int = 0,
+    trace_normalisation: Callable[[], list[tuple[str, str]]] | None = None,
+) -> None:
+    """Call the timing hooks, and log the sentence if it was slow to parse.
+
+    Parameters
+    ----------
+    sentence : str
+        Input ingredient sentence.
+    timer : StageTimer | NullTimer
+        Timer used whilst parsing sentence. Nothing is reported for NULL_TIMER.
+    token_count : int, optional
+        Number of tokens in the sentence.
+    trace_normalisation : Callable[[], list[tuple[str, str]]] | None, optional
+        Function that returns the name of each normalisation step and the sentence
+        output by it. This is only called if the sentence is logged as slow.
+    """
+    if not isinstance(timer, StageTimer):
+        return
+
+    for hook in _TIMING_HOOKS:
+        hook(sentence, timer.timings)
+
+    if (slow_parse_log := _SLOW_PARSE_LOG) is None:
+        return
+
+    threshold, logger = slow_parse_log
+    if (seconds := timer.elapsed()) > threshold:
+        record = {
+            "sentence": sentence,
+            "seconds": seconds,
+            "token_count": token_count,
+            "timings": dict(timer.timings),
+            "normalisation": _changed_steps(
+                sentence, trace_normalisation() if trace_normalisation else []
+            ),
+        }
+        logger.warning(
+            "Slow parse (%.1f ms, %d tokens): %r",
+            seconds * 1000,
+            token_count,
+            sentence,
+            extra={"slow_parse": record},
+        )
+
+
+def _changed_steps(
+    sentence: str, normalisation_trace: list[tuple[str, str]]
+) -> list[tuple[str, str]]:
+    """Return the normalisation steps that changed the sentence.
+
+    Parameters
+    ----------
+    sentence : str
+        Input ingredient sentence.
+    normalisation_trace : list[tuple[str, str]]
+        Name of each normalisation step and the sentence output by it.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        Name of each step that changed the sentence and the sentence output by it.
+    """
+    changed = []
+    for step, output in normalisation_trace:
+        if output != sentence:
+            changed.append((step, output))
+        sentence = output
+    return changed
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+from contextlib import nullcontext
+from typing import Any, ContextManager, Protocol
+
+
+class Tracer(Protocol):
+    """Interface for receiving spans around the stages of parsing a sentence.
+
+    Implement this to bridge the parser to a tracing library such as OpenTelemetry,
+    then pass an instance to set_tracer. Spans are started and ended in the thread
+    that parses the sentence, and are nested: a span started whilst another is active
+    ends before it.
+
+    The stages that are traced are:
+
+    * ingredient_parser.preprocess: creating the PreProcessor, including normalising
+      and tokenising the sentence
+    * ingredient_parser.pos_tag: part of speech tagging
+    * ingredient_parser.sentence_features: calculating the features for each token
+    * ingredient_parser.crf_tag: labelling the tokens with the CRF model
+    * ingredient_parser.postprocess: calculating PostProcessor.parsed
+    """
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Any:
+        """Start a span.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        attributes : dict[str, Any]
+            Attributes of the stage, such as the number of tokens.
+
+        Returns
+        -------
+        Any
+            Object passed to end_span when the stage ends.
+        """
+        ...
+
+    def end_span(self, span: Any, exception: BaseException | None) -> None:
+        """End a span.
+
+        Parameters
+        ----------
+        span : Any
+            Object returned by start_span.
+        exception : BaseException | None
+            Exception raised by the stage, or None if it completed.
+        """
+        ...
+
+
+class NoOpTracer:
+    """Tracer that does nothing. This is the default tracer."""
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> None:
+        """Do nothing.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        attributes : dict[str, Any]
+            Attributes of the stage.
+        """
+
+    def end_span(self, span: Any, exception: BaseException | None) -> None:
+        """Do nothing.
+
+        Parameters
+        ----------
+        span : Any
+            Object returned by start_span.
+        exception : BaseException | None
+            Exception raised by the stage, or None if it completed.
+        """
+
+
+NO_OP_TRACER = NoOpTracer()
+_TRACER: Tracer = NO_OP_TRACER
+_NULL_CONTEXT = nullcontext()
+
+
+class _Span:
+    """Context manager that starts a span on entry and ends it on exit.
+
+    Parameters
+    ----------
+    tracer : Tracer
+        Tracer to start and end the span with.
+    name : str
+        Name of the stage.
+    attributes : dict[str, Any]
+        Attributes of the stage.
+    """
+
+    __slots__ = ("tracer", "name", "attributes", "span")
+
+    def __init__(self, tracer: Tracer, name: str, attributes: dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> None:
+        """Start the span."""
+        self.span = self.tracer.start_span(self.name, self.attributes)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """End the span. Exceptions are not suppressed."""
+        self.tracer.end_span(self.span, exc)
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Set the tracer that receives spans around the stages of parsing.
+
+    Parameters
+    ----------
+    tracer : Tracer | None
+        Tracer to use. If None, the default tracer that does nothing is restored.
+
+    Examples
+    --------
+    >>> class PrintTracer:
+    ...     def start_span(self, name, attributes):
+    ...         print("start", name, attributes)
+    ...
+    ...     def end_span(self, span, exception):
+    ...         print("end")
+    >>> set_tracer(PrintTracer())
+    """
+    global _TRACER
+    _TRACER = tracer or NO_OP_TRACER
+
+
+def get_tracer() -> Tracer:
+    """Return the tracer set by set_tracer.
+
+    Returns
+    -------
+    Tracer
+        Current tracer.
+    """
+    return _TRACER
+
+
+def span(name: str, **attributes: Any) -> ContextManager[None]:
+    """Return a context manager that traces the code run inside it.
+
+    If no tracer has been set, the context manager does nothing.
+
+    Parameters
+    ----------
+    name : str
+        Name of the stage.
+    **attributes : Any
+        Attributes of the stage.
+
+    Returns
+    -------
+    ContextManager[None]
+    """
+    if (tracer := _TRACER) is NO_OP_TRACER:
+        return _NULL_CONTEXT
+    return _Span(tracer, name, attributes)
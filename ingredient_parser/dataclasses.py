@@ -188,9 +188,14 @@ class ParserDebugInfo:
         input sentence.
     Tagger : pycrfsuite.Tagger
         CRF model tagger object.
+    timings : dict[str, float]
+        Time, in seconds, taken by each stage of parsing the sentence. Stages with a
+        dot in their name are part of the stage named before the dot, for example
+        normalise.replace_string_numbers is part of normalise.
     """
 
     sentence: str
     PreProcessor: Any
     PostProcessor: Any
     tagger: pycrfsuite.Tagger
+    timings: dict[str, float] = field(default_factory=dict)
@@ -1,10 +1,12 @@
-from .parser import inspect_parser_en, parse_ingredient_en
+from .parser import ModelCascade, inspect_parser_en, parse_ingredient_en, warmup_en
 from .postprocess import PostProcessor
 from .preprocess import PreProcessor
 
 __all__ = [
+    "ModelCascade",
     "inspect_parser_en",
     "parse_ingredient_en",
+    "warmup_en",
     "PreProcessor",
     "PostProcessor",
 ]
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
-import re
+import string
 from itertools import chain
+from types import MappingProxyType
 
 # Plural and singular units
 UNITS = {
@@ -113,6 +114,9 @@ UNITS = UNITS | _capitalized_units
 # Create a flattened list of all keys and values in UNITS dict
 # since we need this in a few places
 FLATTENED_UNITS_LIST = list(chain.from_iterable(UNITS.items()))
+# Reverse of the UNITS dict, for looking up the plural of a singular unit. Each
+# singular unit only appears once in UNITS.
+PLURAL_UNITS = {singular: plural for plural, singular in UNITS.items()}
 
 # Words that can modify a unit
 UNIT_MODIFIERS = [
@@ -132,6 +136,21 @@ UNIT_MODIFIERS = [
     "thin",
 ]
 
+# Abbreviated units that can be written with a trailing period, and the capitalised
+# version of each
+UNITS_WITH_TRAILING_PERIOD = [
+    "tsp.",
+    "tsps.",
+    "tbsp.",
+    "tbsps.",
+    "tbs.",
+    "tb.",
+    "lb.",
+    "lbs.",
+    "oz.",
+]
+UNITS_WITH_TRAILING_PERIOD.extend([u.capitalize() for u in UNITS_WITH_TRAILING_PERIOD])
+
 # Units that can be part of the name
 # e.g. 1 teaspoon ground cloves, or 5 bay leaves
 AMBIGUOUS_UNITS = [
@@ -174,13 +193,16 @@ STRING_NUMBERS = {
     "eighteen": "18",
     "nineteen": "19",
 }
-# Precompile the regular expressions for matching the string numbers
-STRING_NUMBERS_REGEXES = {}
-for s, n in STRING_NUMBERS.items():
-    # This is case insensitive so it replace e.g. "one" and "One"
-    # Only match if the string is preceded by a non-word character or is at
-    # the start of the sentence
-    STRING_NUMBERS_REGEXES[s] = (re.compile(rf"\b({s})\b", flags=re.IGNORECASE), n)
+# String numbers that begin with another string number and a hyphen, and the string
+# number they begin with e.g. one-half begins with one
+STRING_NUMBER_PREFIXES = {
+    s: prefix
+    for s in STRING_NUMBERS
+    for prefix in STRING_NUMBERS
+    if s.startswith(prefix + "-")
+}
+# String numbers in the order of the capture groups of STRING_NUMBER_PATTERN in _regex
+STRING_NUMBER_KEYS = tuple(STRING_NUMBERS)
 
 # Unicode fractions and their replacements as fake fractions
 # Most of the time we need to insert a space in front of the replacement so we don't
@@ -220,197 +242,379 @@ UNICODE_FRACTIONS = {
     "\xbd": " 1/2",
 }
 
+# Translation table to replace en-dashes with hyphens and em-dashes with hyphens
+# surrounded by spaces
+EN_EM_DASHES = str.maketrans({"\u2013": "-", "\u2014": " - "})
+
 # Stop words - high frequency grammatical words
 # Taken from nltk.corpus.stopwords
-STOP_WORDS = {
-    "i",
-    "me",
-    "my",
-    "myself",
-    "we",
-    "our",
-    "ours",
-    "ourselves",
-    "you",
-    "you're",
-    "you've",
-    "you'll",
-    "you'd",
-    "your",
-    "yours",
-    "yourself",
-    "yourselves",
-    "he",
-    "him",
-    "his",
-    "himself",
-    "she",
-    "she's",
-    "her",
-    "hers",
-    "herself",
-    "it",
-    "it's",
-    "its",
-    "itself",
-    "they",
-    "them",
-    "their",
-    "theirs",
-    "themselves",
-    "what",
-    "which",
-    "who",
-    "whom",
-    "this",
-    "that",
-    "that'll",
-    "these",
-    "those",
-    "am",
-    "is",
-    "are",
-    "was",
-    "were",
-    "be",
-    "been",
-    "being",
-    "have",
-    "has",
-    "had",
-    "having",
-    "do",
-    "does",
-    "did",
-    "doing",
-    "a",
-    "an",
-    "the",
-    "and",
-    "but",
-    "if",
-    "or",
-    "because",
-    "as",
-    "until",
-    "while",
-    "of",
-    "at",
-    "by",
-    "for",
-    "with",
-    "about",
-    "against",
-    "between",
-    "into",
-    "through",
-    "during",
-    "before",
-    "after",
-    "above",
-    "below",
-    "to",
-    "from",
-    "up",
-    "down",
-    "in",
-    "out",
-    "on",
-    "off",
-    "over",
-    "under",
-    "again",
-    "further",
-    "then",
-    "once",
-    "here",
-    "there",
-    "when",
-    "where",
-    "why",
-    "how",
-    "all",
-    "any",
-    "both",
-    "each",
-    "few",
-    "more",
-    "most",
-    "other",
-    "some",
-    "such",
-    "no",
-    "nor",
-    "not",
-    "only",
-    "own",
-    "same",
-    "so",
-    "than",
-    "too",
-    "very",
-    "s",
-    "t",
-    "can",
-    "will",
-    "just",
-    "don",
-    "don't",
-    "should",
-    "should've",
-    "now",
-    "d",
-    "ll",
-    "m",
-    "o",
-    "re",
-    "ve",
-    "y",
-    "ain",
-    "aren",
-    "aren't",
-    "couldn",
-    "couldn't",
-    "didn",
-    "didn't",
-    "doesn",
-    "doesn't",
-    "hadn",
-    "hadn't",
-    "hasn",
-    "hasn't",
-    "haven",
-    "haven't",
-    "isn",
-    "isn't",
-    "ma",
-    "mightn",
-    "mightn't",
-    "mustn",
-    "mustn't",
-    "needn",
-    "needn't",
-    "shan",
-    "shan't",
-    "shouldn",
-    "shouldn't",
-    "wasn",
-    "wasn't",
-    "weren",
-    "weren't",
-    "won",
-    "won't",
-    "wouldn",
-    "wouldn't",
-}
+STOP_WORDS = frozenset(
+    {
+        "i",
+        "me",
+        "my",
+        "myself",
+        "we",
+        "our",
+        "ours",
+        "ourselves",
+        "you",
+        "you're",
+        "you've",
+        "you'll",
+        "you'd",
+        "your",
+        "yours",
+        "yourself",
+        "yourselves",
+        "he",
+        "him",
+        "his",
+        "himself",
+        "she",
+        "she's",
+        "her",
+        "hers",
+        "herself",
+        "it",
+        "it's",
+        "its",
+        "itself",
+        "they",
+        "them",
+        "their",
+        "theirs",
+        "themselves",
+        "what",
+        "which",
+        "who",
+        "whom",
+        "this",
+        "that",
+        "that'll",
+        "these",
+        "those",
+        "am",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "having",
+        "do",
+        "does",
+        "did",
+        "doing",
+        "a",
+        "an",
+        "the",
+        "and",
+        "but",
+        "if",
+        "or",
+        "because",
+        "as",
+        "until",
+        "while",
+        "of",
+        "at",
+        "by",
+        "for",
+        "with",
+        "about",
+        "against",
+        "between",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "to",
+        "from",
+        "up",
+        "down",
+        "in",
+        "out",
+        "on",
+        "off",
+        "over",
+        "under",
+        "again",
+        "further",
+        "then",
+        "once",
+        "here",
+        "there",
+        "when",
+        "where",
+        "why",
+        "how",
+        "all",
+        "any",
+        "both",
+        "each",
+        "few",
+        "more",
+        "most",
+        "other",
+        "some",
+        "such",
+        "no",
+        "nor",
+        "not",
+        "only",
+        "own",
+        "same",
+        "so",
+        "than",
+        "too",
+        "very",
+        "s",
+        "t",
+        "can",
+        "will",
+        "just",
+        "don",
+        "don't",
+        "should",
+        "should've",
+        "now",
+        "d",
+        "ll",
+        "m",
+        "o",
+        "re",
+        "ve",
+        "y",
+        "ain",
+        "aren",
+        "aren't",
+        "couldn",
+        "couldn't",
+        "didn",
+        "didn't",
+        "doesn",
+        "doesn't",
+        "hadn",
+        "hadn't",
+        "hasn",
+        "hasn't",
+        "haven",
+        "haven't",
+        "isn",
+        "isn't",
+        "ma",
+        "mightn",
+        "mightn't",
+        "mustn",
+        "mustn't",
+        "needn",
+        "needn't",
+        "shan",
+        "shan't",
+        "shouldn",
+        "shouldn't",
+        "wasn",
+        "wasn't",
+        "weren",
+        "weren't",
+        "won",
+        "won't",
+        "wouldn",
+        "wouldn't",
+    }
+)
 
 # Tokens that indicate an quantity is approximate
-APPROXIMATE_TOKENS = [
-    "about",
-    "approx",
-    "approximately",
-    "nearly",
-    "roughly",
-]
+APPROXIMATE_TOKENS = frozenset(
+    [
+        "about",
+        "approx",
+        "approximately",
+        "nearly",
+        "roughly",
+    ]
+)
 # Tokens that indicate an amount is singular
-SINGULAR_TOKENS = ["each"]
+SINGULAR_TOKENS = frozenset(["each"])
+
+
+# Frozen sets of the lexicon above, for constant time membership tests
+UNITS_SET = frozenset(FLATTENED_UNITS_LIST)
+SINGULAR_UNITS_SET = frozenset(UNITS.values())
+AMBIGUOUS_UNITS_SET = frozenset(AMBIGUOUS_UNITS)
+# Every substring of string.punctuation, because a token is punctuation if it is a
+# substring of string.punctuation
+PUNCTUATION_SET = frozenset(
+    string.punctuation[i:j]
+    for i in range(len(string.punctuation) + 1)
+    for j in range(i, len(string.punctuation) + 1)
+)
+# Strings other than digits that float() accepts, ignoring case and sign
+_FLOAT_WORDS = frozenset(["nan", "inf", "infinity"])
+
+# Flags returned by token_flags
+IS_UNIT = 1
+IS_AMBIGUOUS_UNIT = 2
+IS_PUNC = 4
+IS_NUMERIC = 8
+IS_STOP_WORD = 16
+IS_APPROXIMATE = 32
+IS_SINGULAR = 64
+
+
+def _is_float(token: str) -> bool:
+    """Return True if token can be converted to a float.
+
+    Tokens without any digits are rejected without calling float(), unless they are
+    one of the special values float() accepts, such as "nan".
+
+    Parameters
+    ----------
+    token : str
+        Token to check
+
+    Returns
+    -------
+    bool
+        True if token can be converted to a float, else False
+    """
+    if (
+        not any(char.isdigit() for char in token)
+        and token.strip().lower().lstrip("+-") not in _FLOAT_WORDS
+    ):
+        return False
+
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_numeric(token: str) -> bool:
+    """Return True if token is numeric.
+
+    A token is numeric if it can be converted to a float, is a range of numeric
+    tokens separated by hyphens, is a float followed by "x", or is "dozen".
+
+    Parameters
+    ----------
+    token : str
+        Token to check
+
+    Returns
+    -------
+    bool
+        True if token is numeric, else False
+    """
+    if "-" in token:
+        return all(_is_numeric(part) for part in token.split("-"))
+
+    if token == "dozen":
+        return True
+
+    if token.endswith("x"):
+        return _is_float(token[:-1])
+
+    return _is_float(token)
+
+
+def _classify_token(token: str) -> int:
+    """Return the flags for each part of the lexicon the token belongs to.
+
+    Parameters
+    ----------
+    token : str
+        Token to classify
+
+    Returns
+    -------
+    int
+        Bitwise OR of the IS_* flags that apply to token
+    """
+    lower = token.lower()
+    flags = 0
+    if lower in SINGULAR_UNITS_SET:
+        flags |= IS_UNIT
+    if token in AMBIGUOUS_UNITS_SET:
+        flags |= IS_AMBIGUOUS_UNIT
+    if token in PUNCTUATION_SET:
+        flags |= IS_PUNC
+    if _is_numeric(token):
+        flags |= IS_NUMERIC
+    if token in STOP_WORDS:
+        flags |= IS_STOP_WORD
+    if lower in APPROXIMATE_TOKENS:
+        flags |= IS_APPROXIMATE
+    if lower in SINGULAR_TOKENS:
+        flags |= IS_SINGULAR
+    return flags
+
+
+# Flags for every token in the lexicon, generated once at import
+TOKEN_FLAGS = MappingProxyType(
+    {
+        token: _classify_token(token)
+        for token in chain(
+            FLATTENED_UNITS_LIST,
+            AMBIGUOUS_UNITS,
+            PUNCTUATION_SET,
+            STRING_NUMBERS,
+            STOP_WORDS,
+            APPROXIMATE_TOKENS,
+            SINGULAR_TOKENS,
+        )
+    }
+)
+
+# Maximum number of tokens not in TOKEN_FLAGS to remember the flags of
+TOKEN_FLAGS_MEMO_SIZE = 16384
+_TOKEN_FLAGS_MEMO: dict[str, int] = {}
+
+
+def token_flags(token: str) -> int:
+    """Return the flags for each part of the lexicon the token belongs to.
+
+    Tokens in the lexicon are looked up in TOKEN_FLAGS. The flags for any other token
+    are calculated the first time it is seen and remembered, until
+    TOKEN_FLAGS_MEMO_SIZE other tokens have been seen.
+
+    Parameters
+    ----------
+    token : str
+        Token to look up
+
+    Returns
+    -------
+    int
+        Bitwise OR of the IS_* flags that apply to token
+
+    Examples
+    --------
+    >>> token_flags("cup") & IS_UNIT
+    1
+
+    >>> bool(token_flags("1-2") & IS_NUMERIC)
+    True
+
+    >>> token_flags("beef")
+    0
+    """
+    if (flags := TOKEN_FLAGS.get(token)) is not None:
+        return flags
+
+    if (flags := _TOKEN_FLAGS_MEMO.get(token)) is None:
+        flags = _classify_token(token)
+        if len(_TOKEN_FLAGS_MEMO) >= TOKEN_FLAGS_MEMO_SIZE:
+            _TOKEN_FLAGS_MEMO.clear()
+        _TOKEN_FLAGS_MEMO[token] = flags
+
+    return flags
@@ -2,30 +2,85 @@
 
 import re
 
-from ._constants import FLATTENED_UNITS_LIST
+from ._constants import (
+    FLATTENED_UNITS_LIST,
+    PLURAL_UNITS,
+    STRING_NUMBERS,
+    UNICODE_FRACTIONS,
+    UNITS_WITH_TRAILING_PERIOD,
+)
+
+# Patterns are compiled the first time they are accessed as attributes of this
+# module, instead of when it is imported. Some of them are large alternations of all
+# units, which are slow to compile.
+# Each entry maps the attribute name to the pattern and flags to compile it with.
+_PATTERNS: dict[str, tuple[str, int]] = {}
 
 # Regex pattern for fraction parts.
 # Matches 0+ numbers followed by 0+ white space characters followed by a number then
 # a forward slash then another number.
-FRACTION_PARTS_PATTERN = re.compile(r"(\d*\s*\d/\d+)")
+_PATTERNS["FRACTION_PARTS_PATTERN"] = (r"(\d*\s*\d/\d+)", 0)
+
+# Regex pattern for any digit.
+_PATTERNS["DIGIT_PATTERN"] = (r"\d", 0)
+
+# Regex pattern for any string number in STRING_NUMBERS, as a whole word and in any
+# case. Each string number is captured by its own group, in the same order as
+# STRING_NUMBERS, so match.lastindex - 1 is the index of the matched string number.
+# The lookahead for the first letter of any string number quickly rejects positions
+# where none of them can match.
+_string_number_first_chars = "".join(sorted({s[0] for s in STRING_NUMBERS}))
+_PATTERNS["STRING_NUMBER_PATTERN"] = (
+    rf"\b(?=[{_string_number_first_chars}])"
+    rf"(?:{'|'.join(f'({s})' for s in STRING_NUMBERS)})\b",
+    re.IGNORECASE,
+)
+
+# Regex pattern for any unicode fraction, including the preceding hyphen if there is
+# one. The match is a key of UNICODE_FRACTIONS.
+_unicode_fractions = "".join(f for f in UNICODE_FRACTIONS if not f.startswith("-"))
+_PATTERNS["UNICODE_FRACTION_PATTERN"] = (rf"-?[{_unicode_fractions}]", 0)
+
+# Regex pattern for any unit in UNITS_WITH_TRAILING_PERIOD.
+_PATTERNS["UNIT_TRAILING_PERIOD_PATTERN"] = (
+    "|".join(re.escape(unit) for unit in UNITS_WITH_TRAILING_PERIOD),
+    0,
+)
 
 # Regex pattern for checking if token starts with a capital letter.
-CAPITALISED_PATTERN = re.compile(r"^[A-Z]")
+_PATTERNS["CAPITALISED_PATTERN"] = (r"^[A-Z]", 0)
 
 # Regex pattern for finding quantity and units without space between them.
 # Add additional strings to units list that aren't necessarily units, but we want to
 # treat them like units for the purposes of splitting quantities from units.
 units_list = FLATTENED_UNITS_LIST + ["in", "x"]
-QUANTITY_UNITS_PATTERN = re.compile(rf"(\d)\-?({'|'.join(units_list)})")
-UNITS_QUANTITY_PATTERN = re.compile(rf"({'|'.join(units_list)})(\d)")
-UNITS_HYPHEN_QUANTITY_PATTERN = re.compile(rf"({'|'.join(units_list)})\-(\d)")
+_PATTERNS["QUANTITY_UNITS_PATTERN"] = (rf"(\d)\-?({'|'.join(units_list)})", 0)
+_PATTERNS["UNITS_QUANTITY_PATTERN"] = (rf"({'|'.join(units_list)})(\d)", 0)
+_PATTERNS["UNITS_HYPHEN_QUANTITY_PATTERN"] = (rf"({'|'.join(units_list)})\-(\d)", 0)
+
+# Prefilter patterns for the three patterns above. Each only matches the characters
+# either side of the boundary between quantity and unit, so is much faster to search
+# for, and any sentence the full pattern matches is also matched by its prefilter.
+_first_chars = "".join(sorted({unit[0] for unit in units_list}))
+_last_chars = "".join(sorted({unit[-1] for unit in units_list}))
+_PATTERNS["QUANTITY_UNITS_PREFILTER"] = (rf"\d\-?[{_first_chars}]", 0)
+_PATTERNS["UNITS_QUANTITY_PREFILTER"] = (rf"[{_last_chars}]\d", 0)
+_PATTERNS["UNITS_HYPHEN_QUANTITY_PREFILTER"] = (rf"[{_last_chars}]\-\d", 0)
+
+# Regex pattern for any singular unit, as a whole word. The match is a key of
+# PLURAL_UNITS. Longer units are first so fewer alternatives are tried before a
+# match.
+_PATTERNS["SINGULAR_UNITS_PATTERN"] = (
+    rf"\b(?:{'|'.join(sorted(PLURAL_UNITS, key=len, reverse=True))})\b",
+    0,
+)
 
 # Regex pattern for matching a range in string format e.g. 1 to 2, 8.5 to 12, 4 or 5.
 # Assumes fake fractions and unicode fraction have already been replaced.
 # Allows the range to include a hyphen, which are captured in separate groups.
 # Captures the two number in the range in separate capture groups.
 # If a number starts with a zero, it must be followed by decimal point to be matched
-STRING_RANGE_PATTERN = re.compile(
+_PATTERNS["STRING_RANGE_PATTERN"] = (
     r"""
     (0\.[0-9]|[1-9][\d\.]*?)  # Capture number. Leading zero must be followed by '.'
     \s*                       # Optional space
@@ -45,7 +100,7 @@ STRING_RANGE_PATTERN = re.compile(
 
 # Regex pattern to match quantities split by "and" e.g. 1 and 1/2.
 # Capture the whole match, and the quantites before and after the "and".
-FRACTION_SPLIT_AND_PATTERN = re.compile(r"((\d+)\sand\s(\d/\d+))")
+_PATTERNS["FRACTION_SPLIT_AND_PATTERN"] = (r"((\d+)\sand\s(\d/\d+))", 0)
 
 # Regex pattern to match ranges where the unit appears after both quantities e.g.
 # 100 g - 200 g. This assumes the quantites and units have already been seperated
@@ -55,7 +110,7 @@ FRACTION_SPLIT_AND_PATTERN = re.compile(r"((\d+)\sand\s(\d/\d+))")
 #   <quantity> <unit> to <quantity> <unit>
 #   <quantity> <unit> or <quantity> <unit>
 # returning the full match and each quantity and unit as capture groups.
-DUPE_UNIT_RANGES_PATTERN = re.compile(
+_PATTERNS["DUPE_UNIT_RANGES_PATTERN"] = (
     r"""
     (
         ([\d\.]+)    # Capture decimal number
@@ -74,7 +129,7 @@ DUPE_UNIT_RANGES_PATTERN = re.compile(
 
 # Regex pattern to match a decimal number followed by an "x" followed by a space
 # e.g. 0.5 x, 1 x, 2 x. The number is captured in a capture group.
-QUANTITY_X_PATTERN = re.compile(
+_PATTERNS["QUANTITY_X_PATTERN"] = (
     r"""
     ([\d\.]+)   # Capture decimal number
     \s          # Space
@@ -86,4 +141,33 @@ QUANTITY_X_PATTERN = re.compile(
 
 # Regex pattern to match a range that has spaces between the numbers and hyphen
 # e.g. 0.5 - 1. The numbers are captured in capture groups.
-EXPANDED_RANGE = re.compile(r"(\d)\s*\-\s*(\d)")
+_PATTERNS["EXPANDED_RANGE"] = (r"(\d)\s*\-\s*(\d)", 0)
+
+
+def __getattr__(name: str) -> re.Pattern:
+    """Compile pattern the first time it is accessed.
+
+    Parameters
+    ----------
+    name : str
+        Name of pattern.
+
+    Returns
+    -------
+    re.Pattern
+        Compiled pattern.
+    """
+    if name not in _PATTERNS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    pattern = re.compile(*_PATTERNS[name])
+    # Store the compiled pattern as a module global, so __getattr__ isn't called for
+    # it again.
+    globals()[name] = pattern
+    return pattern
+
+
+def compile_patterns() -> None:
+    """Compile all patterns that have not been compiled yet."""
+    for name in _PATTERNS:
+        __getattr__(name)
@@ -1,17 +1,16 @@
 #!/usr/bin/env python3
 
 import re
-from functools import lru_cache
+import threading
 from itertools import chain
+from typing import Any
 
 import pint
-from nltk.stem.porter import PorterStemmer
 
 from .._common import is_float, is_range
-from ..dataclasses import IngredientAmount
-from ._constants import UNITS
-
-UREG = pint.UnitRegistry()
+from ..dataclasses import CompositeIngredientAmount, IngredientAmount, ParsedIngredient
+from . import _regex
+from ._constants import PLURAL_UNITS
 
 # Dict mapping certain units to their imperial version in pint
 IMPERIAL_UNITS = {
@@ -23,8 +22,67 @@ IMPERIAL_UNITS = {
     "gallon": "imperial_gallon",
 }
 
+# The unit registry and stemmer are slow to create (or import), so they are created
+# the first time they are used instead of when this module is imported. They are
+# accessed as the UREG and STEMMER attributes of this module through __getattr__.
+_LAZY_LOCK = threading.Lock()
+_LAZY: dict[str, Any] = {}
+
+
+def _unit_registry() -> pint.UnitRegistry:
+    """Return the unit registry, creating it if it has not been created yet.
+
+    Returns
+    -------
+    pint.UnitRegistry
+        Unit registry used for all pint.Unit objects.
+    """
+    if (ureg := _LAZY.get("UREG")) is None:
+        with _LAZY_LOCK:
+            # Only one registry must ever be created, because units from different
+            # registries cannot be compared.
+            if (ureg := _LAZY.get("UREG")) is None:
+                ureg = _LAZY["UREG"] = pint.UnitRegistry()
+    return ureg
+
+
+def _stemmer() -> Any:
+    """Return the Porter stemmer, creating it if it has not been created yet.
+
+    Returns
+    -------
+    nltk.stem.porter.PorterStemmer
+        Stemmer used by stem().
+    """
+    if (stemmer := _LAZY.get("STEMMER")) is None:
+        # Importing nltk is slow, so only do it when the stemmer is needed.
+        from nltk.stem.porter import PorterStemmer
+
+        with _LAZY_LOCK:
+            if (stemmer := _LAZY.get("STEMMER")) is None:
+                stemmer = _LAZY["STEMMER"] = PorterStemmer()
+    return stemmer
+
+
+def __getattr__(name: str) -> Any:
+    """Create UREG and STEMMER the first time they are accessed.
+
+    Parameters
+    ----------
+    name : str
+        Name of attribute.
+
+    Returns
+    -------
+    Any
+        Value of attribute.
+    """
+    if name == "UREG":
+        return _unit_registry()
+    if name == "STEMMER":
+        return _stemmer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-STEMMER = PorterStemmer()
 
 # Define regular expressions used by tokenizer.
 # Matches one or more whitespace characters
@@ -83,7 +141,14 @@ def tokenize(sentence: str) -> list[str]:
     return [tok for tok in chain.from_iterable(tokens) if tok]
 
 
-@lru_cache(maxsize=512)
+# Maximum number of stems cached by stem() in each thread
+STEM_CACHE_SIZE = 512
+
+# Each thread has its own stem cache so that threads never contend on, or modify, a
+# shared cache.
+_STEM_CACHE = threading.local()
+
+
 def stem(token: str) -> str:
     """Stem function with cache to improve performance.
 
@@ -91,6 +156,9 @@ def stem(token: str) -> str:
     cache the result the first time and return that for subsequent future calls
     without the need to do all the processing again.
 
+    The cache is kept separately for each thread and is emptied when it reaches
+    STEM_CACHE_SIZE entries.
+
     Parameters
     ----------
     token : str
@@ -101,7 +169,17 @@ def stem(token: str) -> str:
     str
         Stem of token
     """
-    return STEMMER.stem(token)
+    try:
+        cache = _STEM_CACHE.stems
+    except AttributeError:
+        cache = _STEM_CACHE.stems = {}
+
+    if (stemmed := cache.get(token)) is None:
+        if len(cache) >= STEM_CACHE_SIZE:
+            cache.clear()
+        stemmed = cache[token] = _stemmer().stem(token)
+
+    return stemmed
 
 
 def pluralise_units(sentence: str) -> str:
@@ -131,13 +209,41 @@ def pluralise_units(sentence: str) -> str:
     >>> pluralise_units("1.5 loaf bread")
     '1.5 loaves bread'
     """
-    for plural, singular in UNITS.items():
-        sentence = re.sub(rf"\b({singular})\b", f"{plural}", sentence)
+    return _regex.SINGULAR_UNITS_PATTERN.sub(
+        lambda match: PLURAL_UNITS[match.group()], sentence
+    )
+
+
+# Maximum number of units cached for each unit registry by convert_to_pint_unit()
+PINT_UNITS_CACHE_SIZE = 1024
+
+# Result of converting each unit, keyed by unit registry then unit.
+# The cached pint.Unit objects hold a reference to their registry, so the entries for
+# a registry are only removed by clear_pint_unit_cache().
+_PINT_UNITS: dict[pint.UnitRegistry, dict[str, str | pint.Unit]] = {}
+_PINT_UNITS_LOCK = threading.Lock()
+
+
+def clear_pint_unit_cache(unit_registry: pint.UnitRegistry) -> None:
+    """Remove the units cached by convert_to_pint_unit() for a unit registry.
 
-    return sentence
+    This releases the reference to the unit registry held by the cache, allowing it
+    to be garbage collected.
+
+    Parameters
+    ----------
+    unit_registry : pint.UnitRegistry
+        Unit registry to remove cached units for.
+    """
+    with _PINT_UNITS_LOCK:
+        _PINT_UNITS.pop(unit_registry, None)
 
 
-def convert_to_pint_unit(unit: str, imperial_units: bool = False) -> str | pint.Unit:
+def convert_to_pint_unit(
+    unit: str,
+    imperial_units: bool = False,
+    unit_registry: pint.UnitRegistry | None = None,
+) -> str | pint.Unit:
     """Convert a unit to a pint.Unit object, if possible.
 
     If the unit is not found in the pint Unit Registry, just return the input unit.
@@ -150,6 +256,9 @@ def convert_to_pint_unit(unit: str, imperial_units: bool = False) -> str | pint.
         If True, use imperial units instead of US customary units for the following:
         fluid ounce, cup, pint, quart, gallon.
         Default is False, which results in US customary units being used.
+    unit_registry : pint.UnitRegistry | None, optional
+        Unit registry to create pint.Unit objects from.
+        If None, the package unit registry (UREG) is used.
 
     Returns
     -------
@@ -190,12 +299,58 @@ def convert_to_pint_unit(unit: str, imperial_units: bool = False) -> str | pint.
         for original, replacement in IMPERIAL_UNITS.items():
             unit = unit.replace(original, replacement)
 
-    # If unit not empty string and found in Unit Registry,
-    # return pint.Unit object for unit
-    if unit != "" and unit in UREG:
-        return UREG(unit).units
+    if unit == "":
+        return unit
+
+    # Looking up a unit in a registry modifies the registry's internal caches, so the
+    # result of each lookup is stored and lookups are only done whilst holding
+    # _PINT_UNITS_LOCK. This allows the registry to be used from multiple threads.
+    ureg = unit_registry or _unit_registry()
+    units = _PINT_UNITS.get(ureg, {})
+    if (pint_unit := units.get(unit)) is None:
+        with _PINT_UNITS_LOCK:
+            units = _PINT_UNITS.setdefault(ureg, {})
+            if (pint_unit := units.get(unit)) is None:
+                # If unit found in Unit Registry, return pint.Unit object for unit
+                pint_unit = ureg(unit).units if unit in ureg else unit
+                if len(units) >= PINT_UNITS_CACHE_SIZE:
+                    units.clear()
+                units[unit] = pint_unit
+
+    return pint_unit
+
+
+def reregister_units(parsed: ParsedIngredient) -> ParsedIngredient:
+    """Replace pint.Unit objects from another unit registry with ones from UREG.
+
+    pint.Unit objects are unpickled into pint's application registry, which is not
+    the same as UREG. Units from different registries cannot be compared or combined,
+    so any ParsedIngredient objects returned from another process need their units
+    converting back.
+
+    The ParsedIngredient object is modified in place.
+
+    Parameters
+    ----------
+    parsed : ParsedIngredient
+        Parsed ingredient, possibly with units from another registry
+
+    Returns
+    -------
+    ParsedIngredient
+        Parsed ingredient, with all pint.Unit objects from UREG
+    """
+    for amount in parsed.amount:
+        if isinstance(amount, CompositeIngredientAmount):
+            amounts = amount.amounts
+        else:
+            amounts = [amount]
+
+        for am in amounts:
+            if isinstance(am.unit, pint.Unit):
+                am.unit = _unit_registry().Unit(str(am.unit))
 
-    return unit
+    return parsed
 
 
 def ingredient_amount_factory(
@@ -208,6 +363,7 @@ def ingredient_amount_factory(
     SINGULAR: bool = False,
     string_units: bool = False,
     imperial_units: bool = False,
+    unit_registry: pint.UnitRegistry | None = None,
 ) -> IngredientAmount:
     """Create ingredient amount object from parts.
 
@@ -245,6 +401,9 @@ def ingredient_amount_factory(
         for the the following units: fluid ounce, cup, pint, quart, gallon.
         Default is False, which results in US customary units being used.
         This has no effect if string_units=True.
+    unit_registry : pint.UnitRegistry | None, optional
+        Unit registry to create pint.Unit objects from.
+        If None, the package unit registry (UREG) is used.
 
     Returns
     -------
@@ -282,7 +441,7 @@ def ingredient_amount_factory(
         # a pint.Unit object instead of a string. This has the benefit
         # of simplifying alternative unit representations into a single
         # common representation
-        _unit = convert_to_pint_unit(_unit, imperial_units)
+        _unit = convert_to_pint_unit(_unit, imperial_units, unit_registry)
 
     # Pluralise unit as necessary
     if _quantity != 1 and _quantity != "" and not RANGE:
@@ -1,34 +1,630 @@
 #!/usr/bin/env python3
 
+import hashlib
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import cached_property, partial
 from importlib.resources import as_file, files
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple, Sequence
 
+import pint
 import pycrfsuite
 
-from .._common import group_consecutive_idx
+from .._cache import LABEL_CACHE, NORMALISED_CACHE, LRUCache, copy_parsed_ingredient
+from .._common import download_nltk_resources, group_consecutive_idx
+from .._metrics import METRICS
+from .._timing import (
+    NULL_TIMER,
+    NullTimer,
+    StageTimer,
+    new_timer,
+    report_timings,
+)
+from .._tracing import span
 from ..dataclasses import ParsedIngredient, ParserDebugInfo
-from ._utils import pluralise_units
+from . import _utils
+from ._regex import compile_patterns
+from ._utils import pluralise_units, stem
 from .postprocess import PostProcessor
 from .preprocess import PreProcessor
 
-# Create TAGGER object that can be reused between function calls
-# We only want to load the model into TAGGER once, but only do it
-# when we need to (from parse_ingredient() or inspect_parser()) and
-# not whenever anything from ingredient_parser is imported.
-TAGGER = pycrfsuite.Tagger()
+# File names of models shipped with this package
+SHIPPED_MODELS = (
+    "model.6k.en.crfsuite",
+    "model.15k.en.crfsuite",
+    "model.original.en.crfsuite",
+)
+DEFAULT_MODEL = "model.6k.en.crfsuite"
 
 
-def load_model_if_not_loaded():
-    """Load model into TAGGER variable if not loaded.
+class TaggerPool:
+    """Bounded pool of CRF model taggers.
 
-    There isn't a simple way to check if the model if loaded or not, so
-    we try to call TAGGER.info() which will raise a RuntimeError if the
-    model is not loaded yet.
+    A pycrfsuite.Tagger object holds the state of the last sentence it tagged, which
+    is used to calculate the marginal probabilities of the labels. This means a single
+    Tagger cannot be shared between threads, because one thread could tag a sentence
+    whilst another is calculating the marginals for a different sentence.
+
+    Instead, each parse checks out a Tagger from the pool for its exclusive use and
+    returns it to the pool when finished. Taggers are only created (and the model
+    loaded into them) when needed, up to a maximum of size Taggers. If all Taggers are
+    in use and the maximum has been reached, checking out a Tagger blocks until one
+    is returned to the pool.
+
+    Parameters
+    ----------
+    model : str
+        File name of model shipped with this package, or path to model file.
+    size : int, optional
+        Maximum number of taggers in the pool.
+        Default is the number of CPUs.
+
+    Attributes
+    ----------
+    model : str
+        File name of model shipped with this package, or path to model file.
+    size : int
+        Maximum number of taggers in the pool.
+    """
+
+    def __init__(self, model: str, size: int | None = None):
+        self.model = model
+        self.size = size or os.cpu_count() or 1
+        self._idle: queue.LifoQueue[pycrfsuite.Tagger] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """__repr__ method.
+
+        Returns
+        -------
+        str
+            String representation of initialised object
+        """
+        return f'TaggerPool("{self.model}", size={self.size})'
+
+    @contextmanager
+    def checkout(self) -> Iterator[pycrfsuite.Tagger]:
+        """Check out a Tagger from the pool for exclusive use.
+
+        Yields
+        ------
+        pycrfsuite.Tagger
+            Tagger with model loaded.
+        """
+        tagger = self._acquire()
+        try:
+            yield tagger
+        finally:
+            self._idle.put(tagger)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """SHA-256 hash of the model file.
+
+        This identifies the exact model used, so it changes if the model file is
+        retrained even if the file name stays the same.
+
+        Returns
+        -------
+        str
+            Hex digest of the model file hash.
+        """
+        with self._model_path() as p:
+            model_bytes = p.read_bytes()
+        return hashlib.sha256(model_bytes).hexdigest()
+
+    def close(self) -> None:
+        """Discard the idle Taggers in the pool, releasing their models.
+
+        Taggers that are checked out are returned to the pool as normal. If the pool is
+        used again, new Taggers are created as needed.
+        """
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._created -= 1
+
+    def new_tagger(self) -> pycrfsuite.Tagger:
+        """Create a new Tagger with the model loaded, that is not part of the pool.
+
+        Returns
+        -------
+        pycrfsuite.Tagger
+            Tagger with model loaded.
+        """
+        tagger = pycrfsuite.Tagger()
+        with self._model_path() as p:
+            tagger.open(str(p))
+        return tagger
+
+    def label(
+        self,
+        features: list[dict[str, str | bool]],
+        timer: StageTimer | NullTimer | None = None,
+    ) -> tuple[list[str], list[float], tuple[float, ...] | None]:
+        """Label the tokens in a sentence using a Tagger from the pool.
+
+        Parameters
+        ----------
+        features : list[dict[str, str | bool]]
+            Features for each token in the sentence.
+        timer : StageTimer | NullTimer | None, optional
+            Timer to record the time taken to tag the sentence and calculate the
+            marginals with.
+
+        Returns
+        -------
+        list[str], list[float], tuple[float, ...] | None
+            Label and score for each token, and the confidence of each token being
+            NAME if no tokens were labelled NAME, otherwise None.
+        """
+        with self.checkout() as tagger:
+            return label_sentence(tagger, features, timer)
+
+    @contextmanager
+    def _model_path(self) -> Iterator[Path]:
+        """Return path to model file.
+
+        Models shipped with this package may not be files on disk (e.g. if the package
+        is installed as a zip file), in which case a temporary file is used.
+
+        Yields
+        ------
+        Path
+            Path to model file.
+        """
+        if self.model in SHIPPED_MODELS:
+            with as_file(files(__package__) / self.model) as p:
+                yield p
+        else:
+            yield Path(self.model)
+
+    def _acquire(self) -> pycrfsuite.Tagger:
+        """Get an idle Tagger, creating one if there are none and the pool isn't full.
+
+        Returns
+        -------
+        pycrfsuite.Tagger
+            Tagger with model loaded.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+
+        if create:
+            try:
+                return self.new_tagger()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        # Pool is full, so wait for a Tagger to be returned.
+        return self._idle.get()
+
+
+# Create TAGGER_POOL object for the default model that can be reused between function
+# calls. Taggers are only created, and the model loaded into them, when they are
+# needed (from parse_ingredient() or inspect_parser()) and not whenever anything from
+# ingredient_parser is imported.
+TAGGER_POOL = TaggerPool(DEFAULT_MODEL)
+
+# Registry of TaggerPool for each model that has been used, so that multiple models
+# can be loaded at the same time.
+_TAGGER_POOLS = {DEFAULT_MODEL: TAGGER_POOL}
+_TAGGER_POOLS_LOCK = threading.Lock()
+
+
+class CascadeInfo(NamedTuple):
+    """Statistics for a ModelCascade.
+
+    Attributes
+    ----------
+    sentences : int
+        Number of sentences labelled.
+    escalated : int
+        Number of sentences that were labelled by more than the first model.
+    labelled_by : dict[str, int]
+        Number of sentences whose labels were returned from each model.
+    """
+
+    sentences: int
+    escalated: int
+    labelled_by: dict[str, int]
+
+
+class ModelCascade:
+    """Label sentences with a fast model, only using slower models when not confident.
+
+    Each sentence is labelled with the first model. If the lowest score of any token
+    is below min_score, or the mean score of the tokens is below mean_score, the
+    sentence is labelled again with the next model, and so on. The labels from the
+    last model are always used.
+
+    Most sentences are labelled confidently by the first model, so this gives close
+    to the accuracy of the larger models at close to the cost of the smallest.
+
+    A ModelCascade can be passed as the model argument to any of the parsing
+    functions. The statistics are only kept for sentences labelled in this process,
+    so they do not include sentences parsed in worker processes or sentences with
+    labels returned from a cache.
+
+    Parameters
+    ----------
+    models : Sequence[str], optional
+        Models to use, in the order they are tried. Each is the file name of a model
+        shipped with this package or the path to a model file.
+        Default is the 6k model followed by the 15k model.
+    min_score : float, optional
+        Sentences where the score of any token is below this are escalated.
+        Default is 0.5.
+    mean_score : float, optional
+        Sentences where the mean score of the tokens is below this are escalated.
+        Default is 0.8.
+
+    Attributes
+    ----------
+    models : tuple[str, ...]
+        Models used, in the order they are tried.
+    min_score : float
+        Sentences where the score of any token is below this are escalated.
+    mean_score : float
+        Sentences where the mean score of the tokens is below this are escalated.
+
+    Raises
+    ------
+    ValueError
+        If no models are given, or the same model is given more than once.
+    """
+
+    def __init__(
+        self,
+        models: Sequence[str] = ("model.6k.en.crfsuite", "model.15k.en.crfsuite"),
+        min_score: float = 0.5,
+        mean_score: float = 0.8,
+    ):
+        if len(models) == 0:
+            raise ValueError("At least one model is required")
+
+        self.pools = [get_tagger_pool(model) for model in models]
+        self.models = tuple(pool.model for pool in self.pools)
+        # Models are compared after get_tagger_pool has made paths absolute, so the
+        # same model file given by different paths is also a duplicate.
+        duplicates = sorted({m for m in self.models if self.models.count(m) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate models: {', '.join(duplicates)}")
+
+        self.min_score = min_score
+        self.mean_score = mean_score
+        self._lock = threading.Lock()
+        self._labelled_by = dict.fromkeys(self.models, 0)
+
+    def __repr__(self) -> str:
+        """__repr__ method.
+
+        Returns
+        -------
+        str
+            String representation of initialised object
+        """
+        return (
+            f"ModelCascade({self.models}, min_score={self.min_score}, "
+            f"mean_score={self.mean_score})"
+        )
+
+    def __reduce__(self):
+        """Pickle using the constructor arguments, without the statistics.
+
+        This allows a ModelCascade to be sent to worker processes.
+        """
+        return (self.__class__, (self.models, self.min_score, self.mean_score))
+
+    @property
+    def model(self) -> str:
+        """Identifier for the cascade, used in cache keys.
+
+        Returns
+        -------
+        str
+            Identifier made from the models and thresholds.
+        """
+        return repr(self)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """SHA-256 hash of the model file hashes and thresholds.
+
+        Returns
+        -------
+        str
+            Hex digest of the hash.
+        """
+        parts = [pool.fingerprint for pool in self.pools]
+        parts.extend([str(self.min_score), str(self.mean_score)])
+        return hashlib.sha256(" ".join(parts).encode("utf-8")).hexdigest()
+
+    def info(self) -> CascadeInfo:
+        """Return statistics for the sentences labelled so far.
+
+        Returns
+        -------
+        CascadeInfo
+            Named tuple of sentences, escalated and labelled_by.
+        """
+        with self._lock:
+            labelled_by = dict(self._labelled_by)
+        sentences = sum(labelled_by.values())
+        return CascadeInfo(
+            sentences=sentences,
+            escalated=sentences - labelled_by[self.models[0]],
+            labelled_by=labelled_by,
+        )
+
+    def reset_info(self) -> None:
+        """Reset the statistics."""
+        with self._lock:
+            self._labelled_by = dict.fromkeys(self.models, 0)
+
+    def label(
+        self,
+        features: list[dict[str, str | bool]],
+        timer: StageTimer | NullTimer | None = None,
+    ) -> tuple[list[str], list[float], tuple[float, ...] | None]:
+        """Label the tokens in a sentence, escalating to the next model if needed.
+
+        Parameters
+        ----------
+        features : list[dict[str, str | bool]]
+            Features for each token in the sentence.
+        timer : StageTimer | NullTimer | None, optional
+            Timer to record the time taken to tag the sentence and calculate the
+            marginals with, including the time taken by every model used.
+
+        Returns
+        -------
+        list[str], list[float], tuple[float, ...] | None
+            Label and score for each token, and the confidence of each token being
+            NAME if no tokens were labelled NAME, otherwise None.
+        """
+        pool, _, labelled = self._label(features, timer)
+        self._record(pool)
+        return labelled
+
+    def label_with_new_tagger(
+        self,
+        features: list[dict[str, str | bool]],
+        timer: StageTimer | NullTimer | None = None,
+    ) -> tuple[
+        pycrfsuite.Tagger,
+        tuple[list[str], list[float], tuple[float, ...] | None],
+    ]:
+        """Label the tokens in a sentence using Taggers that are not part of the pools.
+
+        This is the same as label, except that the Tagger whose labels were used is
+        also returned. It is not shared with any other sentence, so can be used to
+        inspect the marginals for this sentence afterwards.
+
+        Parameters
+        ----------
+        features : list[dict[str, str | bool]]
+            Features for each token in the sentence.
+        timer : StageTimer | NullTimer | None, optional
+            Timer to record the time taken to tag the sentence and calculate the
+            marginals with, including the time taken by every model used.
+
+        Returns
+        -------
+        pycrfsuite.Tagger, tuple[list[str], list[float], tuple[float, ...] | None]
+            Tagger of the model whose labels were used, and the label and score for
+            each token, and the confidence of each token being NAME if no tokens were
+            labelled NAME, otherwise None.
+        """
+        pool, tagger, labelled = self._label(features, timer, new_tagger=True)
+        self._record(pool)
+        return tagger, labelled
+
+    def _record(self, pool: TaggerPool) -> None:
+        """Record the statistics for a sentence labelled by the model of pool.
+
+        Parameters
+        ----------
+        pool : TaggerPool
+            TaggerPool of the model whose labels were used.
+        """
+        with self._lock:
+            self._labelled_by[pool.model] += 1
+
+        if METRICS.enabled:
+            METRICS.observe_cascade(escalated=pool is not self.pools[0])
+
+    def _label(
+        self,
+        features: list[dict[str, str | bool]],
+        timer: StageTimer | NullTimer | None = None,
+        new_tagger: bool = False,
+    ) -> tuple[
+        TaggerPool,
+        pycrfsuite.Tagger | None,
+        tuple[list[str], list[float], tuple[float, ...] | None],
+    ]:
+        """Label sentence with each model in turn until one is confident.
+
+        Parameters
+        ----------
+        features : list[dict[str, str | bool]]
+            Features for each token in the sentence.
+        timer : StageTimer | NullTimer | None, optional
+            Timer to record the time taken to tag the sentence and calculate the
+            marginals with.
+        new_tagger : bool, optional
+            If True, label the sentence with a new Tagger for each model instead of
+            a Tagger from the model's pool.
+            Default is False.
+
+        Returns
+        -------
+        TaggerPool
+            TaggerPool of the model used.
+        pycrfsuite.Tagger | None
+            Tagger of the model used if new_tagger is True, otherwise None.
+        tuple[list[str], list[float], tuple[float, ...] | None]
+            Output of label_sentence.
+        """
+        tagger = None
+        for pool in self.pools:
+            if new_tagger:
+                tagger = pool.new_tagger()
+                labelled = label_sentence(tagger, features, timer)
+            else:
+                labelled = pool.label(features, timer)
+
+            scores = labelled[1]
+            if not scores or (
+                min(scores) >= self.min_score
+                and sum(scores) / len(scores) >= self.mean_score
+            ):
+                break
+
+        return pool, tagger, labelled
+
+
+def get_tagger_pool(model: str | None = None) -> TaggerPool:
+    """Return the TaggerPool for model, creating it if it doesn't exist yet.
+
+    Parameters
+    ----------
+    model : str | None, optional
+        File name of model shipped with this package, or path to model file.
+        If None, the default model is used.
+
+    Returns
+    -------
+    TaggerPool
+        TaggerPool for model.
+
+    Raises
+    ------
+    ValueError
+        If the model is not a shipped model and is not an existing file.
+    """
+    if model is None:
+        return TAGGER_POOL
+
+    if model not in SHIPPED_MODELS:
+        if not os.path.isfile(model):
+            raise ValueError(f'Unrecognised model "{model}"')
+        # Use the absolute path, so the same model file always has the same pool
+        # regardless of the working directory.
+        model = os.path.abspath(model)
+
+    if (pool := _TAGGER_POOLS.get(model)) is None:
+        with _TAGGER_POOLS_LOCK:
+            pool = _TAGGER_POOLS.setdefault(model, TaggerPool(model))
+
+    return pool
+
+
+def get_labeller(
+    model: str | TaggerPool | ModelCascade | None = None,
+) -> TaggerPool | ModelCascade:
+    """Return the object used to label sentences for the model argument.
+
+    Parameters
+    ----------
+    model : str | TaggerPool | ModelCascade | None, optional
+        File name of model shipped with this package, path to model file,
+        TaggerPool or ModelCascade. If None, the default model is used.
+
+    Returns
+    -------
+    TaggerPool | ModelCascade
+        model if it is a TaggerPool or ModelCascade, otherwise the TaggerPool for
+        model.
+    """
+    if isinstance(model, TaggerPool | ModelCascade):
+        return model
+    return get_tagger_pool(model)
+
+
+def load_model_if_not_loaded(model: str | ModelCascade | None = None):
+    """Load model into a Tagger in its TaggerPool if there are no Taggers in the pool.
+
+    Checking out a Tagger from the pool creates one and loads the model into it if
+    there are no idle Taggers.
+
+    Parameters
+    ----------
+    model : str | ModelCascade | None, optional
+        File name of model shipped with this package, path to model file or
+        ModelCascade, in which case all of its models are loaded.
+        If None, the default model is used.
     """
-    try:
-        TAGGER.info()
-    except RuntimeError:
-        with as_file(files(__package__) / "model.6k.en.crfsuite") as p:
-            TAGGER.open(str(p))
+    labeller = get_labeller(model)
+    pools = labeller.pools if isinstance(labeller, ModelCascade) else [labeller]
+    for pool in pools:
+        with pool.checkout():
+            pass
+
+
+def warmup_en(model: str | ModelCascade | None = None) -> dict[str, float]:
+    """Load and exercise everything used to parse English ingredient sentences.
+
+    Most resources are loaded lazily the first time they are needed, which adds to
+    the time taken to parse the first sentence. Calling this function up front moves
+    that cost to a time of the caller's choosing.
+
+    Parameters
+    ----------
+    model : str | ModelCascade | None, optional
+        File name of model shipped with this package, path to model file or
+        ModelCascade to load. If None, the default model is used.
+
+    Returns
+    -------
+    dict[str, float]
+        Time, in seconds, taken to load each component.
+    """
+    timings = {}
+
+    def timed(component: str, func: Callable, *args) -> None:
+        start = time.perf_counter()
+        func(*args)
+        timings[component] = time.perf_counter() - start
+
+    timed("nltk_resources", download_nltk_resources)
+
+    # Importing nltk is slow, so it's only imported when needed.
+    from nltk.tag import pos_tag
+
+    timed("pos_tagger", pos_tag, ["salt"])
+    timed("model", load_model_if_not_loaded, model)
+    timed("unit_registry", lambda: _utils.UREG.Unit("cup"))
+    timed("stemmer", stem, "cups")
+    timed("regex", compile_patterns)
+    # Parse a sentence that goes through most of the normalisation and
+    # post-processing steps, so any remaining lazy initialisation is done.
+    timed(
+        "parse",
+        partial(parse_ingredient_en, model=model),
+        "1 1/2 cups (355 ml) all-purpose flour, sifted",
+    )
+
+    return timings
 
 
 def parse_ingredient_en(
@@ -37,6 +633,10 @@ def parse_ingredient_en(
     expect_name_in_output: bool = True,
     string_units: bool = False,
     imperial_units: bool = False,
+    model: str | TaggerPool | ModelCascade | None = None,
+    unit_registry: pint.UnitRegistry | None = None,
+    normalised_cache: LRUCache = NORMALISED_CACHE,
+    label_cache: LRUCache = LABEL_CACHE,
 ) -> ParsedIngredient:
     """Parse an English language ingredient sentence to return structured data.
 
@@ -63,18 +663,84 @@ def parse_ingredient_en(
         for the the following units: fluid ounce, cup, pint, quart, gallon.
         Default is False, which results in US customary units being used.
         This has no effect if string_units=True.
+    model : str | TaggerPool | ModelCascade | None, optional
+        Model to label the sentence with. This is either the file name of a model
+        shipped with this package (see SHIPPED_MODELS), the path to a model file, a
+        TaggerPool or a ModelCascade. If None, the default model is used.
+    unit_registry : pint.UnitRegistry | None, optional
+        Unit registry to create pint.Unit objects from.
+        If None, the package unit registry is used.
+    normalised_cache : LRUCache, optional
+        Cache of results keyed on the normalised sentence.
+        Default is the package normalised cache.
+    label_cache : LRUCache, optional
+        Cache of labels keyed on the feature tokens and part of speech tags.
+        Default is the package labels cache.
 
     Returns
     -------
     ParsedIngredient
         ParsedIngredient object of structured data parsed from input string
     """
-    load_model_if_not_loaded()
+    labeller = get_labeller(model)
+    # Timings are only recorded if any timing hooks have been added
+    timer = new_timer()
 
-    processed_sentence = PreProcessor(sentence)
+    # Part of speech tagging is deferred until we know the result isn't cached
+    with span("ingredient_parser.preprocess", sentence_length=len(sentence)):
+        processed_sentence = PreProcessor(sentence, defer_pos_tagging=True, timer=timer)
     tokens = processed_sentence.tokenized_sentence
-    labels = TAGGER.tag(processed_sentence.sentence_features())
-    scores = [TAGGER.marginal(label, i) for i, label in enumerate(labels)]
+
+    cache_key = None
+    if normalised_cache.enabled:
+        cache_key = (
+            processed_sentence.sentence,
+            tuple(tokens),
+            discard_isolated_stop_words,
+            expect_name_in_output,
+            string_units,
+            imperial_units,
+            labeller.model,
+            unit_registry,
+        )
+        if (cached := normalised_cache.get(cache_key)) is not None:
+            # The cached result may be for a different input sentence that has the
+            # same normalised form, so set the sentence to the current input.
+            parsed = copy_parsed_ingredient(cached)
+            parsed.sentence = sentence
+            report_timings(
+                sentence,
+                timer,
+                len(tokens),
+                processed_sentence.trace_normalisation,
+            )
+            if METRICS.enabled:
+                METRICS.observe_sentence(len(tokens), guessed_name=False)
+            return parsed
+
+    # The features only depend on the feature tokens and part of speech tags, so
+    # sentences with the same feature tokens and tags are given the same labels.
+    pos_tags = processed_sentence.tag_deferred_pos()
+    label_key = None
+    cached_labels = None
+    if label_cache.enabled:
+        label_key = (
+            tuple(processed_sentence.feature_tokens),
+            tuple(pos_tags),
+            labeller.model,
+        )
+        cached_labels = label_cache.get(label_key)
+
+    if cached_labels is None:
+        features = processed_sentence.sentence_features()
+        labels, scores, name_scores = labeller.label(features, timer)
+
+        if label_key is not None:
+            label_cache.put(label_key, (tuple(labels), tuple(scores), name_scores))
+    else:
+        cached_tags, cached_scores, name_scores = cached_labels
+        # Copy the cached labels and scores because they are modified below
+        labels, scores = list(cached_tags), list(cached_scores)
 
     # Re-pluralise tokens that were singularised if the label isn't UNIT
     # For tokens with UNIT label, we'll deal with them below
@@ -84,9 +750,10 @@ def parse_ingredient_en(
         if label != "UNIT":
             tokens[idx] = pluralise_units(token)
 
-    if expect_name_in_output and all(label != "NAME" for label in labels):
+    guessed_name = expect_name_in_output and name_scores is not None
+    if guessed_name:
         # No tokens were assigned the NAME label, so guess if there's a name
-        labels, scores = guess_ingredient_name(labels, scores)
+        labels, scores = guess_ingredient_name(labels, scores, name_scores)
 
     postprocessed_sentence = PostProcessor(
         sentence,
@@ -96,8 +763,18 @@ def parse_ingredient_en(
         discard_isolated_stop_words=discard_isolated_stop_words,
         string_units=string_units,
         imperial_units=imperial_units,
+        unit_registry=unit_registry,
+        timer=timer,
     )
-    return postprocessed_sentence.parsed
+    parsed = postprocessed_sentence.parsed
+
+    if cache_key is not None:
+        normalised_cache.put(cache_key, copy_parsed_ingredient(parsed))
+
+    report_timings(sentence, timer, len(tokens), processed_sentence.trace_normalisation)
+    if METRICS.enabled:
+        METRICS.observe_sentence(len(tokens), guessed_name)
+    return parsed
 
 
 def inspect_parser_en(
@@ -106,6 +783,8 @@ def inspect_parser_en(
     expect_name_in_output: bool = True,
     string_units: bool = False,
     imperial_units: bool = False,
+    model: str | TaggerPool | ModelCascade | None = None,
+    unit_registry: pint.UnitRegistry | None = None,
 ) -> ParserDebugInfo:
     """
 
@@ -132,19 +811,35 @@ def inspect_parser_en(
         for the the following units: fluid ounce, cup, pint, quart, gallon.
         Default is False, which results in US customary units being used.
         This has no effect if string_units=True.
+    model : str | TaggerPool | ModelCascade | None, optional
+        Model to label the sentence with. This is either the file name of a model
+        shipped with this package (see SHIPPED_MODELS), the path to a model file, a
+        TaggerPool or a ModelCascade. If None, the default model is used.
+    unit_registry : pint.UnitRegistry | None, optional
+        Unit registry to create pint.Unit objects from.
+        If None, the package unit registry is used.
 
     Returns
     -------
     ParserDebugInfo
         ParserDebugInfo object containing the PreProcessor object, PostProcessor
-        object and Tagger.
+        object, Tagger and the time taken by each stage.
     """
-    load_model_if_not_loaded()
-
-    processed_sentence = PreProcessor(sentence)
+    timer = StageTimer(per_step=True)
+    with span("ingredient_parser.preprocess", sentence_length=len(sentence)):
+        processed_sentence = PreProcessor(sentence, timer=timer)
     tokens = processed_sentence.tokenized_sentence
-    labels = TAGGER.tag(processed_sentence.sentence_features())
-    scores = [TAGGER.marginal(label, i) for i, label in enumerate(labels)]
+    features = processed_sentence.sentence_features()
+
+    # The returned Tagger is used to inspect the marginals for this sentence after
+    # this function returns, so it cannot be one that is shared from a TaggerPool.
+    labeller = get_labeller(model)
+    if isinstance(labeller, ModelCascade):
+        tagger, labelled = labeller.label_with_new_tagger(features, timer)
+    else:
+        tagger = labeller.new_tagger()
+        labelled = label_sentence(tagger, features, timer)
+    labels, scores, name_scores = labelled
 
     # Re-plurise tokens that were singularised if the label isn't UNIT
     # For tokens with UNIT label, we'll deal with them below
@@ -154,9 +849,9 @@ def inspect_parser_en(
         if label != "UNIT":
             tokens[idx] = pluralise_units(token)
 
-    if expect_name_in_output and all(label != "NAME" for label in labels):
+    if expect_name_in_output and name_scores is not None:
         # No tokens were assigned the NAME label, so guess if there's a name
-        labels, scores = guess_ingredient_name(labels, scores)
+        labels, scores = guess_ingredient_name(labels, scores, name_scores)
 
     postprocessed_sentence = PostProcessor(
         sentence,
@@ -166,18 +861,70 @@ def inspect_parser_en(
         discard_isolated_stop_words=discard_isolated_stop_words,
         string_units=string_units,
         imperial_units=imperial_units,
+        unit_registry=unit_registry,
+        timer=timer,
     )
+    # Calculate the parsed output now so its time is included in the timings
+    postprocessed_sentence.parsed
 
     return ParserDebugInfo(
         sentence=sentence,
         PreProcessor=processed_sentence,
         PostProcessor=postprocessed_sentence,
-        tagger=TAGGER,
+        tagger=tagger,
+        timings=timer.timings,
     )
 
 
+def label_sentence(
+    tagger: pycrfsuite.Tagger,
+    features: list[dict[str, str | bool]],
+    timer: StageTimer | NullTimer | None = None,
+) -> tuple[list[str], list[float], tuple[float, ...] | None]:
+    """Label the tokens in a sentence and calculate the confidence of each label.
+
+    If no tokens are labelled NAME, the confidence of each token being NAME is also
+    calculated so a name can be guessed by guess_ingredient_name.
+
+    Parameters
+    ----------
+    tagger : pycrfsuite.Tagger
+        Tagger to label the sentence with.
+    features : list[dict[str, str | bool]]
+        Features for each token in the sentence.
+    timer : StageTimer | NullTimer | None, optional
+        Timer to record the time taken to tag the sentence and calculate the
+        marginals with.
+        If None, the time is not recorded.
+
+    Returns
+    -------
+    list[str], list[float], tuple[float, ...] | None
+        Label and score for each token, and the confidence of each token being NAME
+        if no tokens were labelled NAME, otherwise None.
+    """
+    timer = timer or NULL_TIMER
+    with span("ingredient_parser.crf_tag", token_count=len(features)):
+        with timer.stage("tag"):
+            labels = tagger.tag(features)
+
+        with timer.stage("marginals"):
+            scores = [tagger.marginal(label, i) for i, label in enumerate(labels)]
+
+            name_scores = None
+            if all(label != "NAME" for label in labels):
+                name_scores = tuple(
+                    tagger.marginal("NAME", i) for i, _ in enumerate(labels)
+                )
+
+    return labels, scores, name_scores
+
+
 def guess_ingredient_name(
-    labels: list[str], scores: list[float], min_score: float = 0.2
+    labels: list[str],
+    scores: list[float],
+    name_scores: Sequence[float],
+    min_score: float = 0.2,
 ) -> tuple[list[str], list[float]]:
     """Guess ingredient name from list of labels and scores.
 
@@ -193,6 +940,8 @@ def guess_ingredient_name(
         List of labels
     scores : list[float]
         List of scores
+    name_scores : Sequence[float]
+        Confidence of each token being labelled NAME
     min_score : float
         Minimum score to consider as candidate name
 
@@ -201,9 +950,8 @@ def guess_ingredient_name(
     list[str], list[float]
         Labels and scores, modified to assign a name if possible.
     """
-    # Calculate confidence of each token being labelled NAME and get indices where that
-    # confidence is greater than min_score.
-    name_scores = [TAGGER.marginal("NAME", i) for i, _ in enumerate(labels)]
+    # Get indices where the confidence of being labelled NAME is greater than
+    # min_score.
     candidate_indices = [i for i, score in enumerate(name_scores) if score >= min_score]
 
     if len(candidate_indices) == 0:
@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 
 import re
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
-from functools import cached_property
 from itertools import chain, pairwise
 from statistics import mean
 from typing import Any
 
+import pint
+
 from .._common import consume, group_consecutive_idx
+from .._timing import NULL_TIMER, NullTimer, StageTimer
+from .._tracing import span
 from ..dataclasses import (
     CompositeIngredientAmount,
     IngredientAmount,
@@ -16,9 +20,10 @@ from ..dataclasses import (
     ParsedIngredient,
 )
 from ._constants import (
-    APPROXIMATE_TOKENS,
-    SINGULAR_TOKENS,
-    STOP_WORDS,
+    IS_APPROXIMATE,
+    IS_SINGULAR,
+    IS_STOP_WORD,
+    token_flags,
 )
 from ._utils import ingredient_amount_factory
 
@@ -89,6 +94,12 @@ class PostProcessor:
         for the the following units: fluid ounce, cup, pint, quart, gallon.
         Default is False, which results in US customary units being used.
         This has no effect if string_units=True.
+    unit_registry : pint.UnitRegistry | None
+        Unit registry to create pint.Unit objects from.
+        If None, the package unit registry is used.
+    timer : StageTimer | NullTimer
+        Timer used to record the time taken by each stage of postprocessing. If no
+        timer is given, the time is not recorded.
     consumed : list[int]
         List of indices of tokens consumed as part of setting the APPROXIMATE and
         SINGULAR flags. These tokens should not end up in the parsed output.
@@ -103,6 +114,8 @@ class PostProcessor:
         discard_isolated_stop_words: bool = True,
         string_units: bool = False,
         imperial_units: bool = False,
+        unit_registry: pint.UnitRegistry | None = None,
+        timer: StageTimer | NullTimer | None = None,
     ):
         self.sentence = sentence
         self.tokens = tokens
@@ -111,7 +124,11 @@ class PostProcessor:
         self.discard_isolated_stop_words = discard_isolated_stop_words
         self.string_units = string_units
         self.imperial_units = imperial_units
+        self.unit_registry = unit_registry
         self.consumed = []
+        self.timer = timer or NULL_TIMER
+        self._parsed: ParsedIngredient | None = None
+        self._parsed_lock = threading.Lock()
 
     def __repr__(self) -> str:
         """__repr__ method.
@@ -137,10 +154,31 @@ class PostProcessor:
         ]
         return "\n".join(_str)
 
-    @cached_property
+    @property
     def parsed(self) -> ParsedIngredient:
         """Return parsed ingredient data.
 
+        The data is only calculated the first time this is accessed. Calculating it
+        modifies the consumed attribute, so a lock ensures this only happens once
+        even if the PostProcessor is shared between threads.
+
+        Returns
+        -------
+        ParsedIngredient
+            Object containing structured data from sentence.
+        """
+        with self._parsed_lock:
+            if self._parsed is None:
+                with (
+                    self.timer.stage("postprocess"),
+                    span("ingredient_parser.postprocess", token_count=len(self.tokens)),
+                ):
+                    self._parsed = self._parse()
+        return self._parsed
+
+    def _parse(self) -> ParsedIngredient:
+        """Calculate parsed ingredient data.
+
         Returns
         -------
         ParsedIngredient
@@ -202,7 +240,7 @@ class PostProcessor:
             joined = " ".join([self.tokens[i] for i in idx])
             confidence = mean([self.scores[i] for i in idx])
 
-            if self.discard_isolated_stop_words and joined in STOP_WORDS:
+            if self.discard_isolated_stop_words and token_flags(joined) & IS_STOP_WORD:
                 # Discard part if it's a stop word
                 continue
 
@@ -259,7 +297,8 @@ class PostProcessor:
             labels = self._unconsumed(self.labels)
             scores = self._unconsumed(self.scores)
 
-            parsed_amounts = func(idx, tokens, labels, scores)
+            with self.timer.stage(f"postprocess.{func.__name__.lstrip('_')}"):
+                parsed_amounts = func(idx, tokens, labels, scores)
             amounts.extend(parsed_amounts)
 
         return sorted(amounts, key=lambda x: x.starting_index)
@@ -498,6 +537,7 @@ class PostProcessor:
                         APPROXIMATE=self._is_approximate(match[0], tokens, labels, idx),
                         string_units=self.string_units,
                         imperial_units=self.imperial_units,
+                        unit_registry=self.unit_registry,
                     )
                     amounts.append(first)
                     # Pop the first and last items from the list of matching indices
@@ -524,6 +564,7 @@ class PostProcessor:
                             APPROXIMATE=first.APPROXIMATE,
                             string_units=self.string_units,
                             imperial_units=self.imperial_units,
+                            unit_registry=self.unit_registry,
                         )
                         amounts.append(amount)
 
@@ -603,6 +644,7 @@ class PostProcessor:
                         starting_index=idx[first_unit_idx - 1],
                         string_units=self.string_units,
                         imperial_units=self.imperial_units,
+                        unit_registry=self.unit_registry,
                     )
                     # Second amount
                     quantity_2 = tokens[match[2]]
@@ -623,6 +665,7 @@ class PostProcessor:
                         starting_index=starting_index_2,
                         string_units=self.string_units,
                         imperial_units=self.imperial_units,
+                        unit_registry=self.unit_registry,
                     )
                     composite_amounts.append(
                         CompositeIngredientAmount(
@@ -813,6 +856,7 @@ class PostProcessor:
                     SINGULAR=amount.SINGULAR,
                     string_units=self.string_units,
                     imperial_units=self.imperial_units,
+                    unit_registry=self.unit_registry,
                 )
             )
 
@@ -867,14 +911,14 @@ class PostProcessor:
         if i == 0:
             return False
 
-        if labels[i] == "QTY" and tokens[i - 1].lower() in APPROXIMATE_TOKENS:
+        if labels[i] == "QTY" and token_flags(tokens[i - 1]) & IS_APPROXIMATE:
             # Mark i - 1 element as consumed
             self.consumed.append(idx[i - 1])
             return True
         elif (
             labels[i] == "QTY"
             and tokens[i - 1] == "."
-            and tokens[i - 2].lower() in APPROXIMATE_TOKENS
+            and token_flags(tokens[i - 2]) & IS_APPROXIMATE
         ):
             # Special case for "approx."
             # Mark i - 1 and i - 2 elements as consumed
@@ -924,7 +968,7 @@ class PostProcessor:
         if i == len(tokens) - 1:
             return False
 
-        if labels[i] == "UNIT" and tokens[i + 1].lower() in SINGULAR_TOKENS:
+        if labels[i] == "UNIT" and token_flags(tokens[i + 1]) & IS_SINGULAR:
             # Mark i - 1 element as consumed
             self.consumed.append(idx[i + 1])
             return True
@@ -936,7 +980,7 @@ class PostProcessor:
         if (
             labels[i] == "UNIT"
             and tokens[i + 1] in [")", "]"]
-            and tokens[i + 2].lower() in SINGULAR_TOKENS
+            and token_flags(tokens[i + 2]) & IS_SINGULAR
         ):
             # Mark i - 1 element as consumed
             self.consumed.append(idx[i + 2])
@@ -989,8 +1033,8 @@ class PostProcessor:
 
         if (
             labels[i] == "QTY"
-            and tokens[i - 1].lower() in APPROXIMATE_TOKENS
-            and tokens[i - 2].lower() in SINGULAR_TOKENS
+            and token_flags(tokens[i - 1]) & IS_APPROXIMATE
+            and token_flags(tokens[i - 2]) & IS_SINGULAR
         ):
             # Mark i - 1 and i - 2 elements as consumed
             self.consumed.append(idx[i - 1])
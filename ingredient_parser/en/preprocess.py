@@ -1,34 +1,48 @@
 #!/usr/bin/env python3
 
-import re
-import string
+from collections import defaultdict
 from fractions import Fraction
 from html import unescape
 
-from nltk.tag import pos_tag
-
+from .._common import download_nltk_resources
+from .._timing import NULL_TIMER, NullTimer, StageTimer
+from .._tracing import span
+from . import _regex
 from ._constants import (
-    AMBIGUOUS_UNITS,
-    FLATTENED_UNITS_LIST,
+    EN_EM_DASHES,
+    IS_AMBIGUOUS_UNIT,
+    IS_NUMERIC,
+    IS_PUNC,
+    IS_UNIT,
+    STRING_NUMBER_KEYS,
+    STRING_NUMBER_PREFIXES,
     STRING_NUMBERS,
-    STRING_NUMBERS_REGEXES,
     UNICODE_FRACTIONS,
     UNITS,
-)
-from ._regex import (
-    CAPITALISED_PATTERN,
-    DUPE_UNIT_RANGES_PATTERN,
-    EXPANDED_RANGE,
-    FRACTION_PARTS_PATTERN,
-    FRACTION_SPLIT_AND_PATTERN,
-    QUANTITY_UNITS_PATTERN,
-    QUANTITY_X_PATTERN,
-    STRING_RANGE_PATTERN,
-    UNITS_HYPHEN_QUANTITY_PATTERN,
-    UNITS_QUANTITY_PATTERN,
+    UNITS_SET,
+    UNITS_WITH_TRAILING_PERIOD,
+    token_flags,
 )
 from ._utils import stem, tokenize
 
+# Features of each token that are also used for the features of the tokens up to two
+# either side of it, and the names they are given in the neighbouring tokens' features.
+# These must be in the order the features are added in PreProcessor._base_features.
+BASE_FEATURES = (
+    "stem",
+    "is_capitalised",
+    "is_unit",
+    "is_punc",
+    "is_ambiguous",
+    "is_in_parens",
+    "is_after_comma",
+    "is_after_plus",
+)
+PREV_FEATURES = tuple(f"prev_{name}" for name in BASE_FEATURES)
+PREV_FEATURES2 = tuple(f"prev_{name}2" for name in BASE_FEATURES)
+NEXT_FEATURES = tuple(f"next_{name}" for name in BASE_FEATURES)
+NEXT_FEATURES2 = tuple(f"next_{name}2" for name in BASE_FEATURES)
+
 
 class PreProcessor:
     """Recipe ingredient sentence PreProcessor class.
@@ -87,6 +101,9 @@ class PreProcessor:
         using this class.
     show_debug_output : bool, optional
         If True, print out each stage of the sentence normalisation
+    timer : StageTimer | NullTimer | None, optional
+        Timer to record the time taken by each stage of preprocessing with.
+        If None, the time is not recorded.
 
     Attributes
     ----------
@@ -94,6 +111,12 @@ class PreProcessor:
         Defer part of speech tagging until feature generation
     show_debug_output : bool
         If True, print out each stage of the sentence normalisation
+    timer : StageTimer | NullTimer
+        Timer used to record the time taken by each stage of preprocessing.
+    normalisation_trace : list[tuple[str, str]]
+        Name of each normalisation function and the sentence output by it. This is
+        only recorded if show_debug_output is True or timer times each step. Use
+        trace_normalisation() to record it otherwise.
     input : str
         Input ingredient sentence.
     pos_tags : list[str]
@@ -112,6 +135,7 @@ class PreProcessor:
         input_sentence: str,
         defer_pos_tagging: bool = False,
         show_debug_output: bool = False,
+        timer: StageTimer | NullTimer | None = None,
     ):
         """Initialise.
 
@@ -123,17 +147,22 @@ class PreProcessor:
             Defer part of speech tagging until feature generation
         show_debug_output : bool, optional
             If True, print out each stage of the sentence normalisation
+        timer : StageTimer | NullTimer | None, optional
+            Timer to record the time taken by each stage of preprocessing with
 
         """
         self.show_debug_output = show_debug_output
+        self.timer = timer or NULL_TIMER
+        self.normalisation_trace: list[tuple[str, str]] = []
         self.input: str = input_sentence
         self.sentence: str = self._normalise(input_sentence)
 
-        _tokenised_sentence = tokenize(self.sentence)
-        (
-            self.tokenized_sentence,
-            self.singularised_indices,
-        ) = self._singlarise_units(_tokenised_sentence)
+        with self.timer.stage("tokenise"):
+            _tokenised_sentence = tokenize(self.sentence)
+            (
+                self.tokenized_sentence,
+                self.singularised_indices,
+            ) = self._singlarise_units(_tokenised_sentence)
 
         self.defer_pos_tagging: bool = defer_pos_tagging
         if not defer_pos_tagging:
@@ -142,7 +171,8 @@ class PreProcessor:
             self.pos_tags = []
 
         # Replace all numeric tokens with "!num" for calculating features
-        self._feature_tokens = self._replace_numeric_tokens(self.tokenized_sentence)
+        with self.timer.stage("tokenise"):
+            self._feature_tokens = self._replace_numeric_tokens(self.tokenized_sentence)
 
     def __repr__(self) -> str:
         """__repr__ method.
@@ -173,10 +203,42 @@ class PreProcessor:
     def _normalise(self, sentence: str) -> str:
         """Normalise sentence prior to feature extraction.
 
+        If debug output is shown or the timer times each step, each normalisation
+        step is applied in turn so its output and time can be recorded. Otherwise the
+        sentence is normalised by _normalise_fused, which gives the same output, and
+        is timed as the single normalise stage.
+
+        Parameters
+        ----------
+        sentence : str
+            Ingredient sentence
+
+        Returns
+        -------
+        str
+            Normalised ingredient sentence
+        """
+        # Only apply each step in turn if its output or time is going to be shown or
+        # reported
+        if not (self.show_debug_output or self.timer.per_step):
+            with self.timer.stage("normalise"):
+                return self._normalise_fused(sentence)
+
+        with self.timer.stage("normalise"):
+            return self._normalise_in_steps(sentence, self.timer)
+
+    def _normalise_in_steps(self, sentence: str, timer: StageTimer | NullTimer) -> str:
+        """Normalise sentence by applying each normalisation step in turn.
+
+        The name of each step and the sentence output by it are appended to
+        normalisation_trace.
+
         Parameters
         ----------
         sentence : str
             Ingredient sentence
+        timer : StageTimer | NullTimer
+            Timer to record the time taken by each step with.
 
         Returns
         -------
@@ -201,13 +263,103 @@ class PreProcessor:
         ]
 
         for func in funcs:
-            sentence = func(sentence)
+            with timer.stage(f"normalise.{func.__name__.lstrip('_')}"):
+                sentence = func(sentence)
+
+            self.normalisation_trace.append((func.__name__, sentence))
 
             if self.show_debug_output:
                 print(f"{func.__name__}: {sentence}")
 
         return sentence.strip()
 
+    def trace_normalisation(self) -> list[tuple[str, str]]:
+        """Return the name of each normalisation step and the sentence output by it.
+
+        If the sentence was normalised in a single pass, the steps are applied in turn
+        to the input sentence to record the output of each. This gives the same
+        normalised sentence, because the single pass is identical to applying the
+        steps in turn.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            Name of each normalisation function and the sentence output by it.
+        """
+        if not self.normalisation_trace:
+            self._normalise_in_steps(self.input, NULL_TIMER)
+        return self.normalisation_trace
+
+    def _normalise_fused(self, sentence: str) -> str:
+        """Normalise sentence, skipping the steps that cannot change it.
+
+        The output is identical to applying each step listed in _normalise in turn.
+        Before each step, the sentence is checked for the characters or words that
+        step needs, such as non-ASCII characters for the en and em dash and unicode
+        fraction replacements, "&" for html fractions and digits for steps that
+        match quantities. These checks are much cheaper than the steps, most of which
+        are skipped for a typical sentence.
+
+        Parameters
+        ----------
+        sentence : str
+            Ingredient sentence
+
+        Returns
+        -------
+        str
+            Normalised ingredient sentence
+
+        Examples
+        --------
+        >>> p = PreProcessor("")
+        >>> p._normalise_fused("1 tbsp. olive oil")
+        "1 tbsp olive oil"
+        """
+        if not sentence.isascii():
+            sentence = sentence.translate(EN_EM_DASHES)
+
+        if _regex.STRING_NUMBER_PATTERN.search(sentence):
+            sentence = self._replace_string_numbers(sentence)
+
+        if "&" in sentence:
+            sentence = unescape(sentence)
+
+        if not sentence.isascii():
+            sentence = self._replace_unicode_fractions(sentence)
+
+        # None of the following steps add digits to a sentence without any
+        has_digit = _regex.DIGIT_PATTERN.search(sentence) is not None
+
+        if has_digit and "and" in sentence and "/" in sentence:
+            sentence = self._combine_quantities_split_by_and(sentence)
+
+        if "/" in sentence or "\u2044" in sentence:
+            sentence = self._replace_fake_fractions(sentence)
+
+        if has_digit:
+            sentence = self._split_quantity_and_units(sentence)
+
+        if "." in sentence and _regex.UNIT_TRAILING_PERIOD_PATTERN.search(sentence):
+            sentence = self._remove_unit_trailing_period(sentence)
+
+        if has_digit and ("to" in sentence or "or" in sentence):
+            sentence = self._replace_string_range(sentence)
+
+        # Quantities in the remaining patterns can be made of only periods
+        has_quantity = has_digit or "." in sentence
+
+        if has_quantity:
+            sentence = self._replace_dupe_units_ranges(sentence)
+
+        if has_quantity and ("x" in sentence or "X" in sentence):
+            sentence = self._merge_quantity_x(sentence)
+
+        if has_digit and "-" in sentence:
+            sentence = self._collapse_ranges(sentence)
+
+        return sentence.strip()
+
     def _replace_en_em_dash(self, sentence: str) -> str:
         """Replace en-dashes and em-dashes with hyphens.
 
@@ -231,7 +383,7 @@ class PreProcessor:
         >>> p._replace_en_em_dash("3–4 sirloin steaks")
         "3-4 sirloin steaks"
         """
-        return sentence.replace("–", "-").replace("—", " - ")
+        return sentence.translate(EN_EM_DASHES)
 
     def _replace_string_numbers(self, sentence: str) -> str:
         """Replace string numbers (e.g. one, two) with numeric values (e.g. 1, 2).
@@ -256,26 +408,75 @@ class PreProcessor:
         >>> p._replace_string_numbers("twelve bonbons")
         "12 bonbons"
         """
-        # STRING_NUMBER_REGEXES is a dict where the values are a tuple of the compiled
-        # regular expression for matching a string number e.g. 'one', 'two' and the
-        # substitution numerical value for that string number.
-        for regex, substitution in STRING_NUMBERS_REGEXES.values():
-            # Find matches for current string number
-            for match in regex.finditer(sentence):
-                if self._valid_string_number_replacement(match, sentence):
-                    sentence = regex.sub(rf"{substitution}", sentence)
+        matches = list(_regex.STRING_NUMBER_PATTERN.finditer(sentence))
+        if not matches:
+            return sentence
 
-        return sentence
+        # Find the end index of each occurrence of each string number. A string
+        # number that begins with another, such as one-half, is also an occurrence
+        # of the string number it begins with, unless it is replaced itself.
+        occurrences = defaultdict(list)
+        for match in matches:
+            string_number = STRING_NUMBER_KEYS[match.lastindex - 1]
+            occurrences[string_number].append((match.end(), None))
+            if (prefix := STRING_NUMBER_PREFIXES.get(string_number)) is not None:
+                occurrences[prefix].append((match.start() + len(prefix), string_number))
+
+        # Every occurrence of a string number is replaced if any occurrence is valid.
+        # String numbers are considered in the order of STRING_NUMBERS, because
+        # replacing a string number can change whether another is valid
+        # e.g. two-one cups.
+        replaced = set()
+        for string_number in STRING_NUMBERS:
+            for end, container in occurrences.get(string_number, []):
+                if container in replaced:
+                    # Occurrence was replaced as part of container
+                    continue
+                if container is None and (
+                    STRING_NUMBER_PREFIXES.get(string_number) in replaced
+                ):
+                    # Occurrence was changed by replacing its prefix
+                    continue
+                if self._valid_string_number_replacement(end, sentence, replaced):
+                    replaced.add(string_number)
+                    break
+
+        if not replaced:
+            return sentence
+
+        # Build the new sentence from the matches found above, so the sentence is
+        # only searched once
+        parts = []
+        last_end = 0
+        for match in matches:
+            string_number = STRING_NUMBER_KEYS[match.lastindex - 1]
+            if string_number in replaced:
+                substitution = STRING_NUMBERS[string_number]
+            elif (prefix := STRING_NUMBER_PREFIXES.get(string_number)) in replaced:
+                substitution = STRING_NUMBERS[prefix] + match.group()[len(prefix) :]
+            else:
+                substitution = match.group()
+
+            parts.append(sentence[last_end : match.start()])
+            parts.append(substitution)
+            last_end = match.end()
+
+        parts.append(sentence[last_end:])
+        return "".join(parts)
 
-    def _valid_string_number_replacement(self, match: re.Match, sentence: str) -> bool:
-        """Check if string number replacement is valid for the given Match in sentence.
+    def _valid_string_number_replacement(
+        self, end: int, sentence: str, replaced: set[str]
+    ) -> bool:
+        """Check if replacing the string number that ends at index end is valid.
 
         Parameters
         ----------
-        match : re.Match
-            Match object for matching string number in sentence
+        end : int
+            Index of the character after the string number in sentence
         sentence : str
             Sentence
+        replaced : set[str]
+            String numbers that have already been replaced in sentence
 
         Returns
         -------
@@ -283,21 +484,28 @@ class PreProcessor:
         """
         # Check the character following the match, If it's not a hyphen, or we're at
         # the end of the sentence, the replacement is valid.
-        next_char_idx = match.span()[-1]
-        if next_char_idx >= len(sentence) or sentence[next_char_idx] != "-":
+        if end >= len(sentence) or sentence[end] != "-":
             return True
 
         # If the next character is a hyphen, if the hyphen is followed by
-        # a unit or another string number, then also do the substitution.
-        sub_sentence = sentence[next_char_idx + 1 :]
-        units_and_numbers = FLATTENED_UNITS_LIST + list(STRING_NUMBERS.keys())
-        for unit_or_num in units_and_numbers:
-            # Add a space to end of unit_or_num to make sure we don't incorrectly
-            # get a substring match e.g. matching "g" when unit_or_num is grain.
-            if sub_sentence.startswith(unit_or_num + " "):
-                return True
+        # a unit or another string number and a space, then also do the substitution.
+        # None of the units or string numbers contain a space, so this is the same as
+        # checking if the text between the hyphen and the next space is one of them.
+        # This also makes sure we don't incorrectly get a substring match e.g.
+        # matching "g" when the unit is grain.
+        space = sentence.find(" ", end + 1)
+        if space == -1:
+            return False
+
+        following = sentence[end + 1 : space]
+        if following in STRING_NUMBERS:
+            # The string number is only still there if it hasn't been replaced
+            return (
+                following not in replaced
+                and STRING_NUMBER_PREFIXES.get(following) not in replaced
+            )
 
-        return False
+        return following in UNITS_SET
 
     def _replace_html_fractions(self, sentence: str) -> str:
         """Replace html fractions e.g. &frac12; with unicode equivalents.
@@ -352,7 +560,7 @@ class PreProcessor:
         # Replace unicode FRACTION SLASH (U+2044) with forward slash
         sentence = sentence.replace("\u2044", "/")
 
-        matches = FRACTION_PARTS_PATTERN.findall(sentence)
+        matches = _regex.FRACTION_PARTS_PATTERN.findall(sentence)
 
         if not matches:
             return sentence
@@ -399,7 +607,7 @@ class PreProcessor:
         >>> p._combine_quantities_split_by_and("1 and 1/4 cups dark chocolate morsels")
         "1.25 cups dark chocolate morsels"
         """
-        matches = FRACTION_SPLIT_AND_PATTERN.findall(sentence)
+        matches = _regex.FRACTION_SPLIT_AND_PATTERN.findall(sentence)
 
         for match in matches:
             combined_quantity = float(Fraction(match[1]) + Fraction(match[2]))
@@ -438,10 +646,9 @@ class PreProcessor:
         >>> p._replace_unicode_fractions("¼-½ teaspoon")
         "1/4-1/2 teaspoon"
         """
-        for f_unicode, f_ascii in UNICODE_FRACTIONS.items():
-            sentence = sentence.replace(f_unicode, f_ascii)
-
-        return sentence
+        return _regex.UNICODE_FRACTION_PATTERN.sub(
+            lambda match: UNICODE_FRACTIONS[match.group()], sentence
+        )
 
     def _split_quantity_and_units(self, sentence: str) -> str:
         """Insert space between quantity and unit.
@@ -478,9 +685,15 @@ class PreProcessor:
         >>> p._split_quantity_and_units("2lb-1oz cherry tomatoes")
         "2 lb - 1 oz cherry tomatoes"
         """
-        sentence = QUANTITY_UNITS_PATTERN.sub(r"\1 \2", sentence)
-        sentence = UNITS_QUANTITY_PATTERN.sub(r"\1 \2", sentence)
-        return UNITS_HYPHEN_QUANTITY_PATTERN.sub(r"\1 - \2", sentence)
+        # Each pattern is an alternation of every unit, so only substitute if the
+        # much cheaper prefilter pattern finds somewhere it could match.
+        if _regex.QUANTITY_UNITS_PREFILTER.search(sentence):
+            sentence = _regex.QUANTITY_UNITS_PATTERN.sub(r"\1 \2", sentence)
+        if _regex.UNITS_QUANTITY_PREFILTER.search(sentence):
+            sentence = _regex.UNITS_QUANTITY_PATTERN.sub(r"\1 \2", sentence)
+        if _regex.UNITS_HYPHEN_QUANTITY_PREFILTER.search(sentence):
+            sentence = _regex.UNITS_HYPHEN_QUANTITY_PATTERN.sub(r"\1 - \2", sentence)
+        return sentence
 
     def _remove_unit_trailing_period(self, sentence: str) -> str:
         """Remove trailing periods from units e.g. tsp. -> tsp.
@@ -505,21 +718,10 @@ class PreProcessor:
         >>> p._remove_unit_trailing_period("5 oz. chopped tomatoes")
         "5 oz chopped tomatoes"
         """
-        units = [
-            "tsp.",
-            "tsps.",
-            "tbsp.",
-            "tbsps.",
-            "tbs.",
-            "tb.",
-            "lb.",
-            "lbs.",
-            "oz.",
-        ]
-        units.extend([u.capitalize() for u in units])
-        for unit in units:
-            unit_no_period = unit.replace(".", "")
-            sentence = sentence.replace(unit, unit_no_period)
+        # Replace each unit in turn, because removing a period can create a unit
+        # later in the list e.g. lb.s. -> lbs. -> lbs
+        for unit in UNITS_WITH_TRAILING_PERIOD:
+            sentence = sentence.replace(unit, unit[:-1])
 
         return sentence
 
@@ -552,7 +754,7 @@ class PreProcessor:
         >>> p._replace_string_range("5- or 6- large apples")
         "5-6- large apples"
         """
-        return STRING_RANGE_PATTERN.sub(r"\1-\5", sentence)
+        return _regex.STRING_RANGE_PATTERN.sub(r"\1-\5", sentence)
 
     def _replace_dupe_units_ranges(self, sentence: str) -> str:
         """Replace ranges where the unit appears twice with standard range then unit.
@@ -581,7 +783,7 @@ class PreProcessor:
         >>> p._replace_dupe_units_ranges("400-500 g/14 oz - 17 oz rhubarb")
         "400-500 g/14-17 oz rhubarb"
         """
-        matches = DUPE_UNIT_RANGES_PATTERN.findall(sentence)
+        matches = _regex.DUPE_UNIT_RANGES_PATTERN.findall(sentence)
 
         if not matches:
             return sentence
@@ -592,7 +794,7 @@ class PreProcessor:
                 continue
 
             # If capture unit not in units list, abort
-            if unit1 not in FLATTENED_UNITS_LIST:
+            if unit1 not in UNITS_SET:
                 continue
 
             sentence = sentence.replace(full_match, f"{quantity1}-{quantity2} {unit1}")
@@ -622,7 +824,7 @@ class PreProcessor:
         >>> p._replace_dupe_units_ranges("4 x 100 g wild salmon fillet")
         "4x 100 g wild salmon fillet"
         """
-        return QUANTITY_X_PATTERN.sub(r"\1x ", sentence)
+        return _regex.QUANTITY_X_PATTERN.sub(r"\1x ", sentence)
 
     def _collapse_ranges(self, sentence: str) -> str:
         """Collapse any whitespace found in a range so the range has the standard form.
@@ -647,7 +849,7 @@ class PreProcessor:
         >>> p._collapse_ranges("0.25  -0.5 tsp salt")
         "0.25-0.5 tsp salt"
         """
-        return EXPANDED_RANGE.sub(r"\1-\2", sentence)
+        return _regex.EXPANDED_RANGE.sub(r"\1-\2", sentence)
 
     def _singlarise_units(
         self, tokenised_sentence: list[str]
@@ -716,13 +918,22 @@ class PreProcessor:
         list[str]
             List of part of speech tags
         """
+        # Importing nltk is slow, so only do it when tagging is needed.
+        from nltk.tag import pos_tag
+
+        download_nltk_resources()
+
         tags = []
         # If we don't make each token lower case, that POS tag maybe different in
         # ways that are unhelpful. For example, if a sentence starts with a unit.
-        for token, tag in pos_tag([t.lower() for t in tokens]):
-            if self._is_numeric(token):
-                tag = "CD"
-            tags.append(tag)
+        with (
+            self.timer.stage("pos_tag"),
+            span("ingredient_parser.pos_tag", token_count=len(tokens)),
+        ):
+            for token, tag in pos_tag([t.lower() for t in tokens]):
+                if self._is_numeric(token):
+                    tag = "CD"
+                tags.append(tag)
         return tags
 
     def _is_unit(self, token: str) -> bool:
@@ -748,7 +959,7 @@ class PreProcessor:
         >>> p._is_unit("beef")
         False
         """
-        return token.lower() in UNITS.values()
+        return bool(token_flags(token) & IS_UNIT)
 
     def _is_punc(self, token: str) -> bool:
         """Return True if token is a punctuation mark.
@@ -773,7 +984,7 @@ class PreProcessor:
         >>> p._is_unit("beef")
         False
         """
-        return token in string.punctuation
+        return bool(token_flags(token) & IS_PUNC)
 
     def _is_numeric(self, token: str) -> bool:
         """Return True if token is numeric.
@@ -810,25 +1021,7 @@ class PreProcessor:
         >>> p._is_numeric("beef")
         False
         """
-        if "-" in token:
-            parts = token.split("-")
-            return all([self._is_numeric(part) for part in parts])
-
-        if token == "dozen":
-            return True
-
-        if token.endswith("x"):
-            try:
-                float(token[:-1])
-                return True
-            except ValueError:
-                return False
-
-        try:
-            float(token)
-            return True
-        except ValueError:
-            return False
+        return bool(token_flags(token) & IS_NUMERIC)
 
     def _follows_comma(self, index: int) -> bool:
         """Return True if token at index follows a comma (by any amount) in sentence.
@@ -887,7 +1080,7 @@ class PreProcessor:
         >>> p._is_capitalised("chicken")
         False
         """
-        return CAPITALISED_PATTERN.match(token) is not None
+        return _regex.CAPITALISED_PATTERN.match(token) is not None
 
     def _is_inside_parentheses(self, index: int) -> bool:
         """Return True if token is inside parentheses or is a parenthesis.
@@ -902,10 +1095,21 @@ class PreProcessor:
         bool
             True if index is inside parentheses or is parenthesis, else False
         """
-        # If it's "(" or ")", return True
-        if self.tokenized_sentence[index] in ["(", ")", "[", "]"]:
-            return True
+        return self._inside_parentheses()[index]
+
+    def _inside_parentheses(self) -> list[bool]:
+        """Return whether each token is inside parentheses or is a parenthesis.
+
+        The first opening parenthesis is paired with the first closing parenthesis,
+        the second with the second and so on, and the tokens between each pair are
+        inside parentheses.
 
+        Returns
+        -------
+        list[bool]
+            True for each token that is inside parentheses or is a parenthesis, else
+            False
+        """
         open_parens, closed_parens = [], []
         for i, token in enumerate(self.tokenized_sentence):
             if token == "(" or token == "[":
@@ -913,11 +1117,22 @@ class PreProcessor:
             elif token == ")" or token == "]":
                 closed_parens.append(i)
 
+        # Count the number of pairs each token is between by adding 1 to the count
+        # after each opening parenthesis and subtracting 1 at the paired closing
+        # parenthesis.
+        change = [0] * len(self.tokenized_sentence)
         for start, end in zip(open_parens, closed_parens):
-            if start < index < end:
-                return True
+            if start < end:
+                change[start + 1] += 1
+                change[end] -= 1
 
-        return False
+        inside = []
+        count = 0
+        for token, delta in zip(self.tokenized_sentence, change):
+            count += delta
+            inside.append(count > 0 or token in ["(", ")", "[", "]"])
+
+        return inside
 
     def _is_ambiguous_unit(self, token: str) -> bool:
         """Return True if token is in AMBIGUOUS_UNITS list.
@@ -946,55 +1161,92 @@ class PreProcessor:
         >>> p._is_ambiguous_unit("leaf")
         True
         """
-        return token in AMBIGUOUS_UNITS
+        return bool(token_flags(token) & IS_AMBIGUOUS_UNIT)
+
+    def _base_features(self) -> list[dict[str, str | bool]]:
+        """Return the features of each token that are also used by its neighbours.
 
-    def _token_features(self, index: int) -> dict[str, str | bool]:
+        These are calculated once for each token, then used for the features of the
+        token and of the tokens up to two either side of it.
+
+        Returns
+        -------
+        list[dict[str, str | bool]]
+            Dictionary of base features for each token
+        """
+        inside_parens = self._inside_parentheses()
+        after_comma, after_plus = False, False
+
+        base_features = []
+        for token, feature_token, in_parens in zip(
+            self.tokenized_sentence, self._feature_tokens, inside_parens
+        ):
+            flags = token_flags(feature_token)
+            base_features.append(
+                {
+                    "stem": stem(feature_token),
+                    "is_capitalised": self._is_capitalised(feature_token),
+                    "is_unit": bool(flags & IS_UNIT),
+                    "is_punc": bool(flags & IS_PUNC),
+                    "is_ambiguous": bool(flags & IS_AMBIGUOUS_UNIT),
+                    "is_in_parens": in_parens,
+                    "is_after_comma": after_comma,
+                    "is_after_plus": after_plus,
+                }
+            )
+            # A comma or plus only affects the tokens after it
+            after_comma = after_comma or token == ","
+            after_plus = after_plus or token == "plus"
+
+        return base_features
+
+    def _token_features(
+        self, index: int, base_features: list[dict[str, str | bool]] | None = None
+    ) -> dict[str, str | bool]:
         """Return the features for each token in the sentence.
 
         Parameters
         ----------
         index : int
             Index of token to get features for.
+        base_features : list[dict[str, str | bool]] | None, optional
+            Base features of each token, from _base_features. If None, they are
+            calculated.
 
         Returns
         -------
         dict[str, str | bool]
             Dictionary of features for token at index
         """
+        if base_features is None:
+            base_features = self._base_features()
+
         token = self._feature_tokens[index]
+        base = base_features[index]
         features = {
             "bias": "",
-            "stem": stem(token),
+            "stem": base["stem"],
             "pos": self.pos_tags[index],
-            "is_capitalised": self._is_capitalised(token),
-            "is_unit": self._is_unit(token),
-            "is_punc": self._is_punc(token),
-            "is_ambiguous": self._is_ambiguous_unit(token),
-            "is_in_parens": self._is_inside_parentheses(index),
-            "is_after_comma": self._follows_comma(index),
-            "is_after_plus": self._follows_plus(index),
+            "is_capitalised": base["is_capitalised"],
+            "is_unit": base["is_unit"],
+            "is_punc": base["is_punc"],
+            "is_ambiguous": base["is_ambiguous"],
+            "is_in_parens": base["is_in_parens"],
+            "is_after_comma": base["is_after_comma"],
+            "is_after_plus": base["is_after_plus"],
             "is_short_phrase": len(self.tokenized_sentence) < 3,
         }
 
-        if token != stem(token):
+        if token != base["stem"]:
             features["token"] = token
 
         if index > 0:
-            prev_token = self._feature_tokens[index - 1]
             features["prev_pos"] = "+".join(
                 (self.pos_tags[index - 1], self.pos_tags[index])
             )
-            features["prev_stem"] = stem(prev_token)
-            features["prev_is_capitalised"] = self._is_capitalised(prev_token)
-            features["prev_is_unit"] = self._is_unit(prev_token)
-            features["prev_is_punc"] = self._is_punc(prev_token)
-            features["prev_is_ambiguous"] = self._is_ambiguous_unit(prev_token)
-            features["prev_is_in_parens"] = self._is_inside_parentheses(index - 1)
-            features["prev_is_after_comma"] = self._follows_comma(index - 1)
-            features["prev_is_after_plus"] = self._follows_plus(index - 1)
+            features.update(zip(PREV_FEATURES, base_features[index - 1].values()))
 
         if index > 1:
-            prev_token2 = self._feature_tokens[index - 2]
             features["prev_pos2"] = "+".join(
                 (
                     self.pos_tags[index - 2],
@@ -1002,31 +1254,15 @@ class PreProcessor:
                     self.pos_tags[index],
                 )
             )
-            features["prev_stem2"] = stem(prev_token2)
-            features["prev_is_capitalised2"] = self._is_capitalised(prev_token2)
-            features["prev_is_unit2"] = self._is_unit(prev_token2)
-            features["prev_is_punc2"] = self._is_punc(prev_token2)
-            features["prev_is_ambiguous2"] = self._is_ambiguous_unit(prev_token2)
-            features["prev_is_in_parens2"] = self._is_inside_parentheses(index - 2)
-            features["prev_is_after_comma2"] = self._follows_comma(index - 2)
-            features["prev_is_after_plus2"] = self._follows_plus(index - 2)
+            features.update(zip(PREV_FEATURES2, base_features[index - 2].values()))
 
         if index < len(self._feature_tokens) - 1:
-            next_token = self._feature_tokens[index + 1]
             features["next_pos"] = "+".join(
                 (self.pos_tags[index], self.pos_tags[index + 1])
             )
-            features["next_stem"] = stem(next_token)
-            features["next_is_capitalised"] = self._is_capitalised(next_token)
-            features["next_is_unit"] = self._is_unit(next_token)
-            features["next_is_punc"] = self._is_punc(next_token)
-            features["next_is_ambiguous"] = self._is_ambiguous_unit(next_token)
-            features["next_is_in_parens"] = self._is_inside_parentheses(index + 1)
-            features["next_is_after_comma"] = self._follows_comma(index + 1)
-            features["next_is_after_plus"] = self._follows_plus(index + 1)
+            features.update(zip(NEXT_FEATURES, base_features[index + 1].values()))
 
         if index < len(self._feature_tokens) - 2:
-            next_token2 = self._feature_tokens[index + 2]
             features["next_pos2"] = "+".join(
                 (
                     self.pos_tags[index + 2],
@@ -1034,17 +1270,38 @@ class PreProcessor:
                     self.pos_tags[index],
                 )
             )
-            features["next_stem2"] = stem(next_token2)
-            features["next_is_capitalised2"] = self._is_capitalised(next_token2)
-            features["next_is_unit2"] = self._is_unit(next_token2)
-            features["next_is_punc2"] = self._is_punc(next_token2)
-            features["next_is_ambiguous2"] = self._is_ambiguous_unit(next_token2)
-            features["next_is_in_parens2"] = self._is_inside_parentheses(index + 2)
-            features["next_is_after_comma2"] = self._follows_comma(index + 2)
-            features["next_is_after_plus2"] = self._follows_plus(index + 2)
+            features.update(zip(NEXT_FEATURES2, base_features[index + 2].values()))
 
         return features
 
+    @property
+    def feature_tokens(self) -> list[str]:
+        """Tokens used to calculate features, with numeric tokens replaced by "!num".
+
+        Returns
+        -------
+        list[str]
+            List of feature tokens
+        """
+        return self._feature_tokens
+
+    def tag_deferred_pos(self) -> list[str]:
+        """Perform part of speech tagging now, if it was deferred.
+
+        If part of speech tagging was not deferred, or has already been performed,
+        the existing tags are returned.
+
+        Returns
+        -------
+        list[str]
+            Part of speech tag for each token in the tokenized sentence.
+        """
+        if self.defer_pos_tagging:
+            self.pos_tags = self._tag_partofspeech(self.tokenized_sentence)
+            self.defer_pos_tagging = False
+
+        return self.pos_tags
+
     def sentence_features(self) -> list[dict[str, str | bool]]:
         """Return features for all tokens in sentence.
 
@@ -1053,12 +1310,19 @@ class PreProcessor:
         list[dict[str, str | bool]]
             List of features for each token in sentence
         """
-        if self.defer_pos_tagging:
+        with span(
+            "ingredient_parser.sentence_features",
+            token_count=len(self.tokenized_sentence),
+        ):
             # If part of speech tagging was deferred, do it now
-            self.pos_tags = self._tag_partofspeech(self.tokenized_sentence)
-
-        features = []
-        for idx, _ in enumerate(self.tokenized_sentence):
-            features.append(self._token_features(idx))
+            self.tag_deferred_pos()
+
+            with self.timer.stage("features"):
+                # The base features of each token are only calculated once, because
+                # they are also used for the features of the neighbouring tokens.
+                base_features = self._base_features()
+                features = []
+                for idx, _ in enumerate(self.tokenized_sentence):
+                    features.append(self._token_features(idx, base_features))
 
         return features
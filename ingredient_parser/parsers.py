@@ -1,10 +1,28 @@
 #!/usr/bin/env python3
 
-from ingredient_parser.en import inspect_parser_en, parse_ingredient_en
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from ingredient_parser.en import warmup_en
+from ingredient_parser.en._utils import reregister_units
+from ingredient_parser.en.parser import ModelCascade, get_labeller
 
 from . import SUPPORTED_LANGUAGES
+from ._batching import MicroBatcher
+from ._cache import CACHES, PersistentCache, copy_parsed_ingredient
+from ._session import IngredientParser
 from .dataclasses import ParsedIngredient, ParserDebugInfo
 
+# Parser used by the module level functions for each language. These use the caches
+# configured by enable_cache.
+_DEFAULT_PARSERS = {
+    lang: IngredientParser(lang, caches=CACHES) for lang in SUPPORTED_LANGUAGES
+}
+
 
 def parse_ingredient(
     sentence: str,
@@ -13,6 +31,7 @@ def parse_ingredient(
     expect_name_in_output: bool = True,
     string_units: bool = False,
     imperial_units: bool = False,
+    model: str | ModelCascade | None = None,
 ) -> ParsedIngredient:
     """Parse an ingredient sentence to return structured data.
 
@@ -42,6 +61,13 @@ def parse_ingredient(
         for the the following units: fluid ounce, cup, pint, quart, gallon.
         Default is False, which results in US customary units being used.
         This has no effect if string_units=True.
+    model : str | ModelCascade | None, optional
+        Model to label the sentence with. This is either the file name of a model
+        shipped with this package or the path to a model file. The shipped models
+        are: model.6k.en.crfsuite, model.15k.en.crfsuite, model.original.en.crfsuite.
+        A ModelCascade can be used to only use a larger model when the smaller one
+        is not confident.
+        If None, the default model (model.6k.en.crfsuite) is used.
 
     Returns
     -------
@@ -51,15 +77,34 @@ def parse_ingredient(
     if lang not in SUPPORTED_LANGUAGES:
         raise ValueError(f'Unsupported language "{lang}"')
 
+    return _DEFAULT_PARSERS[lang].parse(
+        sentence,
+        discard_isolated_stop_words=discard_isolated_stop_words,
+        expect_name_in_output=expect_name_in_output,
+        string_units=string_units,
+        imperial_units=imperial_units,
+        model=model,
+    )
+
+
+def _model_id(lang: str, model: str | ModelCascade | None) -> str:
+    """Return identifier of the model used to parse sentences in language.
+
+    Parameters
+    ----------
+    lang : str
+        Language of sentence
+    model : str | ModelCascade | None
+        Model selected by the caller, or None for the default model.
+
+    Returns
+    -------
+    str
+        Model identifier
+    """
     match lang:
         case "en":
-            return parse_ingredient_en(
-                sentence,
-                discard_isolated_stop_words=discard_isolated_stop_words,
-                expect_name_in_output=expect_name_in_output,
-                string_units=string_units,
-                imperial_units=imperial_units,
-            )
+            return get_labeller(model).model
         case _:
             raise ValueError(f'Unrecognised value "{lang}"')
 
@@ -71,14 +116,26 @@ def parse_multiple_ingredients(
     expect_name_in_output: bool = True,
     string_units: bool = False,
     imperial_units: bool = False,
+    model: str | ModelCascade | None = None,
+    workers: int = 1,
+    chunksize: int = 64,
+    persistent_cache: PersistentCache | None = None,
+    share_duplicates: bool = False,
 ) -> list[ParsedIngredient]:
     """Parse multiple ingredient sentences in one go.
 
     This function accepts a list of sentences, with element of the list representing
     one ingredient sentence.
-    A list of dictionaries is returned, with optional confidence values.
-    This function is a simple for-loop that iterates through each element of the
-    input list.
+    A list of ParsedIngredient objects is returned, in the same order as the input
+    sentences.
+
+    Each distinct sentence in the input list is only parsed once, and the result is
+    used for every position that sentence appears in the list.
+
+    By default, this function is a simple for-loop that iterates through each distinct
+    sentence. If workers is greater than 1, the sentences are split into chunks and
+    distributed across a pool of worker processes. Each worker process loads the model
+    and part of speech tagger once when it starts.
 
     Parameters
     ----------
@@ -106,6 +163,32 @@ def parse_multiple_ingredients(
         for the the following units: fluid ounce, cup, pint, quart, gallon.
         Default is False, which results in US customary units being used.
         This has no effect if string_units=True.
+    model : str | ModelCascade | None, optional
+        Model to label the sentence with. This is either the file name of a model
+        shipped with this package or the path to a model file. The shipped models
+        are: model.6k.en.crfsuite, model.15k.en.crfsuite, model.original.en.crfsuite.
+        A ModelCascade can be used to only use a larger model when the smaller one
+        is not confident.
+        If None, the default model (model.6k.en.crfsuite) is used.
+    workers : int, optional
+        Number of worker processes to parse the sentences with.
+        If 1, the sentences are parsed sequentially in the current process.
+        Default is 1.
+    chunksize : int, optional
+        Number of sentences sent to a worker process at a time.
+        Larger values reduce the overhead of sending sentences to and results from
+        the worker processes. This has no effect if workers=1.
+        Default is 64.
+    persistent_cache : PersistentCache | None, optional
+        If provided, results for sentences found in the cache are returned from the
+        cache and only the remaining sentences are parsed. The newly parsed results
+        are then added to the cache.
+        Default is None.
+    share_duplicates : bool, optional
+        If True, every occurrence of a duplicated sentence in the input list is given
+        the same ParsedIngredient object, so modifying one modifies them all.
+        If False, each occurrence after the first is given a copy.
+        Default is False.
 
     Returns
     -------
@@ -113,17 +196,544 @@ def parse_multiple_ingredients(
         List of ParsedIngredient objects of structured data parsed
         from input sentences
     """
-    return [
-        parse_ingredient(
-            sentence,
-            lang=lang,
-            discard_isolated_stop_words=discard_isolated_stop_words,
-            expect_name_in_output=expect_name_in_output,
-            string_units=string_units,
-            imperial_units=imperial_units,
+    # Check the options before anything else, so invalid options raise even if no
+    # sentences need parsing
+    _check_batch_options(lang, workers, chunksize)
+
+    options = {
+        "lang": lang,
+        "discard_isolated_stop_words": discard_isolated_stop_words,
+        "expect_name_in_output": expect_name_in_output,
+        "string_units": string_units,
+        "imperial_units": imperial_units,
+        "model": model,
+    }
+
+    # Remove duplicates, preserving the order of first occurrence
+    distinct = list(dict.fromkeys(sentences))
+
+    if persistent_cache is None:
+        cached = [None] * len(distinct)
+    else:
+        cached = persistent_cache.get_many(distinct, **options)
+
+    unseen = [sentence for sentence, p in zip(distinct, cached) if p is None]
+    if len(unseen) <= 1:
+        workers = 1
+
+    parsed = list(
+        iparse_ingredients(unseen, workers=workers, chunksize=chunksize, **options)
+    )
+
+    if persistent_cache is not None and unseen:
+        persistent_cache.put_many(unseen, parsed, **options)
+
+    # Merge the newly parsed sentences with the cached ones
+    parsed_iter = iter(parsed)
+    results = {
+        sentence: p if p is not None else next(parsed_iter)
+        for sentence, p in zip(distinct, cached)
+    }
+
+    # Fan the results back out to every position in the input
+    output = []
+    seen = set()
+    for sentence in sentences:
+        result = results[sentence]
+        if sentence in seen and not share_duplicates:
+            result = copy_parsed_ingredient(result)
+
+        seen.add(sentence)
+        output.append(result)
+
+    return output
+
+
+def _check_batch_options(lang: str, workers: int, chunksize: int) -> None:
+    """Check the options for parsing a batch of sentences are valid.
+
+    Parameters
+    ----------
+    lang : str
+        Language of sentences.
+    workers : int
+        Number of worker processes.
+    chunksize : int
+        Number of sentences sent to a worker process at a time.
+
+    Raises
+    ------
+    ValueError
+        If lang is not supported, or workers or chunksize is less than 1.
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise ValueError(f'Unsupported language "{lang}"')
+
+    if workers < 1:
+        raise ValueError("workers must be greater than or equal to 1")
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be greater than or equal to 1")
+
+
+def iparse_ingredients(
+    sentences: Iterable[str],
+    lang: str = "en",
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    model: str | ModelCascade | None = None,
+    workers: int = 1,
+    chunksize: int = 64,
+) -> Iterator[ParsedIngredient]:
+    """Lazily parse ingredient sentences from an iterable.
+
+    This function accepts any iterable of sentences, such as a generator, a file
+    object or a database cursor, and yields a ParsedIngredient object for each
+    sentence in the same order as the input. Sentences are only read from the
+    iterable as they are needed, so the number of sentences in memory at any time is
+    bounded regardless of how many sentences the iterable produces.
+
+    Sentences are parsed exactly as they are provided, so lines read from a file
+    should have any trailing newline removed first.
+
+    If workers is greater than 1, chunks of sentences are distributed across a pool of
+    worker processes. At most 2 * workers chunks are being parsed or waiting to be
+    yielded at any time, so reading from the iterable is paused if the results are
+    not consumed.
+
+    Parameters
+    ----------
+    sentences : Iterable[str]
+        Iterable of sentences to parse
+    lang : str
+        Language of sentence.
+        Currently supported options are: en
+    discard_isolated_stop_words : bool, optional
+        If True, any isolated stop words in the name, preparation, or comment fields
+        are discarded.
+        Default is True.
+    expect_name_in_output : bool, optional
+        If True, if the model doesn't label any words in the sentence as the name,
+        fallback to selecting the most likely name from all tokens even though the
+        model gives it a different label. Note that this does guarantee the output
+        contains a name.
+        Default is True.
+    string_units : bool
+        If True, return all IngredientAmount units as strings.
+        If False, convert IngredientAmount units to pint.Unit objects where possible.
+        Default is False.
+    imperial_units : bool
+        If True, use imperial units instead of US customary units for pint.Unit objects
+        for the the following units: fluid ounce, cup, pint, quart, gallon.
+        Default is False, which results in US customary units being used.
+        This has no effect if string_units=True.
+    model : str | ModelCascade | None, optional
+        Model to label the sentence with. This is either the file name of a model
+        shipped with this package or the path to a model file. The shipped models
+        are: model.6k.en.crfsuite, model.15k.en.crfsuite, model.original.en.crfsuite.
+        A ModelCascade can be used to only use a larger model when the smaller one
+        is not confident.
+        If None, the default model (model.6k.en.crfsuite) is used.
+    workers : int, optional
+        Number of worker processes to parse the sentences with.
+        If 1, the sentences are parsed sequentially in the current process.
+        Default is 1.
+    chunksize : int, optional
+        Number of sentences sent to a worker process at a time.
+        This has no effect if workers=1.
+        Default is 64.
+
+    Returns
+    -------
+    Iterator[ParsedIngredient]
+        Iterator of ParsedIngredient objects of structured data parsed
+        from input sentences
+
+    Examples
+    --------
+    >>> with open("ingredients.txt") as f:
+    ...     lines = (line.strip() for line in f)
+    ...     for parsed in iparse_ingredients(lines, workers=4):
+    ...         print(parsed.name)
+    """
+    _check_batch_options(lang, workers, chunksize)
+
+    # Check the model exists now, rather than when the first sentence is parsed
+    _model_id(lang, model)
+
+    parse = partial(
+        parse_ingredient,
+        lang=lang,
+        discard_isolated_stop_words=discard_isolated_stop_words,
+        expect_name_in_output=expect_name_in_output,
+        string_units=string_units,
+        imperial_units=imperial_units,
+        model=model,
+    )
+
+    if workers == 1:
+        return map(parse, sentences)
+
+    return _iparse_in_workers(parse, sentences, lang, model, workers, chunksize)
+
+
+def _iparse_in_workers(
+    parse: Callable[[str], ParsedIngredient],
+    sentences: Iterable[str],
+    lang: str,
+    model: str | ModelCascade | None,
+    workers: int,
+    chunksize: int,
+) -> Iterator[ParsedIngredient]:
+    """Parse sentences in chunks using a pool of worker processes.
+
+    Parameters
+    ----------
+    parse : Callable[[str], ParsedIngredient]
+        Function to parse a single sentence. This must be picklable.
+    sentences : Iterable[str]
+        Iterable of sentences to parse
+    lang : str
+        Language of sentences
+    model : str | ModelCascade | None
+        Model used to parse sentences
+    workers : int
+        Number of worker processes
+    chunksize : int
+        Number of sentences sent to a worker process at a time
+
+    Yields
+    ------
+    ParsedIngredient
+        ParsedIngredient for each sentence, in the same order as the input
+    """
+    it = iter(sentences)
+    max_pending = 2 * workers
+    pending: deque[Future[list[ParsedIngredient]]] = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_initialise_worker, initargs=(lang, model)
+    ) as executor:
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    chunk = list(islice(it, chunksize))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(_parse_chunk, parse, chunk))
+
+                if not pending:
+                    return
+
+                # Yield from the oldest chunk so the output order matches the input
+                for parsed in pending.popleft().result():
+                    yield reregister_units(parsed)
+        finally:
+            # If the generator is closed early, don't parse the remaining chunks
+            for future in pending:
+                future.cancel()
+
+
+def _parse_chunk(
+    parse: Callable[[str], ParsedIngredient], sentences: list[str]
+) -> list[ParsedIngredient]:
+    """Parse a chunk of sentences in a worker process.
+
+    Parameters
+    ----------
+    parse : Callable[[str], ParsedIngredient]
+        Function to parse a single sentence
+    sentences : list[str]
+        Chunk of sentences to parse
+
+    Returns
+    -------
+    list[ParsedIngredient]
+        List of ParsedIngredient objects for chunk
+    """
+    return [parse(sentence) for sentence in sentences]
+
+
+def _initialise_worker(lang: str, model: str | ModelCascade | None) -> None:
+    """Load the resources required for parsing in a worker process.
+
+    This is called once when each worker process starts, so that the model and part
+    of speech tagger are not reloaded for each chunk of sentences.
+
+    Parameters
+    ----------
+    lang : str
+        Language of sentences the worker process will parse.
+    model : str | ModelCascade | None
+        Model the worker process will parse sentences with.
+    """
+    warmup(lang, model)
+
+
+async def parse_ingredient_async(
+    sentence: str,
+    lang: str = "en",
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    model: str | ModelCascade | None = None,
+) -> ParsedIngredient:
+    """Parse an ingredient sentence without blocking the asyncio event loop.
+
+    The sentence is parsed in an executor. Sentences submitted concurrently with the
+    same options are coalesced into batches, which are sent to the executor when the
+    batch is full or when the oldest sentence in the batch has waited for the maximum
+    latency. See configure_async_batching to change these limits and the executor.
+
+    Parameters
+    ----------
+    sentence : str
+        Ingredient sentence to parse
+    lang : str
+        Language of sentence.
+        Currently supported options are: en
+    discard_isolated_stop_words : bool, optional
+        If True, any isolated stop words in the name, preparation, or comment fields
+        are discarded.
+        Default is True.
+    expect_name_in_output : bool, optional
+        If True, if the model doesn't label any words in the sentence as the name,
+        fallback to selecting the most likely name from all tokens even though the
+        model gives it a different label. Note that this does guarantee the output
+        contains a name.
+        Default is True.
+    string_units : bool
+        If True, return all IngredientAmount units as strings.
+        If False, convert IngredientAmount units to pint.Unit objects where possible.
+        Default is False.
+    imperial_units : bool
+        If True, use imperial units instead of US customary units for pint.Unit objects
+        for the the following units: fluid ounce, cup, pint, quart, gallon.
+        Default is False, which results in US customary units being used.
+        This has no effect if string_units=True.
+    model : str | ModelCascade | None, optional
+        Model to label the sentence with. This is either the file name of a model
+        shipped with this package or the path to a model file. The shipped models
+        are: model.6k.en.crfsuite, model.15k.en.crfsuite, model.original.en.crfsuite.
+        A ModelCascade can be used to only use a larger model when the smaller one
+        is not confident.
+        If None, the default model (model.6k.en.crfsuite) is used.
+
+    Returns
+    -------
+    ParsedIngredient
+        ParsedIngredient object of structured data parsed from input string
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise ValueError(f'Unsupported language "{lang}"')
+
+    options = (
+        lang,
+        discard_isolated_stop_words,
+        expect_name_in_output,
+        string_units,
+        imperial_units,
+        model,
+    )
+    return await _ASYNC_BATCHER.submit(options, sentence)
+
+
+async def parse_many_async(
+    sentences: list[str],
+    lang: str = "en",
+    discard_isolated_stop_words: bool = True,
+    expect_name_in_output: bool = True,
+    string_units: bool = False,
+    imperial_units: bool = False,
+    model: str | ModelCascade | None = None,
+) -> list[ParsedIngredient]:
+    """Parse multiple ingredient sentences without blocking the asyncio event loop.
+
+    The sentences are batched together with any other sentences being parsed
+    concurrently with parse_ingredient_async or parse_many_async.
+
+    Parameters
+    ----------
+    sentences : list[str]
+        List of sentences to parse
+    lang : str
+        Language of sentence.
+        Currently supported options are: en
+    discard_isolated_stop_words : bool, optional
+        If True, any isolated stop words in the name, preparation, or comment fields
+        are discarded.
+        Default is True.
+    expect_name_in_output : bool, optional
+        If True, if the model doesn't label any words in the sentence as the name,
+        fallback to selecting the most likely name from all tokens even though the
+        model gives it a different label. Note that this does guarantee the output
+        contains a name.
+        Default is True.
+    string_units : bool
+        If True, return all IngredientAmount units as strings.
+        If False, convert IngredientAmount units to pint.Unit objects where possible.
+        Default is False.
+    imperial_units : bool
+        If True, use imperial units instead of US customary units for pint.Unit objects
+        for the the following units: fluid ounce, cup, pint, quart, gallon.
+        Default is False, which results in US customary units being used.
+        This has no effect if string_units=True.
+    model : str | ModelCascade | None, optional
+        Model to label the sentence with. This is either the file name of a model
+        shipped with this package or the path to a model file. The shipped models
+        are: model.6k.en.crfsuite, model.15k.en.crfsuite, model.original.en.crfsuite.
+        A ModelCascade can be used to only use a larger model when the smaller one
+        is not confident.
+        If None, the default model (model.6k.en.crfsuite) is used.
+
+    Returns
+    -------
+    list[ParsedIngredient]
+        List of ParsedIngredient objects of structured data parsed
+        from input sentences
+    """
+    return list(
+        await asyncio.gather(
+            *[
+                parse_ingredient_async(
+                    sentence,
+                    lang=lang,
+                    discard_isolated_stop_words=discard_isolated_stop_words,
+                    expect_name_in_output=expect_name_in_output,
+                    string_units=string_units,
+                    imperial_units=imperial_units,
+                    model=model,
+                )
+                for sentence in sentences
+            ]
         )
-        for sentence in sentences
-    ]
+    )
+
+
+def configure_async_batching(
+    max_batch_size: int = 64,
+    max_latency: float = 0.002,
+    executor: Executor | None = None,
+) -> None:
+    """Configure how parse_ingredient_async and parse_many_async batch sentences.
+
+    Any executor created by a previous configuration is shut down without waiting,
+    so this can be called from a running event loop. Sentences already being parsed
+    by the previous configuration are still returned, but sentences still waiting
+    for a batch to fill are cancelled.
+
+    Parameters
+    ----------
+    max_batch_size : int, optional
+        Maximum number of sentences in a batch.
+        Default is 64.
+    max_latency : float, optional
+        Maximum time, in seconds, a sentence waits for a batch to fill before the
+        batch is parsed.
+        Default is 0.002.
+    executor : Executor | None, optional
+        Executor to parse batches in. The caller is responsible for shutting this
+        down.
+        If None, a ThreadPoolExecutor managed by this package is used.
+    """
+    global _ASYNC_BATCHER
+    previous = _ASYNC_BATCHER
+    _ASYNC_BATCHER = MicroBatcher(
+        _parse_batch,
+        max_batch_size=max_batch_size,
+        max_latency=max_latency,
+        executor=executor,
+    )
+    previous.shutdown(wait=False)
+
+
+def _parse_batch(
+    options: tuple[str, bool, bool, bool, bool, str | ModelCascade | None],
+    sentences: list[str],
+) -> list[ParsedIngredient | Exception]:
+    """Parse a batch of sentences that share the same options.
+
+    Parameters
+    ----------
+    options : tuple[str, bool, bool, bool, bool, str | ModelCascade | None]
+        lang, discard_isolated_stop_words, expect_name_in_output, string_units,
+        imperial_units and model options for parse_ingredient.
+    sentences : list[str]
+        Batch of sentences to parse
+
+    Returns
+    -------
+    list[ParsedIngredient | Exception]
+        ParsedIngredient for each sentence, or the Exception raised whilst parsing it.
+    """
+    lang, discard_stop_words, expect_name, string, imperial, model = options
+
+    parsed = []
+    for sentence in sentences:
+        try:
+            parsed.append(
+                parse_ingredient(
+                    sentence,
+                    lang=lang,
+                    discard_isolated_stop_words=discard_stop_words,
+                    expect_name_in_output=expect_name,
+                    string_units=string,
+                    imperial_units=imperial,
+                    model=model,
+                )
+            )
+        except Exception as e:
+            parsed.append(e)
+
+    return parsed
+
+
+_ASYNC_BATCHER = MicroBatcher(_parse_batch)
+
+
+def warmup(
+    lang: str = "en", model: str | ModelCascade | None = None
+) -> dict[str, float]:
+    """Load everything required to parse sentences, instead of on first use.
+
+    The model, part of speech tagger, unit registry and other resources are loaded
+    lazily, which makes parsing the first sentence much slower than parsing later
+    ones. Call this function before serving requests (for example, before forking
+    worker processes or from a readiness check) so the first parse is not delayed.
+    A sentence is also parsed to make sure any remaining lazy initialisation is done.
+
+    Parameters
+    ----------
+    lang : str
+        Language of sentences that will be parsed.
+        Currently supported options are: en
+    model : str | ModelCascade | None, optional
+        Model to load. This is either the file name of a model shipped with this
+        package, the path to a model file or a ModelCascade.
+        If None, the default model is used.
+
+    Returns
+    -------
+    dict[str, float]
+        Time, in seconds, taken to load each component.
+
+    Examples
+    --------
+    >>> timings = warmup()
+    >>> timings["model"]
+    0.0215
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise ValueError(f'Unsupported language "{lang}"')
+
+    match lang:
+        case "en":
+            return warmup_en(model)
+        case _:
+            raise ValueError(f'Unrecognised value "{lang}"')
 
 
 def inspect_parser(
@@ -133,6 +743,7 @@ def inspect_parser(
     expect_name_in_output: bool = True,
     string_units: bool = False,
     imperial_units: bool = False,
+    model: str | ModelCascade | None = None,
 ) -> ParserDebugInfo:
     """Dataclass for holding intermediate objects generated during parsing.
 
@@ -162,6 +773,13 @@ def inspect_parser(
         for the the following units: fluid ounce, cup, pint, quart, gallon.
         Default is False, which results in US customary units being used.
         This has no effect if string_units=True.
+    model : str | ModelCascade | None, optional
+        Model to label the sentence with. This is either the file name of a model
+        shipped with this package or the path to a model file. The shipped models
+        are: model.6k.en.crfsuite, model.15k.en.crfsuite, model.original.en.crfsuite.
+        A ModelCascade can be used to only use a larger model when the smaller one
+        is not confident.
+        If None, the default model (model.6k.en.crfsuite) is used.
 
     Returns
     -------
@@ -172,14 +790,11 @@ def inspect_parser(
     if lang not in SUPPORTED_LANGUAGES:
         raise ValueError(f'Unsupported language "{lang}"')
 
-    match lang:
-        case "en":
-            return inspect_parser_en(
-                sentence,
-                discard_isolated_stop_words=discard_isolated_stop_words,
-                expect_name_in_output=expect_name_in_output,
-                string_units=string_units,
-                imperial_units=imperial_units,
-            )
-        case _:
-            raise ValueError(f'Unrecognised value "{lang}"')
+    return _DEFAULT_PARSERS[lang].inspect(
+        sentence,
+        discard_isolated_stop_words=discard_isolated_stop_words,
+        expect_name_in_output=expect_name_in_output,
+        string_units=string_units,
+        imperial_units=imperial_units,
+        model=model,
+    )
@@ -1,6 +1,17 @@
 import pytest
 
 from ingredient_parser.en import PreProcessor
+from ingredient_parser.en._constants import (
+    _TOKEN_FLAGS_MEMO,
+    IS_AMBIGUOUS_UNIT,
+    IS_APPROXIMATE,
+    IS_NUMERIC,
+    IS_PUNC,
+    IS_STOP_WORD,
+    IS_UNIT,
+    TOKEN_FLAGS,
+    token_flags,
+)
 
 
 @pytest.fixture
@@ -98,6 +109,55 @@ class TestPreProcessor_is_numeric:
         """
         assert p._is_numeric("dozen")
 
+    def test_multiplier(self, p):
+        """
+        "2x" is numeric, but "x" is not
+        """
+        assert p._is_numeric("2x")
+        assert not p._is_numeric("x")
+
+    def test_special_float(self, p):
+        """
+        "nan" is numeric, because float() accepts it
+        """
+        assert p._is_numeric("nan")
+        assert p._is_numeric("Infinity")
+
+
+class Test_token_flags:
+    def test_lexicon_token(self):
+        """
+        Tokens in the lexicon have precomputed flags
+        """
+        assert "cloves" in TOKEN_FLAGS
+        assert token_flags("cloves") == IS_AMBIGUOUS_UNIT
+        assert token_flags("clove") == IS_UNIT | IS_AMBIGUOUS_UNIT
+
+    def test_case(self):
+        """
+        Unit and approximate flags ignore case, stop word flags do not
+        """
+        assert token_flags("CUP") & IS_UNIT
+        assert token_flags("About") & IS_APPROXIMATE
+        assert not token_flags("About") & IS_STOP_WORD
+        assert token_flags("about") & IS_STOP_WORD
+
+    def test_punctuation_substring(self):
+        """
+        Any substring of string.punctuation is flagged as punctuation
+        """
+        assert token_flags("/") & IS_PUNC
+        assert token_flags("()") & IS_PUNC
+        assert not token_flags(")(") & IS_PUNC
+
+    def test_memo(self):
+        """
+        Flags for tokens not in the lexicon are remembered
+        """
+        assert token_flags("1-1.5") == IS_NUMERIC
+        assert _TOKEN_FLAGS_MEMO["1-1.5"] == IS_NUMERIC
+        assert token_flags("beef") == 0
+
 
 class TestPreProcessor_is_capitalised:
     def test_capitalised(self, p):
@@ -167,6 +227,31 @@ class TestPreProcessor_is_inside_parentheses:
         assert not p._is_inside_parentheses(6)
         assert p._is_inside_parentheses(9)
 
+    def test_nested_parens(self):
+        """
+        Tokens inside nested parens are inside parens
+        """
+        p = PreProcessor("salt (a (b) c) d", defer_pos_tagging=True)
+        assert p._inside_parentheses() == [
+            False,
+            True,
+            True,
+            True,
+            True,
+            True,
+            True,
+            True,
+            False,
+        ]
+
+    def test_unbalanced_parens(self):
+        """
+        Tokens between a closing parenthesis and a later opening parenthesis are not
+        inside parens
+        """
+        p = PreProcessor("salt) a (b", defer_pos_tagging=True)
+        assert p._inside_parentheses() == [False, True, False, True, False]
+
 
 class TestPreProcess_follows_plus:
     def test_no_plus(self):
@@ -284,3 +369,29 @@ class TestPreProcessor_is_ambiguous_unit:
         Cup is not indicated as ambiguous unit
         """
         assert not p._is_ambiguous_unit("cup")
+
+
+class TestPreProcessor_token_features:
+    def test_window_features(self):
+        """
+        The features of the neighbouring tokens are the same as those tokens' own
+        features
+        """
+        p = PreProcessor("2 cups (500 ml) milk, plus extra, warmed")
+        features = p.sentence_features()
+
+        for i in range(2, len(features) - 2):
+            for name in ["stem", "is_unit", "is_in_parens", "is_after_comma"]:
+                assert features[i][f"prev_{name}2"] == features[i - 2][name]
+                assert features[i][f"prev_{name}"] == features[i - 1][name]
+                assert features[i][f"next_{name}"] == features[i + 1][name]
+                assert features[i][f"next_{name}2"] == features[i + 2][name]
+
+    def test_without_base_features(self):
+        """
+        The features are the same if the base features are not precomputed
+        """
+        p = PreProcessor("2 cups (500 ml) milk, plus extra, warmed")
+        features = p.sentence_features()
+
+        assert [p._token_features(i) for i in range(len(features))] == features
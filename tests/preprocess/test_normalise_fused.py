@@ -0,0 +1,111 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+from ingredient_parser._timing import StageTimer
+from ingredient_parser.en import PreProcessor
+
+DATA = Path(__file__).parents[2] / "train" / "data"
+
+
+@pytest.fixture
+def p():
+    """Define an empty PreProcessor object to use for testing the PreProcessor
+    class methods.
+    """
+    return PreProcessor("", defer_pos_tagging=True)
+
+
+def normalise_in_steps(p: PreProcessor, sentence: str) -> str:
+    """Normalise sentence by applying each normalisation step in turn.
+
+    A timer that times each step makes _normalise apply each step in turn instead
+    of using _normalise_fused.
+    """
+    p.timer = StageTimer(per_step=True)
+    p.normalisation_trace = []
+    return p._normalise(sentence)
+
+
+class TestPreProcessor_normalise_fused:
+    def test_no_changes(self, p):
+        """
+        A sentence that no step changes is returned unchanged
+        """
+        assert p._normalise_fused("salt and pepper") == "salt and pepper"
+
+    def test_all_steps(self, p):
+        """
+        The output is the same as applying each step in turn for a sentence that
+        most steps change
+        """
+        input_sentence = "one&frac12; – 2 ½tbsp. to 3tbsp. x flour"
+        assert p._normalise_fused(input_sentence) == normalise_in_steps(
+            p, input_sentence
+        )
+
+    def test_created_unit_period(self, p):
+        """
+        Removing a trailing period that creates another unit with a trailing period
+        gives the same output as applying each step in turn
+        """
+        input_sentence = "1 lb.s. flour"
+        assert p._normalise_fused(input_sentence) == normalise_in_steps(
+            p, input_sentence
+        )
+
+    @pytest.mark.parametrize(
+        "csv_path",
+        [
+            DATA / "bbc" / "bbc-ingredients-snapshot-2017.csv",
+            DATA / "cookstr" / "cookstr-ingredients-snapshot-2017.csv",
+        ],
+        ids=["bbc", "cookstr"],
+    )
+    def test_training_corpora(self, p, csv_path):
+        """
+        The output is identical to applying each step in turn for every sentence in
+        the training data
+        """
+        if not csv_path.exists():
+            pytest.skip(f"{csv_path} not found")
+
+        with open(csv_path, encoding="utf-8") as f:
+            sentences = [row["input"] for row in csv.DictReader(f)]
+
+        mismatches = [
+            sentence
+            for sentence in sentences
+            if p._normalise_fused(sentence) != normalise_in_steps(p, sentence)
+        ]
+        assert mismatches == []
+
+
+class TestPreProcessor_trace_normalisation:
+    def test_single_pass(self):
+        """
+        Test the trace is recorded for a sentence normalised in a single pass, and
+        the output of the last step is the normalised sentence
+        """
+        p = PreProcessor("one 400g can tomatoes", defer_pos_tagging=True)
+        assert p.normalisation_trace == []
+
+        trace = p.trace_normalisation()
+        assert len(trace) == 12
+        assert trace[1] == ("_replace_string_numbers", "1 400g can tomatoes")
+        assert trace[-1][1].strip() == p.sentence
+
+    def test_already_recorded(self):
+        """
+        Test the recorded trace is returned without applying the steps again
+        """
+        p = PreProcessor(
+            "one 400g can tomatoes",
+            defer_pos_tagging=True,
+            timer=StageTimer(per_step=True),
+        )
+        trace = p.normalisation_trace
+
+        assert p.trace_normalisation() is trace
+        assert len(trace) == 12
@@ -76,3 +76,34 @@ class TestPreProcessor_replace_string_numbers:
         """
         input_sentence = "One-two splashes orange juice"
         assert p._replace_string_numbers(input_sentence) == "1-2 splashes orange juice"
+
+    def test_one_half(self, p):
+        """
+        "one-half" is converted to a fraction, not to "1-half"
+        """
+        input_sentence = "one-half cup sugar"
+        assert p._replace_string_numbers(input_sentence) == "1/2 cup sugar"
+
+    def test_repeated(self, p):
+        """
+        Every occurrence of a string number is converted if any occurrence is valid
+        """
+        input_sentence = "two-spice and two-inch pieces"
+        assert p._replace_string_numbers(input_sentence) == "2-spice and 2-inch pieces"
+
+    def test_hyphen_then_replaced_number(self, p):
+        """
+        The string number followed by a hyphen and a string number that was
+        converted first is not converted, the same as checking each string number
+        in turn
+        """
+        input_sentence = "two-one cups stock"
+        assert p._replace_string_numbers(input_sentence) == "two-1 cups stock"
+
+    def test_hyphen_then_unit_without_space(self, p):
+        """
+        The string number followed by a hyphen and a unit that is not followed by a
+        space is not converted
+        """
+        input_sentence = "one-cup"
+        assert p._replace_string_numbers(input_sentence) == "one-cup"
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+
+import pytest
+
+from ingredient_parser._batching import MicroBatcher
+
+
+def _double(key, items):
+    return [(key, len(items), item * 2) for item in items]
+
+
+class Test_MicroBatcher:
+    def test_results(self):
+        """
+        Test each submitted item gets its own result
+        """
+        batcher = MicroBatcher(_double)
+
+        async def run():
+            return await asyncio.gather(*[batcher.submit("k", i) for i in range(5)])
+
+        results = asyncio.run(run())
+        assert [r[2] for r in results] == [0, 2, 4, 6, 8]
+        batcher.shutdown()
+
+    def test_max_batch_size(self):
+        """
+        Test concurrent items are split into batches no larger than max_batch_size
+        """
+        batcher = MicroBatcher(_double, max_batch_size=4, max_latency=1)
+
+        async def run():
+            return await asyncio.gather(*[batcher.submit("k", i) for i in range(8)])
+
+        results = asyncio.run(run())
+        assert [r[1] for r in results] == [4] * 8
+        batcher.shutdown()
+
+    def test_keys_not_mixed(self):
+        """
+        Test items with different keys are not batched together
+        """
+        batcher = MicroBatcher(_double)
+
+        async def run():
+            return await asyncio.gather(
+                batcher.submit("a", 1), batcher.submit("b", 2), batcher.submit("a", 3)
+            )
+
+        results = asyncio.run(run())
+        assert results == [("a", 2, 2), ("b", 1, 4), ("a", 2, 6)]
+        batcher.shutdown()
+
+    def test_exception(self):
+        """
+        Test an exception result is raised for that item only
+        """
+
+        def func(key, items):
+            return [ValueError() if item < 0 else item for item in items]
+
+        batcher = MicroBatcher(func)
+
+        async def run():
+            return await asyncio.gather(
+                batcher.submit("k", 1), batcher.submit("k", -1), return_exceptions=True
+            )
+
+        first, second = asyncio.run(run())
+        assert first == 1
+        assert isinstance(second, ValueError)
+        batcher.shutdown()
+
+    def test_shutdown_without_waiting(self):
+        """
+        Test shutdown(wait=False) returns whilst a batch is running, and the running
+        batch still returns its results
+        """
+        started = threading.Event()
+        release = threading.Event()
+
+        def func(key, items):
+            started.set()
+            release.wait()
+            return items
+
+        batcher = MicroBatcher(func, max_latency=0)
+
+        async def run():
+            task = asyncio.ensure_future(batcher.submit("k", 1))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            batcher.shutdown(wait=False)
+            release.set()
+            return await task
+
+        assert asyncio.run(run()) == 1
+
+    def test_shutdown_cancels_pending(self):
+        """
+        Test items waiting for a batch to fill are cancelled by shutdown
+        """
+        batcher = MicroBatcher(_double, max_latency=0.01)
+
+        async def run():
+            task = asyncio.ensure_future(batcher.submit("k", 1))
+            await asyncio.sleep(0)
+            batcher.shutdown(wait=False)
+            return await asyncio.gather(task, return_exceptions=True)
+
+        (result,) = asyncio.run(run())
+        assert isinstance(result, asyncio.CancelledError)
+
+    def test_submit_after_shutdown(self):
+        """
+        Test RuntimeError is raised if an item is submitted after shutdown
+        """
+        batcher = MicroBatcher(_double)
+        batcher.shutdown()
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(batcher.submit("k", 1))
+
+    def test_invalid_batch_size(self):
+        """
+        Test ValueError is raised if max_batch_size is less than 1
+        """
+        with pytest.raises(ValueError):
+            MicroBatcher(_double, max_batch_size=0)
@@ -0,0 +1,312 @@
+import pytest
+
+from ingredient_parser import (
+    cache_info,
+    disable_cache,
+    enable_cache,
+    parse_ingredient,
+    parse_multiple_ingredients,
+)
+from ingredient_parser._cache import (
+    LRUCache,
+    PersistentCache,
+    copy_parsed_ingredient,
+)
+
+
+class Test_LRUCache:
+    def test_disabled(self):
+        """
+        Test nothing is stored when maxsize is 0
+        """
+        cache = LRUCache()
+        cache.put("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_get_put(self):
+        """
+        Test stored values are returned and hits and misses counted
+        """
+        cache = LRUCache(2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+
+        info = cache.info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_eviction(self):
+        """
+        Test the least recently used value is evicted
+        """
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.info().evictions == 1
+
+    def test_resize(self):
+        """
+        Test reducing the size evicts values
+        """
+        cache = LRUCache(3)
+        for i in range(3):
+            cache.put(i, i)
+        cache.resize(1)
+
+        assert len(cache) == 1
+        assert cache.get(2) == 2
+
+    def test_invalid_maxsize(self):
+        """
+        Test ValueError is raised for negative maxsize
+        """
+        with pytest.raises(ValueError):
+            LRUCache(-1)
+
+
+class Test_result_cache:
+    def setup_method(self):
+        enable_cache(maxsize=8)
+
+    def teardown_method(self):
+        disable_cache()
+
+    def test_hit(self):
+        """
+        Test parsing the same sentence twice is a cache hit with equal output
+        """
+        first = parse_ingredient("2 cups flour")
+        second = parse_ingredient("2 cups flour")
+
+        assert first == second
+        assert cache_info().hits == 1
+        assert cache_info().misses == 1
+
+    def test_options_in_key(self):
+        """
+        Test the same sentence with different options is not a cache hit
+        """
+        parse_ingredient("2 cups flour")
+        parsed = parse_ingredient("2 cups flour", string_units=True)
+
+        assert parsed.amount[0].unit == "cups"
+        assert cache_info().hits == 0
+
+    def test_model_in_key(self):
+        """
+        Test the same sentence parsed with a different model is not a cache hit
+        """
+        parse_ingredient("2 cups flour")
+        parse_ingredient("2 cups flour", model="model.15k.en.crfsuite")
+
+        assert cache_info().hits == 0
+        assert cache_info("labels").hits == 0
+
+    def test_mutation(self):
+        """
+        Test modifying a returned object does not modify the cached result
+        """
+        first = parse_ingredient("2 cups flour")
+        first.name.text = "sugar"
+        first.amount.clear()
+
+        second = parse_ingredient("2 cups flour")
+        assert second.name.text != "sugar"
+        assert len(second.amount) == 1
+
+    @pytest.mark.parametrize(
+        "sizes", [{"normalised_maxsize": -1}, {"labels_maxsize": -1}]
+    )
+    def test_invalid_size_unchanged(self, sizes):
+        """
+        Test an invalid size raises ValueError without changing any cache
+        """
+        with pytest.raises(ValueError):
+            enable_cache(10, **sizes)
+
+        assert cache_info().maxsize == 8
+        assert cache_info("normalised").maxsize == 8
+        assert cache_info("labels").maxsize == 8
+
+    def test_invalid_size_disabled(self):
+        """
+        Test an invalid size does not enable disabled caches
+        """
+        disable_cache()
+        with pytest.raises(ValueError):
+            enable_cache(10, normalised_maxsize=-1)
+
+        assert cache_info().maxsize == 0
+
+
+class Test_copy_parsed_ingredient:
+    def test_copy(self):
+        """
+        Test copy is equal but shares no mutable objects
+        """
+        parsed = parse_ingredient("1 lb 2 oz beef mince, browned")
+        copied = copy_parsed_ingredient(parsed)
+
+        assert copied == parsed
+        assert copied.amount is not parsed.amount
+        assert copied.name is not parsed.name
+        assert all(a is not b for a, b in zip(copied.amount, parsed.amount))
+
+
+class Test_PersistentCache:
+    def test_roundtrip(self, tmp_path):
+        """
+        Test results stored in the cache are returned unchanged
+        """
+        sentences = ["2 cups flour", "1 lb 2 oz beef mince", "salt"]
+        parsed = parse_multiple_ingredients(sentences)
+        with PersistentCache(tmp_path / "cache.sqlite") as cache:
+            cache.put_many(sentences, parsed)
+            assert cache.get_many(sentences) == parsed
+
+    def test_options_in_key(self, tmp_path):
+        """
+        Test results are not returned for different options
+        """
+        sentences = ["2 cups flour"]
+        with PersistentCache(tmp_path / "cache.sqlite") as cache:
+            cache.put_many(sentences, parse_multiple_ingredients(sentences))
+            assert cache.get_many(sentences, string_units=True) == [None]
+
+    def test_persists(self, tmp_path):
+        """
+        Test results are available after reopening the cache
+        """
+        sentences = ["2 cups flour"]
+        parsed = parse_multiple_ingredients(sentences)
+        with PersistentCache(tmp_path / "cache.sqlite") as cache:
+            cache.put_many(sentences, parsed)
+
+        with PersistentCache(tmp_path / "cache.sqlite") as cache:
+            assert cache.get_many(sentences) == parsed
+
+    def test_invalid_workers_all_cached(self, tmp_path):
+        """
+        Test ValueError is raised for invalid workers even if every sentence is in
+        the cache
+        """
+        sentences = ["2 cups flour", "salt"]
+        with PersistentCache(tmp_path / "cache.sqlite") as cache:
+            parse_multiple_ingredients(sentences, persistent_cache=cache)
+            with pytest.raises(ValueError):
+                parse_multiple_ingredients(sentences, workers=0, persistent_cache=cache)
+
+    def test_eviction(self, tmp_path):
+        """
+        Test least recently used results are removed when max_entries is exceeded
+        """
+        sentences = ["2 cups flour", "salt", "3 eggs"]
+        parsed = parse_multiple_ingredients(sentences)
+        with PersistentCache(tmp_path / "cache.sqlite", max_entries=2) as cache:
+            cache.put_many(sentences[:2], parsed[:2])
+            cache.get_many(sentences[:1])
+            cache.put_many(sentences[2:], parsed[2:])
+
+            assert len(cache) == 2
+            assert cache.get_many(sentences) == [parsed[0], None, parsed[2]]
+
+    def test_parse_multiple_ingredients(self, tmp_path):
+        """
+        Test parse_multiple_ingredients only parses sentences not in the cache
+        """
+        sentences = ["2 cups flour", "salt", "3 eggs"]
+        expected = parse_multiple_ingredients(sentences)
+        with PersistentCache(tmp_path / "cache.sqlite") as cache:
+            cache.put_many(sentences[:1], expected[:1])
+            parsed = parse_multiple_ingredients(sentences, persistent_cache=cache)
+
+            assert parsed == expected
+            assert len(cache) == 3
+
+
+class Test_normalised_cache:
+    def setup_method(self):
+        enable_cache(maxsize=8)
+
+    def teardown_method(self):
+        disable_cache()
+
+    def test_formatting_variants(self):
+        """
+        Test sentences with the same normalised form share a cached result, but
+        keep their own input sentence
+        """
+        first = parse_ingredient("1 cup flour")
+        second = parse_ingredient("one cup flour")
+
+        assert cache_info("normalised").hits == 1
+        assert second.sentence == "one cup flour"
+        second.sentence = first.sentence
+        assert first == second
+
+    def test_disabled(self):
+        """
+        Test the normalised cache can be disabled independently
+        """
+        enable_cache(maxsize=8, normalised_maxsize=0)
+        parse_ingredient("1 cup flour")
+        parse_ingredient("one cup flour")
+
+        assert cache_info("normalised").currsize == 0
+
+    def test_unknown_cache(self):
+        """
+        Test ValueError is raised for an unknown cache name
+        """
+        with pytest.raises(ValueError):
+            cache_info("unknown")
+
+
+class Test_label_cache:
+    def setup_method(self):
+        enable_cache(maxsize=8, normalised_maxsize=0)
+
+    def teardown_method(self):
+        disable_cache()
+
+    def test_same_shape(self):
+        """
+        Test sentences that only differ in their numbers share cached labels, but
+        are post-processed separately
+        """
+        first = parse_ingredient("2 cups flour")
+        second = parse_ingredient("3 cups flour")
+
+        assert cache_info("labels").hits == 1
+        assert first.amount[0].quantity == 2
+        assert second.amount[0].quantity == 3
+        assert first.name == second.name
+
+    def test_matches_uncached(self):
+        """
+        Test results using cached labels match results without the cache
+        """
+        sentences = ["1 onion, chopped", "2 onions, chopped", "salt", "salt"]
+        cached = [parse_ingredient(sentence) for sentence in sentences]
+        disable_cache()
+        uncached = [parse_ingredient(sentence) for sentence in sentences]
+
+        assert cached == uncached
+
+    def test_disabled(self):
+        """
+        Test the labels cache can be disabled independently
+        """
+        enable_cache(maxsize=8, labels_maxsize=0)
+        parse_ingredient("2 cups flour")
+        parse_ingredient("3 cups flour")
+
+        assert cache_info("labels").currsize == 0
@@ -0,0 +1,120 @@
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ingredient_parser import (
+    ModelCascade,
+    inspect_parser,
+    parse_ingredient,
+    parse_multiple_ingredients,
+)
+from ingredient_parser.en import parser
+from ingredient_parser.en.parser import label_sentence
+
+MODEL_DIR = Path(__file__).parents[1] / "ingredient_parser" / "en"
+
+SENTENCES = [
+    "2 cups flour",
+    "1 tbsp olive oil",
+    "salt",
+    "3 large eggs, beaten",
+    "1 1/2 tsp baking powder",
+]
+
+
+class Test_ModelCascade:
+    def test_never_escalate(self):
+        """
+        Test output matches the first model if the thresholds are always met
+        """
+        cascade = ModelCascade(min_score=0, mean_score=0)
+        parsed = parse_multiple_ingredients(SENTENCES, model=cascade)
+
+        assert parsed == parse_multiple_ingredients(
+            SENTENCES, model="model.6k.en.crfsuite"
+        )
+        assert cascade.info().sentences == len(SENTENCES)
+        assert cascade.info().escalated == 0
+
+    def test_always_escalate(self):
+        """
+        Test output matches the last model if the thresholds are never met
+        """
+        cascade = ModelCascade(min_score=1.1, mean_score=1.1)
+        parsed = parse_multiple_ingredients(SENTENCES, model=cascade)
+
+        assert parsed == parse_multiple_ingredients(
+            SENTENCES, model="model.15k.en.crfsuite"
+        )
+        assert cascade.info().escalated == len(SENTENCES)
+        assert cascade.info().labelled_by["model.15k.en.crfsuite"] == len(SENTENCES)
+
+    def test_inspect_parser(self):
+        """
+        Test inspect_parser labels an escalated sentence once with each model and
+        records it in the statistics
+        """
+        cascade = ModelCascade(min_score=1.1, mean_score=1.1)
+        calls = []
+
+        def counting_label_sentence(tagger, features, timer=None):
+            calls.append(tagger)
+            return label_sentence(tagger, features, timer)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(parser, "label_sentence", counting_label_sentence)
+            inspected = inspect_parser(SENTENCES[0], model=cascade)
+
+        assert len(calls) == len(cascade.models)
+        assert inspected.tagger is calls[-1]
+        assert inspected.PostProcessor.parsed == parse_ingredient(
+            SENTENCES[0], model="model.15k.en.crfsuite"
+        )
+        assert cascade.info().labelled_by["model.15k.en.crfsuite"] == 1
+
+    def test_reset_info(self):
+        """
+        Test statistics are reset
+        """
+        cascade = ModelCascade()
+        parse_ingredient("2 cups flour", model=cascade)
+        cascade.reset_info()
+
+        assert cascade.info().sentences == 0
+
+    def test_pickle(self):
+        """
+        Test a pickled cascade has the same models and thresholds
+        """
+        cascade = ModelCascade(min_score=0.2, mean_score=0.3)
+        unpickled = pickle.loads(pickle.dumps(cascade))
+
+        assert unpickled.model == cascade.model
+
+    def test_no_models(self):
+        """
+        Test ValueError is raised if no models are given
+        """
+        with pytest.raises(ValueError):
+            ModelCascade(models=[])
+
+    def test_duplicate_models(self):
+        """
+        Test ValueError is raised if the same model is given more than once
+        """
+        with pytest.raises(ValueError):
+            ModelCascade(models=["model.6k.en.crfsuite", "model.6k.en.crfsuite"])
+
+    def test_duplicate_model_paths(self, tmp_path, monkeypatch):
+        """
+        Test ValueError is raised if the same model file is given by a relative and
+        an absolute path
+        """
+        model = tmp_path / "model.crfsuite"
+        shutil.copy(MODEL_DIR / "model.6k.en.crfsuite", model)
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(ValueError):
+            ModelCascade(models=["model.crfsuite", str(model)])
@@ -0,0 +1,40 @@
+import json
+import subprocess
+import sys
+
+CHECK_LAZY = """
+import json, sys
+import ingredient_parser
+from ingredient_parser.en import _regex, _utils
+
+print(json.dumps({
+    "nltk": "nltk" in sys.modules,
+    "unit_registry": "UREG" in _utils._LAZY,
+    "regex": any(name in vars(_regex) for name in _regex._PATTERNS),
+}))
+"""
+
+
+def run(code: str) -> str:
+    """Run code in a new interpreter and return its output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+class Test_import:
+    def test_lazy(self):
+        """
+        Test nltk is not imported, and the unit registry and regular expressions are
+        not created, when ingredient_parser is imported
+        """
+        loaded = json.loads(run(CHECK_LAZY))
+        assert loaded == {"nltk": False, "unit_registry": False, "regex": False}
+
+    def test_no_output(self):
+        """
+        Test importing ingredient_parser doesn't print anything (e.g. from
+        downloading NLTK resources)
+        """
+        assert run("import ingredient_parser") == ""
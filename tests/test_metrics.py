@@ -0,0 +1,110 @@
+import pytest
+
+from ingredient_parser import (
+    IngredientParser,
+    ModelCascade,
+    disable_metrics,
+    enable_metrics,
+    parse_ingredient,
+    render_prometheus,
+    reset_metrics,
+)
+from ingredient_parser._metrics import Histogram
+
+
+@pytest.fixture
+def metrics():
+    """Enable metrics for a test, then disable and reset them."""
+    reset_metrics()
+    enable_metrics()
+    yield
+    disable_metrics()
+    reset_metrics()
+
+
+def samples(text: str) -> dict[str, float]:
+    """Return the value of each sample in Prometheus text exposition format."""
+    values = {}
+    for line in text.splitlines():
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            values[name] = float(value)
+    return values
+
+
+class Test_Histogram:
+    def test_render(self):
+        """
+        Test bucket counts are cumulative and include +Inf
+        """
+        histogram = Histogram([1, 5])
+        for value in [0.5, 1, 3, 10]:
+            histogram.observe(value)
+
+        assert histogram.render("h") == [
+            'h_bucket{le="1"} 2',
+            'h_bucket{le="5"} 3',
+            'h_bucket{le="+Inf"} 4',
+            "h_sum 14.5",
+            "h_count 4",
+        ]
+
+
+class Test_render_prometheus:
+    def test_sentences(self, metrics):
+        """
+        Test parsed sentences, token counts and stage timings are recorded
+        """
+        parse_ingredient("2 cups flour")
+        parse_ingredient("1 tsp salt")
+        values = samples(render_prometheus())
+
+        assert values["ingredient_parser_sentences_total"] == 2
+        assert values["ingredient_parser_sentence_tokens_count"] == 2
+        assert values["ingredient_parser_sentence_tokens_sum"] == 6
+        assert values['ingredient_parser_stage_seconds_count{stage="tag"}'] == 2
+        assert (
+            'ingredient_parser_cache_hit_ratio{parser="default",cache="result"}'
+            in values
+        )
+
+    def test_cascade(self, metrics):
+        """
+        Test cascade escalations are recorded
+        """
+        parse_ingredient("2 cups flour", model=ModelCascade(min_score=1.1))
+        values = samples(render_prometheus())
+
+        assert values["ingredient_parser_cascade_sentences_total"] == 1
+        assert values["ingredient_parser_cascade_escalations_total"] == 1
+
+    def test_disabled(self):
+        """
+        Test nothing is recorded when metrics are not enabled
+        """
+        reset_metrics()
+        parse_ingredient("2 cups flour")
+        values = samples(render_prometheus())
+
+        assert values["ingredient_parser_sentences_total"] == 0
+
+    def test_parser_caches(self):
+        """
+        Test the caches owned by an IngredientParser are included until it is closed
+        """
+        with IngredientParser(cache_size=8, name="tenant") as parser:
+            parser.parse("2 cups flour")
+            parser.parse("2 cups flour")
+            values = samples(render_prometheus())
+
+        hits = 'ingredient_parser_cache_hits_total{parser="tenant",cache="result"}'
+        assert values[hits] == 1
+        assert hits not in samples(render_prometheus())
+
+    def test_duplicate_parser_name(self):
+        """
+        Test ValueError is raised if the name of an open parser is reused
+        """
+        with IngredientParser(name="tenant"):
+            with pytest.raises(ValueError):
+                IngredientParser(name="tenant")
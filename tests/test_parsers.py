@@ -0,0 +1,202 @@
+import asyncio
+
+import pytest
+
+from ingredient_parser import (
+    configure_async_batching,
+    iparse_ingredients,
+    parse_ingredient,
+    parse_ingredient_async,
+    parse_many_async,
+    parse_multiple_ingredients,
+    warmup,
+)
+from ingredient_parser.en.parser import SHIPPED_MODELS
+
+SENTENCES = [
+    "2 cups flour",
+    "1 tbsp olive oil",
+    "salt",
+    "3 large eggs, beaten",
+    "1 1/2 tsp baking powder",
+]
+
+
+class Test_parse_multiple_ingredients:
+    def test_sequential(self):
+        """
+        Test output matches parsing each sentence individually
+        """
+        expected = [parse_ingredient(sentence) for sentence in SENTENCES]
+        assert parse_multiple_ingredients(SENTENCES) == expected
+
+    def test_workers(self):
+        """
+        Test output from worker processes is in the same order as the input
+        """
+        expected = parse_multiple_ingredients(SENTENCES)
+        assert parse_multiple_ingredients(SENTENCES, workers=2, chunksize=2) == expected
+
+    def test_invalid_workers(self):
+        """
+        Test ValueError is raised if workers is less than 1
+        """
+        with pytest.raises(ValueError):
+            parse_multiple_ingredients(SENTENCES, workers=0)
+
+    @pytest.mark.parametrize("sentences", [[], ["salt"], ["salt", "salt"]])
+    def test_invalid_options_nothing_to_parse(self, sentences):
+        """
+        Test ValueError is raised for invalid options even if there are fewer than
+        two sentences to parse
+        """
+        with pytest.raises(ValueError):
+            parse_multiple_ingredients(sentences, workers=0)
+        with pytest.raises(ValueError):
+            parse_multiple_ingredients(sentences, chunksize=0)
+        with pytest.raises(ValueError):
+            parse_multiple_ingredients(sentences, lang="fr")
+
+
+class Test_iparse_ingredients:
+    def test_generator(self):
+        """
+        Test sentences are parsed from a generator in order
+        """
+        expected = parse_multiple_ingredients(SENTENCES)
+        parsed = iparse_ingredients(sentence for sentence in SENTENCES)
+        assert list(parsed) == expected
+
+    def test_lazy(self):
+        """
+        Test sentences are only consumed from the input as results are requested
+        """
+        consumed = []
+
+        def sentences():
+            for sentence in SENTENCES:
+                consumed.append(sentence)
+                yield sentence
+
+        parsed = iparse_ingredients(sentences())
+        next(parsed)
+        assert consumed == SENTENCES[:1]
+
+    def test_workers(self):
+        """
+        Test output from worker processes is in the same order as the input
+        """
+        expected = parse_multiple_ingredients(SENTENCES * 3)
+        parsed = iparse_ingredients(iter(SENTENCES * 3), workers=2, chunksize=2)
+        assert list(parsed) == expected
+
+    def test_invalid_chunksize(self):
+        """
+        Test ValueError is raised immediately if chunksize is less than 1
+        """
+        with pytest.raises(ValueError):
+            iparse_ingredients(SENTENCES, chunksize=0)
+
+
+class Test_parse_async:
+    def test_parse_ingredient_async(self):
+        """
+        Test output matches parse_ingredient
+        """
+        parsed = asyncio.run(parse_ingredient_async(SENTENCES[0]))
+        assert parsed == parse_ingredient(SENTENCES[0])
+
+    def test_parse_many_async(self):
+        """
+        Test output is in the same order as the input
+        """
+        parsed = asyncio.run(parse_many_async(SENTENCES, string_units=True))
+        assert parsed == parse_multiple_ingredients(SENTENCES, string_units=True)
+
+    def test_unsupported_language(self):
+        """
+        Test ValueError is raised for an unsupported language
+        """
+        with pytest.raises(ValueError):
+            asyncio.run(parse_ingredient_async(SENTENCES[0], lang="fr"))
+
+    def test_configure_from_event_loop(self):
+        """
+        Test configure_async_batching can be called from a running event loop
+        between parses
+        """
+
+        async def run():
+            first = await parse_ingredient_async(SENTENCES[0])
+            configure_async_batching(max_batch_size=8)
+            second = await parse_ingredient_async(SENTENCES[0])
+            configure_async_batching()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second == parse_ingredient(SENTENCES[0])
+
+
+class Test_parse_multiple_ingredients_duplicates:
+    def test_duplicates_copied(self):
+        """
+        Test duplicate sentences get equal but distinct objects by default
+        """
+        parsed = parse_multiple_ingredients(["salt", "2 eggs", "salt"])
+
+        assert parsed[0] == parsed[2]
+        assert parsed[0] is not parsed[2]
+        assert parsed[1] == parse_ingredient("2 eggs")
+
+    def test_duplicates_shared(self):
+        """
+        Test duplicate sentences get the same object if share_duplicates=True
+        """
+        parsed = parse_multiple_ingredients(
+            ["salt", "2 eggs", "salt"], share_duplicates=True
+        )
+
+        assert parsed[0] is parsed[2]
+
+
+class Test_warmup:
+    def test_timings(self):
+        """
+        Test load time is returned for each component
+        """
+        timings = warmup()
+
+        assert {"model", "pos_tagger", "unit_registry", "parse"} <= set(timings)
+        assert all(duration >= 0 for duration in timings.values())
+
+    def test_unsupported_language(self):
+        """
+        Test ValueError is raised for an unsupported language
+        """
+        with pytest.raises(ValueError):
+            warmup(lang="fr")
+
+
+class Test_model:
+    def test_shipped_models(self):
+        """
+        Test sentences can be parsed with each shipped model
+        """
+        for model in SHIPPED_MODELS:
+            parsed = parse_ingredient("2 cups flour", model=model)
+            assert parsed.name.text == "flour"
+
+    def test_parse_multiple_ingredients(self):
+        """
+        Test the model is used for every sentence
+        """
+        model = "model.15k.en.crfsuite"
+        expected = [parse_ingredient(sentence, model=model) for sentence in SENTENCES]
+        assert parse_multiple_ingredients(SENTENCES, model=model) == expected
+
+    def test_unrecognised(self):
+        """
+        Test ValueError is raised immediately for a model that doesn't exist
+        """
+        with pytest.raises(ValueError):
+            iparse_ingredients(SENTENCES, model="model.missing.en.crfsuite")
@@ -0,0 +1,111 @@
+import gc
+import weakref
+
+import pint
+import pytest
+
+from ingredient_parser import IngredientParser, ModelCascade, parse_ingredient
+
+SENTENCES = [
+    "2 cups flour",
+    "1 tbsp olive oil",
+    "salt",
+    "3 large eggs, beaten",
+    "1 1/2 tsp baking powder",
+]
+
+
+class Test_IngredientParser:
+    def test_parse(self):
+        """
+        Test output matches parse_ingredient
+        """
+        with IngredientParser() as parser:
+            assert parser.parse(SENTENCES[0]) == parse_ingredient(SENTENCES[0])
+
+    def test_parse_many(self):
+        """
+        Test output is in the same order as the input, and duplicates are copied
+        """
+        with IngredientParser() as parser:
+            parsed = parser.parse_many(SENTENCES + SENTENCES[:1])
+
+        assert parsed[:-1] == [parse_ingredient(sentence) for sentence in SENTENCES]
+        assert parsed[0] == parsed[-1]
+        assert parsed[0] is not parsed[-1]
+
+    def test_model(self):
+        """
+        Test the parser's model is used
+        """
+        model = "model.15k.en.crfsuite"
+        with IngredientParser(model=model, pool_size=1) as parser:
+            assert parser.parse(SENTENCES[1]) == parse_ingredient(
+                SENTENCES[1], model=model
+            )
+
+    def test_parse_many_model(self):
+        """
+        Test the model passed to parse_many is used instead of the parser's model
+        """
+        cascade = ModelCascade()
+        with IngredientParser() as parser:
+            parsed = parser.parse_many(SENTENCES, model=cascade)
+
+        assert cascade.info().sentences == len(SENTENCES)
+        assert parsed == [parse_ingredient(s, model=cascade) for s in SENTENCES]
+
+    def test_own_caches(self):
+        """
+        Test each parser has its own caches
+        """
+        with IngredientParser(cache_size=8) as first, IngredientParser() as second:
+            first.parse(SENTENCES[0])
+            first.parse(SENTENCES[0])
+            second.parse(SENTENCES[0])
+
+            assert first.cache_info().hits == 1
+            assert second.cache_info().currsize == 0
+
+    def test_unit_registry(self):
+        """
+        Test units are created from the parser's unit registry
+        """
+        ureg = pint.UnitRegistry()
+        with IngredientParser(unit_registry=ureg) as parser:
+            parsed = parser.parse(SENTENCES[0])
+
+        assert parsed.amount[0].unit == ureg.Unit("cup")
+
+    def test_unit_registry_released(self):
+        """
+        Test the parser's unit registry can be garbage collected after close()
+        """
+        ureg = pint.UnitRegistry()
+        ureg_ref = weakref.ref(ureg)
+        with IngredientParser(unit_registry=ureg, cache_size=8) as parser:
+            parser.parse(SENTENCES[0])
+
+        del parser, ureg
+        gc.collect()
+
+        assert ureg_ref() is None
+
+    def test_closed(self):
+        """
+        Test RuntimeError is raised if a closed parser is used
+        """
+        parser = IngredientParser(cache_size=8)
+        parser.parse(SENTENCES[0])
+        parser.close()
+
+        assert parser.cache_info().currsize == 0
+        with pytest.raises(RuntimeError):
+            parser.parse(SENTENCES[0])
+
+    def test_unsupported_language(self):
+        """
+        Test ValueError is raised for an unsupported language
+        """
+        with pytest.raises(ValueError):
+            IngredientParser(lang="fr")
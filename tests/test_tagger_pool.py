@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import as_file, files
+
+import pytest
+
+from ingredient_parser import parse_ingredient
+from ingredient_parser.en.parser import TAGGER_POOL, TaggerPool, get_tagger_pool
+
+SENTENCES = [
+    "2 cups flour",
+    "1 tbsp olive oil",
+    "salt",
+    "3 large eggs, beaten",
+    "1 1/2 tsp baking powder",
+    "1/4 teaspoon toasted anise seed",
+] * 10
+
+
+class Test_TaggerPool:
+    def test_reuse(self):
+        """
+        Test a tagger returned to the pool is reused
+        """
+        pool = TaggerPool("model.6k.en.crfsuite", size=2)
+        with pool.checkout() as first:
+            pass
+        with pool.checkout() as second:
+            pass
+
+        assert first is second
+
+    def test_distinct_taggers(self):
+        """
+        Test concurrently checked out taggers are different objects
+        """
+        pool = TaggerPool("model.6k.en.crfsuite", size=2)
+        with pool.checkout() as first, pool.checkout() as second:
+            assert first is not second
+
+    def test_threaded_parse(self):
+        """
+        Test parsing sentences from multiple threads gives the same result as
+        parsing them sequentially
+        """
+        expected = [parse_ingredient(sentence) for sentence in SENTENCES]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parsed = list(executor.map(parse_ingredient, SENTENCES))
+
+        assert parsed == expected
+
+
+class Test_get_tagger_pool:
+    def test_default(self):
+        """
+        Test the default model pool is returned if model is None
+        """
+        assert get_tagger_pool() is TAGGER_POOL
+
+    def test_registry(self):
+        """
+        Test the same pool is returned each time for a model
+        """
+        pool = get_tagger_pool("model.15k.en.crfsuite")
+        assert get_tagger_pool("model.15k.en.crfsuite") is pool
+        assert pool is not TAGGER_POOL
+
+    def test_path(self):
+        """
+        Test a model can be loaded from a path
+        """
+        resource = files("ingredient_parser.en") / "model.15k.en.crfsuite"
+        with as_file(resource) as p:
+            pool = get_tagger_pool(str(p))
+            with pool.checkout() as tagger:
+                assert tagger.labels()
+
+    def test_unrecognised(self):
+        """
+        Test ValueError is raised for a model that doesn't exist
+        """
+        with pytest.raises(ValueError):
+            get_tagger_pool("model.missing.en.crfsuite")
@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from ingredient_parser import IngredientParser, inspect_parser, parse_ingredient
+from ingredient_parser.en._utils import convert_to_pint_unit, stem
+
+SENTENCES = [
+    "2 cups flour",
+    "1 tbsp olive oil",
+    "salt",
+    "3 large eggs, beaten",
+    "1 1/2 tsp baking powder",
+    "1 x 400g can chopped tomatoes",
+    "2 fl oz double cream",
+    "about 3 pints chicken stock",
+] * 25
+
+
+class Test_threads:
+    def test_shared_parser(self):
+        """
+        Test an IngredientParser with the result, normalised and labels caches
+        enabled gives the same output when shared between threads as parsing the
+        sentences in one thread
+        """
+        sentences = SENTENCES[:8]
+        # Each sentence again, then with surrounding whitespace, then with string units,
+        # to hit the result, normalised and labels caches respectively.
+        variants = (
+            [(sentence, False) for sentence in sentences]
+            + [(f" {sentence} ", False) for sentence in sentences]
+            + [(sentence, True) for sentence in sentences]
+        ) * 10
+
+        def parse(args):
+            sentence, string_units = args
+            return parser.parse(sentence, string_units=string_units)
+
+        with IngredientParser(cache_size=64) as parser:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                parsed = list(executor.map(parser.parse, sentences * 10))
+                parsed_variants = list(executor.map(parse, variants))
+
+            infos = {name: parser.cache_info(name) for name in parser.caches}
+
+        assert parsed == [parse_ingredient(sentence) for sentence in sentences * 10]
+        assert parsed_variants == [
+            parse_ingredient(sentence, string_units=string_units)
+            for sentence, string_units in variants
+        ]
+        for info in infos.values():
+            assert info.hits > 0
+            assert info.currsize <= info.maxsize
+
+    def test_shared_postprocessor(self):
+        """
+        Test a PostProcessor shared between threads only calculates its output once
+        """
+        postprocessor = inspect_parser("2 tbsp butter, melted").PostProcessor
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parsed = list(executor.map(lambda _: postprocessor.parsed, range(50)))
+
+        assert all(p is parsed[0] for p in parsed)
+        assert len(postprocessor.consumed) == len(set(postprocessor.consumed))
+
+    def test_stem(self):
+        """
+        Test stem gives the same output in multiple threads
+        """
+        words = ["chopped", "tomatoes", "onions", "sliced", "diced"] * 20
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            stems = list(executor.map(stem, words))
+
+        assert stems == [stem(word) for word in words]
+
+    def test_convert_to_pint_unit(self):
+        """
+        Test convert_to_pint_unit gives the same output in multiple threads
+        """
+        units = ["cup", "g", "fl oz", "pint", "can", "tbsp"] * 20
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            converted = list(executor.map(convert_to_pint_unit, units))
+
+        assert converted == [convert_to_pint_unit(unit) for unit in units]
@@ -0,0 +1,178 @@
+import logging
+
+import pytest
+
+from ingredient_parser import (
+    add_timing_hook,
+    disable_slow_parse_log,
+    enable_slow_parse_log,
+    inspect_parser,
+    parse_ingredient,
+    remove_timing_hook,
+)
+from ingredient_parser._timing import NULL_TIMER, StageTimer, new_timer
+
+STAGES = [
+    "normalise",
+    "tokenise",
+    "pos_tag",
+    "features",
+    "tag",
+    "marginals",
+    "postprocess",
+]
+
+
+class Test_StageTimer:
+    def test_accumulate(self):
+        """
+        Test the time for a stage entered twice is accumulated
+        """
+        timer = StageTimer()
+        with timer.stage("a"):
+            pass
+        first = timer.timings["a"]
+        with timer.stage("a"):
+            pass
+
+        assert timer.timings["a"] >= first
+        assert list(timer.timings) == ["a"]
+
+    def test_new_timer_without_hooks(self):
+        """
+        Test timing is disabled when there are no hooks
+        """
+        assert new_timer() is NULL_TIMER
+
+
+class Test_inspect_parser_timings:
+    def test_stages(self):
+        """
+        Test ParserDebugInfo includes the time for every stage
+        """
+        timings = inspect_parser("2 cups flour, sifted").timings
+
+        assert [stage for stage in timings if "." not in stage] == STAGES
+        assert "normalise.replace_string_numbers" in timings
+        assert "postprocess.fallback_pattern" in timings
+        assert all(t >= 0 for t in timings.values())
+
+
+class Test_timing_hook:
+    def test_hook_called(self):
+        """
+        Test hook is called with the sentence and timings, and is not called after
+        it is removed
+        """
+        calls = []
+
+        def hook(sentence, timings):
+            calls.append((sentence, timings))
+
+        add_timing_hook(hook)
+        try:
+            parse_ingredient("1 tsp salt")
+        finally:
+            remove_timing_hook(hook)
+        parse_ingredient("1 tsp salt")
+
+        assert len(calls) == 1
+        sentence, timings = calls[0]
+        assert sentence == "1 tsp salt"
+        assert [stage for stage in timings if "." not in stage] == STAGES
+
+    def test_normalise_single_stage(self):
+        """
+        Test normalisation is timed as a single stage by default
+        """
+        calls = []
+
+        def hook(sentence, timings):
+            calls.append(timings)
+
+        add_timing_hook(hook)
+        try:
+            parse_ingredient("one 400g can tomatoes")
+        finally:
+            remove_timing_hook(hook)
+
+        assert "normalise" in calls[0]
+        assert not any(stage.startswith("normalise.") for stage in calls[0])
+
+    def test_per_step(self):
+        """
+        Test each normalisation step is timed if the hook was added with
+        per_step=True
+        """
+        calls = []
+
+        def hook(sentence, timings):
+            calls.append(timings)
+
+        add_timing_hook(hook, per_step=True)
+        try:
+            parse_ingredient("one 400g can tomatoes")
+        finally:
+            remove_timing_hook(hook)
+
+        assert "normalise.replace_string_numbers" in calls[0]
+        assert new_timer() is NULL_TIMER
+
+    def test_remove_unknown_hook(self):
+        """
+        Test ValueError is raised when removing a hook that was not added
+        """
+        with pytest.raises(ValueError):
+            remove_timing_hook(print)
+
+
+class Test_slow_parse_log:
+    def test_logged(self, caplog):
+        """
+        Test a sentence slower than the threshold is logged with its timings and the
+        normalisation steps that changed it
+        """
+        enable_slow_parse_log(threshold=0)
+        try:
+            with caplog.at_level(logging.WARNING, "ingredient_parser.slow_parse"):
+                parse_ingredient("one 400g can tomatoes")
+        finally:
+            disable_slow_parse_log()
+
+        assert len(caplog.records) == 1
+        record = caplog.records[0].slow_parse
+        assert record["sentence"] == "one 400g can tomatoes"
+        assert record["token_count"] == 5
+        assert "tag" in record["timings"]
+        assert [step for step, _ in record["normalisation"]] == [
+            "_replace_string_numbers",
+            "_split_quantity_and_units",
+        ]
+        assert record["normalisation"][-1][1] == "1 400 g can tomatoes"
+
+    def test_normalised_in_single_pass(self):
+        """
+        Test the slow parse log doesn't make every sentence be normalised one step at
+        a time
+        """
+        enable_slow_parse_log(threshold=0)
+        try:
+            timer = new_timer()
+        finally:
+            disable_slow_parse_log()
+
+        assert timer.enabled
+        assert not timer.per_step
+
+    def test_not_logged(self, caplog):
+        """
+        Test a sentence faster than the threshold is not logged
+        """
+        enable_slow_parse_log(threshold=60)
+        try:
+            with caplog.at_level(logging.WARNING, "ingredient_parser.slow_parse"):
+                parse_ingredient("2 cups flour")
+        finally:
+            disable_slow_parse_log()
+
+        assert caplog.records == []
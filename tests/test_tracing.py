@@ -0,0 +1,71 @@
+import pytest
+
+from ingredient_parser import inspect_parser, parse_ingredient, set_tracer
+from ingredient_parser._tracing import NO_OP_TRACER, get_tracer
+
+
+class RecordingTracer:
+    """Tracer that records the order spans are started and ended."""
+
+    def __init__(self):
+        self.events = []
+
+    def start_span(self, name, attributes):
+        self.events.append(("start", name))
+        return name
+
+    def end_span(self, span, exception):
+        self.events.append(("end", span))
+
+
+@pytest.fixture
+def tracer():
+    """Set a RecordingTracer for a test, then restore the default tracer."""
+    recording = RecordingTracer()
+    set_tracer(recording)
+    yield recording
+    set_tracer(None)
+
+
+class Test_tracer:
+    def test_spans(self, tracer):
+        """
+        Test a span is started and ended around each stage
+        """
+        parse_ingredient("2 cups flour")
+
+        assert tracer.events == [
+            ("start", "ingredient_parser.preprocess"),
+            ("end", "ingredient_parser.preprocess"),
+            ("start", "ingredient_parser.pos_tag"),
+            ("end", "ingredient_parser.pos_tag"),
+            ("start", "ingredient_parser.sentence_features"),
+            ("end", "ingredient_parser.sentence_features"),
+            ("start", "ingredient_parser.crf_tag"),
+            ("end", "ingredient_parser.crf_tag"),
+            ("start", "ingredient_parser.postprocess"),
+            ("end", "ingredient_parser.postprocess"),
+        ]
+
+    def test_inspect_parser(self, tracer):
+        """
+        Test part of speech tagging is traced inside preprocessing when it is not
+        deferred
+        """
+        inspect_parser("2 cups flour")
+
+        assert tracer.events[:4] == [
+            ("start", "ingredient_parser.preprocess"),
+            ("start", "ingredient_parser.pos_tag"),
+            ("end", "ingredient_parser.pos_tag"),
+            ("end", "ingredient_parser.preprocess"),
+        ]
+
+    def test_reset(self):
+        """
+        Test set_tracer(None) restores the default tracer
+        """
+        set_tracer(RecordingTracer())
+        set_tracer(None)
+
+        assert get_tracer() is NO_OP_TRACER
@@ -28,6 +28,27 @@ class TestUtils_pluralise_units:
             == "3 cups (750 milliliters) milk"
         )
 
+    def test_whole_words(self):
+        """
+        Units that are part of another word are not pluralised
+        """
+        assert pluralise_units("cupcake with 2cup icing") == "cupcake with 2cup icing"
+
+    def test_plural_unchanged(self):
+        """
+        Units that are already plural are not changed
+        """
+        assert pluralise_units("2 cups and 3 leaves") == "2 cups and 3 leaves"
+
+    def test_multiple(self):
+        """
+        Each singular unit in the sentence is pluralised
+        """
+        assert (
+            pluralise_units("1 Cup flour, 1 pinch salt, 1 cup sugar")
+            == "1 Cups flour, 1 pinches salt, 1 cups sugar"
+        )
+
 
 class Test_convert_to_pint_unit:
     def test_empty_string(self):